@@ -0,0 +1,83 @@
+"""
+Synthetic Common Cartridge courses builder for benchmarks.
+"""
+
+import zipfile
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+MANIFEST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<manifest identifier="benchmark" xmlns="http://www.imsglobal.org/xsd/imsccv1p3/imscp_v1p1"
+          xmlns:lomimscc="http://ltsc.ieee.org/xsd/imsccv1p3/LOM/manifest">
+    <metadata>
+        <schema>IMS Common Cartridge</schema>
+        <schemaversion>1.3.0</schemaversion>
+    </metadata>
+    <organizations>
+        <organization identifier="org_1" structure="rooted-hierarchy">
+            <item identifier="LearningModules">
+                <item identifier="sequence">
+                    <title>Sequence</title>
+{items}
+                </item>
+            </item>
+        </organization>
+    </organizations>
+    <resources>
+{resources}
+    </resources>
+</manifest>
+"""
+ITEM_TEMPLATE = """                    <item identifier="item_{identifier}" identifierref="{identifier}">
+                        <title>{identifier}</title>
+                    </item>"""
+RESOURCE_TEMPLATE = """        <resource identifier="{identifier}" type="{type}" href="{href}">
+            <file href="{href}"/>
+        </resource>"""
+
+# The smallest valid PNG image.
+PNG_IMAGE = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c4"
+    "890000000d49444154789c6360000002000100ffff03000006000557bfabd400"
+    "00000049454e44ae426082"
+)
+
+
+class SyntheticResource(NamedTuple):
+    """
+    Describe a Common Cartridge resource of a synthetic course.
+    """
+
+    identifier: str
+    type: str
+    href: str
+    content: bytes
+
+
+def build_cartridge(cartridge_path: Path, resources: Iterable[SyntheticResource]) -> Path:
+    """
+    Build ``.imscc`` file with every resource placed into a separate unit.
+    """
+    resources = list(resources)
+    manifest = MANIFEST_TEMPLATE.format(
+        items="\n".join(ITEM_TEMPLATE.format(identifier=resource.identifier) for resource in resources),
+        resources="\n".join(
+            RESOURCE_TEMPLATE.format(identifier=resource.identifier, type=resource.type, href=resource.href)
+            for resource in resources
+        ),
+    )
+
+    with zipfile.ZipFile(cartridge_path, "w", compression=zipfile.ZIP_DEFLATED) as cartridge:
+        cartridge.writestr("imsmanifest.xml", manifest)
+        for resource in resources:
+            cartridge.writestr(resource.href, resource.content)
+
+    return cartridge_path
+
+
+def image_resources(count: int) -> Iterable[SyntheticResource]:
+    """
+    Provide image webcontent resources from "web_resources" directory.
+    """
+    for index in range(count):
+        yield SyntheticResource(f"image_{index}", "webcontent", f"web_resources/images/image_{index}.png", PNG_IMAGE)
@@ -0,0 +1,63 @@
+"""
+Benchmark the conversion of an image-heavy course.
+
+Measure the whole single cartridge conversion and the image snippet
+rendering compared to reading the template file for every resource.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+from cc2olx.content_processors.utils import render_template
+from cc2olx.main import convert_one_file
+from cc2olx.settings import TEMPLATES_DIR
+
+from benchmarks.cartridge_builder import build_cartridge, image_resources
+
+
+def render_from_file() -> str:
+    """
+    Render the image snippet the way it was done before the templates registry.
+    """
+    with open(TEMPLATES_DIR / "image_webcontent.html", encoding="utf-8") as template_file:
+        return template_file.read().format(olx_static_path="/static/image.png", static_file_path="image.png")
+
+
+def render_from_registry() -> str:
+    """
+    Render the image snippet with the templates registry.
+    """
+    return render_template("image_webcontent.html", olx_static_path="/static/image.png", static_file_path="image.png")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resources", type=int, default=2000, help="Number of image resources in the course.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cartridge_path = build_cartridge(Path(tmp_dir) / "images.imscc", image_resources(args.resources))
+        started_at = time.perf_counter()
+        convert_one_file(cartridge_path, Path(tmp_dir) / "output")
+        conversion_seconds = time.perf_counter() - started_at
+
+    render_iterations = 10000
+    results = {
+        "resources": args.resources,
+        "conversion_seconds": round(conversion_seconds, 3),
+        "render_from_file_us": round(
+            timeit.timeit(render_from_file, number=render_iterations) * 1e6 / render_iterations, 2
+        ),
+        "render_from_registry_us": round(
+            timeit.timeit(render_from_registry, number=render_iterations) * 1e6 / render_iterations, 2
+        ),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
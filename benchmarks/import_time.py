@@ -0,0 +1,69 @@
+"""
+Benchmark the import time of the converter command line entry point.
+
+Run ``python -X importtime`` in fresh interpreters, report the median
+cumulative import time of the module and the slowest imported modules.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+IMPORT_TIME_LINE_REGEX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_import(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Import the module in a fresh interpreter and provide (module, self us, cumulative us) of every import.
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    imports = []
+    for line in completed_process.stderr.splitlines():
+        match = IMPORT_TIME_LINE_REGEX.match(line)
+        if match:
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="cc2olx.main", help="Module to import.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of interpreters to measure.")
+    parser.add_argument("--top", type=int, default=10, help="Number of the slowest modules to report.")
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.runs)]
+    cumulative_times = [
+        next(cumulative_us for module, _, cumulative_us in imports if module == args.module) for imports in runs
+    ]
+    self_times: Dict[str, int] = {}
+    for module, self_us, _ in runs[-1]:
+        self_times[module] = self_times.get(module, 0) + self_us
+
+    results = {
+        "module": args.module,
+        "runs": args.runs,
+        "median_import_ms": round(statistics.median(cumulative_times) / 1000, 1),
+        "imported_modules": len(runs[-1]),
+        "django_imported": any(module == "django" for module, _, _ in runs[-1]),
+        "slowest_modules_ms": {
+            module: round(self_us / 1000, 1)
+            for module, self_us in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[: args.top]
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
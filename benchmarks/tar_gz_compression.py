@@ -0,0 +1,88 @@
+"""
+Benchmark the OLX archive compression.
+
+Pack a synthetic media-heavy static files directory with the previous
+single-threaded ``tarfile`` gzip compression and with ``add_in_tar_gz``
+using every codec, different gzip compression levels and numbers of
+compression threads.
+"""
+
+import argparse
+import json
+import os
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from cc2olx.enums import ArchiveCodec
+from cc2olx.filesystem import add_in_tar_gz
+
+TEXT_CHUNK = b"<p>Common Cartridge course content converted to the Open edX OLX.</p>\n"
+
+
+def build_static_files(directory: Path, files: int, file_size: int) -> Path:
+    """
+    Write the files of half random (media-like) and half repetitive (text-like) content.
+    """
+    directory.mkdir()
+    for index in range(files):
+        content = os.urandom(file_size // 2) + TEXT_CHUNK * (file_size // 2 // len(TEXT_CHUNK))
+        (directory / f"file_{index}.bin").write_bytes(content)
+    return directory
+
+
+def measure(pack: Callable[[Path], None], archive_path: Path) -> Dict[str, float]:
+    """
+    Provide the packing time and the archive size.
+    """
+    started_at = time.perf_counter()
+    pack(archive_path)
+    return {
+        "seconds": round(time.perf_counter() - started_at, 3),
+        "size_mb": round(archive_path.stat().st_size / 1024 / 1024, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=50, help="Number of static files.")
+    parser.add_argument("--file-size-mb", type=float, default=4, help="Size of every static file in MB.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of compression threads.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        static_dir = build_static_files(tmp_path / "static", args.files, int(args.file_size_mb * 1024 * 1024))
+        inputs = [(str(static_dir), "static")]
+
+        def pack_with_tarfile(archive_path):
+            with tarfile.open(archive_path, "w:gz") as archive:
+                archive.add(static_dir, "static")
+
+        results = {
+            "files": args.files,
+            "file_size_mb": args.file_size_mb,
+            "workers": args.workers,
+            "tarfile_level_9": measure(pack_with_tarfile, tmp_path / "tarfile.tar.gz"),
+        }
+        for level in (1, 6, 9):
+            results[f"gzip_level_{level}"] = measure(
+                lambda archive_path: add_in_tar_gz(archive_path, inputs, ArchiveCodec.GZIP, level),
+                tmp_path / f"level_{level}.tar.gz",
+            )
+            results[f"gzip_level_{level}_parallel"] = measure(
+                lambda archive_path: add_in_tar_gz(archive_path, inputs, ArchiveCodec.GZIP, level, args.workers),
+                tmp_path / f"level_{level}_parallel.tar.gz",
+            )
+        for codec in (ArchiveCodec.XZ, ArchiveCodec.BZ2, ArchiveCodec.STORE):
+            results[codec] = measure(
+                lambda archive_path: add_in_tar_gz(archive_path, inputs, codec), tmp_path / f"{codec}.tar"
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Library API to convert Common Cartridge courses held in memory.
+
+Example::
+
+    from cc2olx.api import convert
+
+    with open("course.tar.gz", "wb") as destination:
+        convert(request_body, destination)
+"""
+
+import io
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Union
+
+from cc2olx import filesystem, olx
+from cc2olx.compression import open_tar_archive
+from cc2olx.enums import ArchiveCodec
+from cc2olx.main import get_static_file_list
+from cc2olx.models import DEFAULT_CARTRIDGE_NAME, Cartridge
+
+
+def convert(
+    source: Union[bytes, bytearray, memoryview, BinaryIO],
+    destination: BinaryIO,
+    name: str = DEFAULT_CARTRIDGE_NAME,
+    link_file: Optional[str] = None,
+    passport_file: Optional[str] = None,
+    relative_links_source: Optional[str] = None,
+    content_types_with_custom_blocks: Optional[Iterable[str]] = None,
+    qti_workers: Optional[int] = None,
+    compression_codec: ArchiveCodec = ArchiveCodec.GZIP,
+    compression_level: Optional[int] = None,
+    compression_workers: Optional[int] = None,
+) -> None:
+    """
+    Convert the Common Cartridge course to the OLX course tar.gz archive or another compressed tar archive.
+
+    The cartridge is read from the bytes or the binary file object and the
+    archive is written to the writable binary stream, which doesn't have to be
+    seekable, e.g. an HTTP response. The course XML and the policy are written
+    to the archive straight from memory, only the cartridge resources are
+    extracted into a temporary directory, because the content processors
+    read them from the filesystem.
+
+    Args:
+        source: the cartridge content or its binary file object.
+        destination: the writable binary stream for the OLX archive.
+        name: the cartridge name used in log messages and the temporary directory.
+        link_file, passport_file, relative_links_source, content_types_with_custom_blocks,
+            qti_workers, compression_codec, compression_level, compression_workers: the
+            same as the corresponding cc2olx command line arguments.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    elif not source.seekable():
+        # Zip archives are read from the end, so the whole stream is needed first.
+        source = io.BytesIO(source.read())
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cartridge = Cartridge(source, Path(tmpdirname), name)
+        cartridge.load_manifest_extracted()
+        cartridge.normalize()
+
+        olx_export = olx.OlxExport(
+            cartridge,
+            link_file,
+            passport_file,
+            relative_links_source,
+            list(content_types_with_custom_blocks or []),
+            qti_workers,
+        )
+        course_xml = olx_export.xml()
+        policy = olx_export.policy()
+
+        with open_tar_archive(destination, compression_codec, compression_level, compression_workers) as archive:
+            filesystem.add_data_in_tar(archive, course_xml.encode("utf-8"), "course.xml")
+            filesystem.add_data_in_tar(archive, policy.encode("utf-8"), "policies/course/policy.json")
+            filesystem.add_in_tar(archive, get_static_file_list(cartridge))
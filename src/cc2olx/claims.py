@@ -0,0 +1,298 @@
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+logger = logging.getLogger()
+
+CLAIM_SUFFIX = ".claim"
+DONE_SUFFIX = ".done"
+CLOCK_FILE_PREFIX = ".clock-"
+DEFAULT_CLAIM_TIMEOUT = 300
+MAX_POLL_INTERVAL = 10
+JOB_KEY_HASH_LENGTH = 12
+
+JOB_STATUS_OK = "ok"
+JOB_STATUS_ERROR = "error"
+
+
+class ClaimLostError(Exception):
+    """
+    Exception type for the cartridge claims taken over by another node.
+    """
+
+
+def get_default_node_id() -> str:
+    """
+    Provide the node identifier unique among the processes of the shared batch.
+    """
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class JobClaims:
+    """
+    Claim the batch cartridges through the lock files in the directory shared by the nodes.
+
+    A cartridge is claimed by creating its claim file exclusively, which is
+    atomic on local filesystems and NFS. The claim files are numbered with
+    the claim generation: a claim not refreshed by its node heartbeat for the
+    timeout is considered abandoned, and the cartridge is reclaimed by
+    creating the claim file of the next generation, so only one of the nodes
+    racing for an abandoned cartridge wins it. A finished cartridge gets a
+    done marker with the conversion status and isn't claimed again.
+
+    The claim ages are measured with the shared filesystem clock, so the node
+    clocks don't have to be in sync. A claim the heartbeat finds taken over is
+    considered lost, and the node must not publish the cartridge results.
+
+    The claim files are named after the cartridge path relative to the input
+    root, so the cartridges with the same name in different directories don't
+    share their claims.
+
+    The claims directory is listed once per `refresh`, and the done markers
+    and the latest claims are looked up in that listing until the next
+    refresh, so polling a large batch on a shared filesystem costs one
+    directory listing instead of a lookup per cartridge. The finished
+    cartridges are remembered and never checked again.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        node_id: Optional[str] = None,
+        timeout: int = DEFAULT_CLAIM_TIMEOUT,
+        input_root: Optional[Path] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.node_id = node_id or get_default_node_id()
+        self.input_root = input_root
+        self.timeout = timeout
+        self.heartbeat_interval = timeout / 3
+        self.poll_interval = min(self.heartbeat_interval, MAX_POLL_INTERVAL)
+        self._claims: Dict[Path, Path] = {}
+        self._lost_claims: Set[Path] = set()
+        self._done_files: Set[Path] = set()
+        self._job_keys: Dict[Path, str] = {}
+        self._done_keys: Optional[Set[str]] = None
+        self._latest_claims: Dict[str, Tuple[int, Path]] = {}
+        self._shared_time: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "JobClaims":
+        self._stopped.clear()
+        self._heartbeat_thread = threading.Thread(target=self._run_heartbeat, name="claims-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stopped.set()
+        self._heartbeat_thread.join()
+
+        with self._lock:
+            claim_paths = list(self._claims.values())
+            self._claims.clear()
+        for claim_path in claim_paths:
+            claim_path.unlink(missing_ok=True)
+        self._get_clock_path().unlink(missing_ok=True)
+
+    def refresh(self) -> None:
+        """
+        List the claims directory and index the done markers and the latest claims by the job key.
+        """
+        done_keys = set()
+        latest_claims = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(DONE_SUFFIX):
+                    done_keys.add(entry.name.removesuffix(DONE_SUFFIX))
+                    continue
+                job_key, separator, generation = entry.name.rpartition(CLAIM_SUFFIX + ".")
+                if separator and generation.isdigit() and int(generation) > latest_claims.get(job_key, (-1,))[0]:
+                    latest_claims[job_key] = (int(generation), Path(entry.path))
+
+        self._done_keys = done_keys
+        self._latest_claims = latest_claims
+        self._shared_time = None
+
+    def is_done(self, input_file: Path) -> bool:
+        """
+        Check whether the cartridge conversion is finished by any node as of the last refresh.
+        """
+        if input_file in self._done_files:
+            return True
+
+        if self._done_keys is None:
+            self.refresh()
+        if self.get_job_key(input_file) in self._done_keys:
+            self._done_files.add(input_file)
+            return True
+        return False
+
+    def claim(self, input_file: Path) -> bool:
+        """
+        Claim the cartridge for this node if it isn't claimed by an alive node or finished.
+
+        The claim state is taken from the last refresh, a stale one is safe:
+        the claim file is created exclusively and the done marker is checked
+        again once the cartridge is claimed.
+        """
+        if self.is_done(input_file):
+            return False
+
+        generation, claim_path = self._latest_claims.get(self.get_job_key(input_file), (-1, None))
+        if claim_path is not None:
+            if not self._is_abandoned(claim_path):
+                return False
+            logger.warning("Reclaiming %s abandoned by %s", input_file.name, self._read_claim_node(claim_path))
+
+        new_claim_path = self._get_claim_path(input_file, generation + 1)
+        try:
+            claim_file_descriptor = os.open(new_claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(claim_file_descriptor, "w", encoding="utf-8") as claim_file:
+            json.dump({"node": self.node_id, "claimed_at": time.time()}, claim_file)
+
+        if claim_path is not None:
+            claim_path.unlink(missing_ok=True)
+
+        # The cartridge could be finished by another node between the checks and the claim.
+        if self._get_done_path(input_file).exists():
+            new_claim_path.unlink(missing_ok=True)
+            self._done_files.add(input_file)
+            return False
+
+        with self._lock:
+            self._claims[input_file] = new_claim_path
+            self._lost_claims.discard(input_file)
+        return True
+
+    def check_not_lost(self, input_file: Path) -> None:
+        """
+        Raise `ClaimLostError` if the heartbeat found the claim of the cartridge taken over.
+
+        Only the heartbeat result is checked, so it is cheap enough to be called on every write.
+        """
+        if input_file in self._lost_claims:
+            raise ClaimLostError(f"The claim of {input_file.name} was taken over by another node.")
+
+    def ensure_claimed(self, input_file: Path) -> None:
+        """
+        Check the claim file of the cartridge is still the latest one, raise `ClaimLostError` otherwise.
+
+        A reclaiming node creates the claim file of the next generation before
+        it removes the current one, so both files are checked.
+        """
+        self.check_not_lost(input_file)
+
+        with self._lock:
+            claim_path = self._claims.get(input_file)
+        if (
+            claim_path is None
+            or not claim_path.exists()
+            or self._get_claim_path(input_file, self._get_claim_generation(claim_path) + 1).exists()
+        ):
+            raise ClaimLostError(f"The claim of {input_file.name} was taken over by another node.")
+
+    def release(self, input_file: Path) -> None:
+        """
+        Forget the lost claim of the cartridge, it is finished by the node which took it over.
+        """
+        with self._lock:
+            self._claims.pop(input_file, None)
+            self._lost_claims.discard(input_file)
+
+    def get_job_key(self, input_file: Path) -> str:
+        """
+        Provide the name the claim and the done files of the cartridge start with.
+        """
+        if input_file not in self._job_keys:
+            relative_path = input_file.relative_to(self.input_root) if self.input_root else input_file
+            path_hash = hashlib.sha1(relative_path.as_posix().encode("utf-8")).hexdigest()[:JOB_KEY_HASH_LENGTH]
+            self._job_keys[input_file] = f"{input_file.name}-{path_hash}"
+        return self._job_keys[input_file]
+
+    def complete(self, input_file: Path, status: str = JOB_STATUS_OK) -> None:
+        """
+        Mark the claimed cartridge as finished and release its claim.
+        """
+        done_path = self._get_done_path(input_file)
+        partial_done_path = done_path.with_name(f"{done_path.name}.{self.node_id}")
+        partial_done_path.write_text(
+            json.dumps({"node": self.node_id, "status": status, "finished_at": time.time()}), encoding="utf-8"
+        )
+        os.replace(partial_done_path, done_path)
+        self._done_files.add(input_file)
+
+        with self._lock:
+            claim_path = self._claims.pop(input_file, None)
+        if claim_path is not None:
+            claim_path.unlink(missing_ok=True)
+
+    def get_shared_time(self) -> float:
+        """
+        Provide the current time of the shared filesystem clock.
+        """
+        clock_path = self._get_clock_path()
+        clock_path.touch()
+        return clock_path.stat().st_mtime
+
+    def heartbeat(self) -> None:
+        """
+        Refresh the claims of this node, so they aren't considered abandoned.
+        """
+        with self._lock:
+            claims = list(self._claims.items())
+
+        for input_file, claim_path in claims:
+            try:
+                os.utime(claim_path)
+            except FileNotFoundError:
+                logger.warning("The claim of %s was taken over by another node", input_file.name)
+                with self._lock:
+                    self._claims.pop(input_file, None)
+                    self._lost_claims.add(input_file)
+
+    def _run_heartbeat(self) -> None:
+        while not self._stopped.wait(self.heartbeat_interval):
+            self.heartbeat()
+
+    def _is_abandoned(self, claim_path: Path) -> bool:
+        try:
+            heartbeat_time = claim_path.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        # The shared clock is read once per refresh, the claim timeout is much longer than the poll interval.
+        if self._shared_time is None:
+            self._shared_time = self.get_shared_time()
+        return self._shared_time - heartbeat_time > self.timeout
+
+    @staticmethod
+    def _get_claim_generation(claim_path: Path) -> int:
+        return int(claim_path.name.rpartition(CLAIM_SUFFIX + ".")[2])
+
+    def _get_claim_path(self, input_file: Path, generation: int) -> Path:
+        return self.directory / f"{self.get_job_key(input_file)}{CLAIM_SUFFIX}.{generation}"
+
+    def _get_clock_path(self) -> Path:
+        return self.directory / f"{CLOCK_FILE_PREFIX}{self.node_id}"
+
+    def _get_done_path(self, input_file: Path) -> Path:
+        return self.directory / f"{self.get_job_key(input_file)}{DONE_SUFFIX}"
+
+    @staticmethod
+    def _read_claim_node(claim_path: Path) -> Optional[str]:
+        try:
+            return json.loads(claim_path.read_text(encoding="utf-8")).get("node")
+        except (OSError, ValueError):
+            return None
@@ -3,7 +3,10 @@ import logging
 
 from pathlib import Path
 
-from cc2olx.enums import SupportedCustomBlockContentType
+from cc2olx.claims import DEFAULT_CLAIM_TIMEOUT
+from cc2olx.enums import ArchiveCodec, SupportedCustomBlockContentType
+from cc2olx.inventory import INVENTORY_FORMAT_CSV, INVENTORY_FORMAT_JSON
+from cc2olx.metrics import METRICS_FORMAT_JSON, METRICS_FORMAT_PROMETHEUS
 from cc2olx.validators.cli import link_source_validator
 
 RESULT_TYPE_FOLDER = "folder"
@@ -113,4 +116,147 @@ def parse_args(args=None):
         choices=list(SupportedCustomBlockContentType),
         help="Names of content types for which custom xblocks will be used.",
     )
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--qti-workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of worker processes used to convert QTI assessments in parallel. "
+            "If not provided, assessments are converted in the main process."
+        ),
+    )
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of processes converting the cartridges in parallel, the biggest cartridges are started first. "
+            "If not provided, the cartridges are converted one by one."
+        ),
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        default=None,
+        help=(
+            "The memory in MB the parallel conversions can take together, the cartridge conversion is started "
+            "only while the projected memory usage fits. 80%% of the physical memory by default."
+        ),
+    )
+    parser.add_argument(
+        "--disk-budget",
+        type=int,
+        default=None,
+        help=(
+            "The scratch disk space in MB the parallel conversions can take together. "
+            "90%% of the free temporary directory space by default."
+        ),
+    )
+    parser.add_argument(
+        "--claims-directory",
+        type=Path,
+        default=None,
+        help=(
+            "The directory shared by several nodes converting the same cartridges into the same output folder. "
+            "Every node claims the cartridges one by one through the lock files in the directory."
+        ),
+    )
+    parser.add_argument(
+        "--node-id",
+        default=None,
+        help="The node name in the claims directory, the host name with the process ID by default.",
+    )
+    parser.add_argument(
+        "--claim-timeout",
+        type=int,
+        default=DEFAULT_CLAIM_TIMEOUT,
+        help="Seconds without a heartbeat after which the cartridge claimed by a dead node is claimed again.",
+    )
+    parser.add_argument(
+        "--keep-intermediates",
+        action="store_true",
+        help=(
+            "Keep the extracted cartridges, course XML and policy files in the output next to the OLX archives "
+            "for debugging. They are deleted as soon as every cartridge is packed by default."
+        ),
+    )
+    parser.add_argument(
+        "--compression-codec",
+        choices=list(ArchiveCodec),
+        default=ArchiveCodec.GZIP,
+        help=(
+            "The compression codec of the OLX archives. Studio imports only the gzip compressed archives, "
+            "'store' writes uncompressed tar archives."
+        ),
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(0, 10),
+        default=None,
+        metavar="{0-9}",
+        help=(
+            "The compression level of the OLX archives, lower levels are faster but produce bigger archives. "
+            "If not provided, the codec default level is used: 9 for gzip and bz2, 6 for xz."
+        ),
+    )
+    parser.add_argument(
+        "--compression-workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of threads used to compress every OLX archive in parallel. "
+            "If not provided, archives are compressed in the main thread."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help=(
+            "Optionally provide the path to the file to write the conversion metrics to when the batch is finished: "
+            "the duration, the sizes, the resource counts, the missing content fallbacks and the skipped "
+            "processors of every cartridge with the batch totals and throughput."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=[METRICS_FORMAT_JSON, METRICS_FORMAT_PROMETHEUS],
+        default=METRICS_FORMAT_JSON,
+        help=(
+            "The format of the metrics file: a JSON summary or the Prometheus text format "
+            "for the node exporter textfile collector."
+        ),
+    )
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help=(
+            "Write the content inventory of every cartridge to stdout instead of converting it: the resource "
+            "counts, the LTI tools, the static and QTI sizes and the resources expected to be replaced with the "
+            "missing content fallback. Only the zip directory, the manifest and the Canvas module meta are read. "
+            "Use --batch-workers to analyze the cartridges in parallel processes."
+        ),
+    )
+    parser.add_argument(
+        "--analyze-format",
+        choices=[INVENTORY_FORMAT_JSON, INVENTORY_FORMAT_CSV],
+        default=INVENTORY_FORMAT_JSON,
+        help="The format of the inventory: a JSON line or a CSV row per cartridge.",
+    )
+    parsed_args = parser.parse_args(args)
+
+    compression_codec = ArchiveCodec(parsed_args.compression_codec)
+    if parsed_args.compression_level is not None and parsed_args.compression_level not in compression_codec.levels:
+        parser.error(
+            f"--compression-level {parsed_args.compression_level} isn't supported by the {compression_codec} codec, "
+            f"use {compression_codec.levels.start}-{compression_codec.levels.stop - 1}."
+        )
+    if parsed_args.claims_directory and parsed_args.result != RESULT_TYPE_FOLDER:
+        parser.error("--claims-directory requires the folder result type.")
+    if parsed_args.claims_directory and parsed_args.analyze:
+        parser.error("--claims-directory can't be combined with --analyze.")
+    if parsed_args.claims_directory and parsed_args.batch_workers:
+        parser.error("--claims-directory can't be combined with --batch-workers, start several nodes instead.")
+
+    return parsed_args
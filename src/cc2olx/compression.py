@@ -0,0 +1,191 @@
+import bz2
+import collections
+import contextlib
+import io
+import lzma
+import os
+import struct
+import tarfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Deque, Iterator, Optional
+
+from cc2olx.enums import ArchiveCodec
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+# Deflate looks back at most 32 KB, a block primed with them compresses as well as a continuous stream.
+DEFLATE_DICTIONARY_SIZE = 32 * 1024
+# Gzip header without a file name and a modification time.
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# An empty final deflate block closing the stream of the sync flushed blocks.
+DEFLATE_FINAL_BLOCK = b"\x03\x00"
+
+# Every segment of a block is checked separately, so the media stored next to text files is recognized.
+SEGMENT_SIZE = 64 * 1024
+INCOMPRESSIBLE_SAMPLE_SIZE = 4096
+INCOMPRESSIBLE_RATIO = 0.95
+
+
+def is_incompressible(data: bytes) -> bool:
+    """
+    Check whether the data is already compressed, e.g. images or videos, by compressing a sample of it.
+    """
+    if len(data) < INCOMPRESSIBLE_SAMPLE_SIZE:
+        return False
+
+    # The sample is taken from the middle, because the beginning can be a tar header.
+    sample_start = (len(data) - INCOMPRESSIBLE_SAMPLE_SIZE) // 2
+    sample_end = sample_start + INCOMPRESSIBLE_SAMPLE_SIZE
+    sample = data[sample_start:sample_end]
+    return len(zlib.compress(sample, 1)) >= len(sample) * INCOMPRESSIBLE_RATIO
+
+
+def create_deflate_compressor(level: int, dictionary: bytes = b""):
+    """
+    Create the raw deflate compressor primed with the dictionary.
+    """
+    if dictionary:
+        return zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    return zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+
+def compress_deflate_block(data: bytes, level: int, dictionary: bytes = b"") -> bytes:
+    """
+    Compress the data into raw deflate blocks ending on a byte boundary, so they can be concatenated.
+
+    The already compressed segments of the data are stored without compression.
+    """
+    runs = []
+    for segment_start in range(0, len(data), SEGMENT_SIZE):
+        segment_end = segment_start + SEGMENT_SIZE
+        segment_level = 0 if level and is_incompressible(data[segment_start:segment_end]) else level
+
+        if runs and runs[-1][0] == segment_level:
+            runs[-1][2] = min(segment_end, len(data))
+        else:
+            runs.append([segment_level, segment_start, min(segment_end, len(data))])
+
+    compressed = []
+    for run_level, run_start, run_end in runs:
+        compressor = create_deflate_compressor(run_level, dictionary)
+        compressed.append(compressor.compress(data[run_start:run_end]) + compressor.flush(zlib.Z_SYNC_FLUSH))
+        dictionary_start = max(run_end - DEFLATE_DICTIONARY_SIZE, 0)
+        dictionary = data[dictionary_start:run_end]
+
+    return b"".join(compressed)
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """
+    Write the gzip compressed data compressing its blocks in parallel threads.
+
+    The data is split into blocks which are compressed independently by a
+    thread pool and written to the file object in order, the way pigz does.
+    Every block is primed with the end of the previous one and ends with a
+    sync flush, so the blocks form a single regular gzip member. zlib releases
+    the GIL, so the blocks are really compressed in parallel.
+
+    The segments of already compressed data, e.g. images or videos, are
+    stored without compression instead of being compressed again.
+
+    Only a limited number of blocks is kept in memory, the writer waits for
+    the oldest block to be compressed and written before buffering more. The
+    file object isn't closed when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        level: int = ArchiveCodec.GZIP.default_level,
+        workers: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        super().__init__()
+        self._fileobj = fileobj
+        self._level = level
+        self._block_size = block_size
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        self._pending: Deque[Future] = collections.deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self._size = 0
+
+        self._fileobj.write(GZIP_HEADER)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+
+            while self._pending:
+                self._write_block(self._pending.popleft())
+
+            self._fileobj.write(DEFLATE_FINAL_BLOCK)
+            self._fileobj.write(struct.pack("<LL", self._crc, self._size & 0xFFFFFFFF))
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            super().close()
+
+    def _submit(self, block: bytes) -> None:
+        if len(self._pending) >= 2 * self._workers:
+            self._write_block(self._pending.popleft())
+
+        self._pending.append(self._executor.submit(compress_deflate_block, block, self._level, self._dictionary))
+        self._dictionary = block[-DEFLATE_DICTIONARY_SIZE:]
+
+    def _write_block(self, future: Future) -> None:
+        self._fileobj.write(future.result())
+
+
+@contextlib.contextmanager
+def open_tar_archive(
+    fileobj: BinaryIO,
+    codec: ArchiveCodec = ArchiveCodec.GZIP,
+    level: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Iterator[tarfile.TarFile]:
+    """
+    Open the tar archive for writing it compressed by the codec to the binary file object.
+
+    The gzip archives are compressed by the block writer, which stores
+    already compressed media without compressing it again, in a single thread
+    unless more workers are requested. The xz and bz2 formats have no stored
+    blocks and are always compressed in the current thread. The file object
+    doesn't have to be seekable.
+    """
+    codec = ArchiveCodec(codec)
+    level = codec.default_level if level is None else level
+    if codec != ArchiveCodec.STORE and level not in codec.levels:
+        raise ValueError(f"The compression level {level} is not supported by the {codec} codec.")
+
+    if codec == ArchiveCodec.GZIP:
+        compressed_file = ParallelGzipWriter(fileobj, level, workers or 1)
+    elif codec == ArchiveCodec.XZ:
+        compressed_file = lzma.LZMAFile(fileobj, "w", preset=level)
+    elif codec == ArchiveCodec.BZ2:
+        compressed_file = bz2.BZ2File(fileobj, "w", compresslevel=level)
+    else:
+        compressed_file = contextlib.nullcontext(fileobj)
+
+    with compressed_file as output_file, tarfile.open(fileobj=output_file, mode="w|") as archive:
+        yield archive
@@ -0,0 +1,65 @@
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Any, Optional
+
+DEFAULT_SETTINGS_MODULE = "cc2olx.settings"
+
+
+class LazySettings:
+    """
+    Provide cc2olx settings without importing Django.
+
+    If Django is imported and its settings are configured, e.g. cc2olx is used
+    inside a Django project, the Django settings are used. Otherwise, the
+    settings module from the DJANGO_SETTINGS_MODULE environment variable or
+    the default cc2olx settings module is imported directly.
+    """
+
+    def __init__(self) -> None:
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._get_settings(), name)
+
+    def _get_settings(self) -> Any:
+        django_settings = _get_configured_django_settings()
+        if django_settings is not None:
+            return django_settings
+
+        if self._module is None:
+            self._module = importlib.import_module(os.environ.get("DJANGO_SETTINGS_MODULE", DEFAULT_SETTINGS_MODULE))
+        return self._module
+
+
+def _get_configured_django_settings() -> Optional[Any]:
+    """
+    Provide Django settings if Django is already imported and configured.
+    """
+    django_conf = sys.modules.get("django.conf")
+    if django_conf is not None and django_conf.settings.configured:
+        return django_conf.settings
+    return None
+
+
+def import_string(dotted_path: str) -> Any:
+    """
+    Import a dotted module path and return the attribute designated by the last name in the path.
+    """
+    try:
+        module_path, attribute_name = dotted_path.rsplit(".", 1)
+    except ValueError as exc:
+        raise ImportError(f"{dotted_path} doesn't look like a module path") from exc
+
+    module = importlib.import_module(module_path)
+
+    try:
+        return getattr(module, attribute_name)
+    except AttributeError as exc:
+        raise ImportError(f'Module "{module_path}" does not define a "{attribute_name}" attribute') from exc
+
+
+settings = LazySettings()
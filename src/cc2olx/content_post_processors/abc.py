@@ -1,5 +1,6 @@
 import xml.dom.minidom
 from abc import ABC, abstractmethod
+from collections import Counter
 
 from cc2olx.content_post_processors.dataclasses import ContentPostProcessorContext
 from cc2olx.models import Cartridge
@@ -13,11 +14,15 @@ class AbstractContentPostProcessor(ABC):
     subclass and implement a `process` method. To include the subclass into the
     post-processing workflow, you need to add it to the `CONTENT_POST_PROCESSORS`
     setting.
+
+    The post processor can count its events (like skipped work) in `stats`,
+    they are reported when the course export is finished.
     """
 
     def __init__(self, cartridge: Cartridge, context: ContentPostProcessorContext) -> None:
         self._cartridge = cartridge
         self._context = context
+        self.stats = Counter()
 
     @abstractmethod
     def process(self, element: xml.dom.minidom.Element) -> None:
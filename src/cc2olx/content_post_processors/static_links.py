@@ -18,7 +18,7 @@ class LinkKeywordProcessor(NamedTuple):
     """
 
     keyword: str
-    processor: Callable[[str, str], str]
+    processor: Callable[[str], str]
 
 
 class StaticLinkPostProcessor(AbstractContentPostProcessor):
@@ -47,9 +47,21 @@ class StaticLinkPostProcessor(AbstractContentPostProcessor):
         """
         Process static links in a text node.
         """
+        if not self._may_contain_links(node.nodeValue):
+            self.stats["link_scans_skipped"] += 1
+            return
+
+        self.stats["link_scans"] += 1
         links = re.findall(self.HTML_LINK_PATTERN, node.nodeValue)
         node.nodeValue = self.process_html_links(node.nodeValue, links)
 
+    @staticmethod
+    def _may_contain_links(html: str) -> bool:
+        """
+        Cheaply decide whether the HTML string can contain any link.
+        """
+        return "src" in html or "href" in html
+
     @_process_node_links.register
     def _(self, node: xml.dom.minidom.Element) -> None:
         """
@@ -57,22 +69,29 @@ class StaticLinkPostProcessor(AbstractContentPostProcessor):
         """
         for attribute_name in self.LINK_ATTRIBUTES:
             if link := node.getAttribute(attribute_name):
-                node.setAttribute(attribute_name, self.process_html_links(link, [link]))
+                node.setAttribute(attribute_name, self._process_link(link))
 
     def process_html_links(self, html: str, links: List[str]) -> str:
         """
         Process the provided links inside HTML string.
+
+        Every distinct link is processed once, the repeated ones would have
+        been replaced together with the first occurrence.
         """
-        for link in links:
-            for keyword, processor in self._link_keyword_processors:
-                if keyword in link:
-                    html = processor(link, html)
-                    break
-            else:
-                html = self._process_relative_external_links(link, html)
+        for link in dict.fromkeys(links):
+            html = html.replace(link, self._process_link(link))
 
         return html
 
+    def _process_link(self, link: str) -> str:
+        """
+        Turn Common Cartridge link into OLX link.
+        """
+        for keyword, processor in self._link_keyword_processors:
+            if keyword in link:
+                return processor(link)
+        return self._process_relative_external_link(link)
+
     @cached_property
     def _link_keyword_processors(self) -> Tuple[LinkKeywordProcessor, ...]:
         """
@@ -85,7 +104,7 @@ class StaticLinkPostProcessor(AbstractContentPostProcessor):
             LinkKeywordProcessor("CANVAS_OBJECT_REFERENCE", self._process_canvas_reference),
         )
 
-    def _process_wiki_reference(self, link: str, html: str) -> str:
+    def _process_wiki_reference(self, link: str) -> str:
         """
         Replace $WIKI_REFERENCE$ with edx /jump_to_id/<url_name>.
         """
@@ -95,22 +114,20 @@ class StaticLinkPostProcessor(AbstractContentPostProcessor):
         search_key = search_key.split("?")[0] + ".html"
         for key in self._cartridge.resource_id_by_href.keys():
             if key.endswith(search_key):
-                replace_with = "/jump_to_id/{}".format(self._cartridge.resource_id_by_href[key])
-                return html.replace(link, replace_with)
+                return "/jump_to_id/{}".format(self._cartridge.resource_id_by_href[key])
 
         logger.warning("Unable to process Wiki link - %s", link)
-        return html
+        return link
 
     @staticmethod
-    def _process_canvas_reference(link: str, html: str) -> str:
+    def _process_canvas_reference(link: str) -> str:
         """
         Replace $CANVAS_OBJECT_REFERENCE$ with edx /jump_to_id/<url_name>.
         """
-        object_id = urllib.parse.unquote(link).replace("$CANVAS_OBJECT_REFERENCE$/quizzes/", "/jump_to_id/")
-        return html.replace(link, object_id)
+        return urllib.parse.unquote(link).replace("$CANVAS_OBJECT_REFERENCE$/quizzes/", "/jump_to_id/")
 
     @staticmethod
-    def _process_ims_cc_filebase(link: str, html: str) -> str:
+    def _process_ims_cc_filebase(link: str) -> str:
         """
         Replace $IMS-CC-FILEBASE$ with /static.
         """
@@ -118,21 +135,19 @@ class StaticLinkPostProcessor(AbstractContentPostProcessor):
         # skip query parameters for static files
         new_link = new_link.split("?")[0]
         # &amp; is not valid in an URL. But some file seem to have it when it should be &
-        new_link = new_link.replace("&amp;", "&")
-        return html.replace(link, new_link)
+        return new_link.replace("&amp;", "&")
 
     @staticmethod
-    def _process_external_tools_link(link: str, html: str) -> str:
+    def _process_external_tools_link(link: str) -> str:
         """
         Replace $CANVAS_OBJECT_REFERENCE$/external_tools/retrieve with appropriate external link.
         """
         external_tool_query = urllib.parse.urlparse(link).query
         # unescape query that has been HTML encoded so it can be parsed correctly
         unescaped_external_tool_query = html_parser.unescape(external_tool_query)
-        external_tool_url = urllib.parse.parse_qs(unescaped_external_tool_query).get("url", [""])[0]
-        return html.replace(link, external_tool_url)
+        return urllib.parse.parse_qs(unescaped_external_tool_query).get("url", [""])[0]
 
-    def _process_relative_external_links(self, link: str, html: str) -> str:
+    def _process_relative_external_link(self, link: str) -> str:
         """
         Turn static file URLs outside OLX_STATIC_DIR into absolute URLs.
 
@@ -143,7 +158,6 @@ class StaticLinkPostProcessor(AbstractContentPostProcessor):
         absolute ones.
         """
         if self._context.relative_links_source is None or link in self._cartridge.olx_to_original_static_file_paths.all:
-            return html
+            return link
 
-        url = urllib.parse.urljoin(self._context.relative_links_source, link)
-        return html.replace(link, url)
+        return urllib.parse.urljoin(self._context.relative_links_source, link)
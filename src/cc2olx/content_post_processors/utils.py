@@ -1,8 +1,7 @@
-from typing import List, Type
-
-from django.conf import settings
-from django.utils.module_loading import import_string
+import functools
+from typing import List, Tuple, Type
 
+from cc2olx.conf import import_string, settings
 from cc2olx.content_post_processors import AbstractContentPostProcessor
 
 
@@ -10,4 +9,12 @@ def load_content_post_processor_types() -> List[Type[AbstractContentPostProcesso
     """
     Load content post processor types.
     """
-    return [import_string(processor_path) for processor_path in settings.CONTENT_POST_PROCESSORS]
+    return list(_import_processor_types(tuple(settings.CONTENT_POST_PROCESSORS)))
+
+
+@functools.lru_cache(maxsize=None)
+def _import_processor_types(processor_paths: Tuple[str, ...]) -> Tuple[Type[AbstractContentPostProcessor], ...]:
+    """
+    Import processor types once per process for every processor list.
+    """
+    return tuple(import_string(processor_path) for processor_path in processor_paths)
@@ -1,12 +1,19 @@
+import importlib
+
 from cc2olx.content_processors.abc import AbstractContentProcessor
-from cc2olx.content_processors.assignment import AssignmentContentProcessor
-from cc2olx.content_processors.discussion import DiscussionContentProcessor
-from cc2olx.content_processors.google_document import GoogleDocumentContentProcessor
-from cc2olx.content_processors.html import HtmlContentProcessor
-from cc2olx.content_processors.lti import LtiContentProcessor
-from cc2olx.content_processors.pdf import PDFContentProcessor
-from cc2olx.content_processors.qti import QtiContentProcessor
-from cc2olx.content_processors.video import VideoContentProcessor
+
+# The processors are imported on first access, so a course converted without
+# some of them doesn't pay for importing their dependencies.
+_CONTENT_PROCESSOR_MODULES = {
+    "AssignmentContentProcessor": "assignment",
+    "DiscussionContentProcessor": "discussion",
+    "GoogleDocumentContentProcessor": "google_document",
+    "HtmlContentProcessor": "html",
+    "LtiContentProcessor": "lti",
+    "PDFContentProcessor": "pdf",
+    "QtiContentProcessor": "qti",
+    "VideoContentProcessor": "video",
+}
 
 __all__ = [
     "AbstractContentProcessor",
@@ -19,3 +26,14 @@ __all__ = [
     "QtiContentProcessor",
     "VideoContentProcessor",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _CONTENT_PROCESSOR_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    content_processor_type = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = content_processor_type
+    return content_processor_type
@@ -1,6 +1,8 @@
 import xml.dom.minidom
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import Counter
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional
 
 from cc2olx.content_processors.dataclasses import ContentProcessorContext
 from cc2olx.models import Cartridge
@@ -18,11 +20,19 @@ class AbstractContentProcessor(ABC):
     Sometimes it is needed to update the object outside the content processor
     during its execution. The allowed side effects are defined by the context
     interface. It is forbidden to mutate the cartridge object.
+
+    If the processing of a resource is CPU-bound and doesn't depend on the
+    other resources, the processor can override `prefetch` method to convert
+    the resources in an executor in advance.
+
+    The processor can count its events (like skipped work) in `stats`, they
+    are reported when the course export is finished.
     """
 
     def __init__(self, cartridge: Cartridge, context: ContentProcessorContext) -> None:
         self._cartridge = cartridge
         self._context = context
+        self.stats = Counter()
 
     @abstractmethod
     def process(self, resource: dict, idref: str) -> Optional[List[xml.dom.minidom.Element]]:
@@ -36,3 +46,11 @@ class AbstractContentProcessor(ABC):
         nodes.
         If the resource can not be processed, return `None`.
         """
+
+    def prefetch(self, resources: Iterable[dict], executor: Executor) -> None:
+        """
+        Schedule the conversion of the resources in the executor in advance.
+
+        The results must be used by `process` method in place of the
+        synchronous conversion. Do nothing by default.
+        """
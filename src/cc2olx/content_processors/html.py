@@ -1,4 +1,3 @@
-import imghdr
 import logging
 import re
 import xml.dom.minidom
@@ -6,11 +5,10 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import lxml.html
-from django.conf import settings
 
 from cc2olx.constants import FALLBACK_OLX_CONTENT
 from cc2olx.content_processors import AbstractContentProcessor
-from cc2olx.content_processors.utils import WebContentFile, parse_web_link_content
+from cc2olx.content_processors.utils import WebContentFile, parse_web_link_content, render_template
 from cc2olx.enums import CommonCartridgeResourceType
 from cc2olx.utils import clean_from_cdata
 
@@ -18,6 +16,9 @@ logger = logging.getLogger()
 
 HTML_FILENAME_SUFFIX = ".html"
 LINK_HTML = '<a href="{url}">{text}</a>'
+IFRAME_TAG_PATTERN = re.compile(r"<iframe", flags=re.IGNORECASE)
+# lxml refuses to parse a unicode string with an encoding declaration.
+XML_DECLARATION_PATTERN = re.compile(r"^\s*<\?xml[^>]*\?>")
 
 
 class HtmlContentProcessor(AbstractContentProcessor):
@@ -45,6 +46,7 @@ class HtmlContentProcessor(AbstractContentProcessor):
         elif self.is_known_unprocessed_resource_type(resource_type):
             content = self.FALLBACK_CONTENT
         else:
+            self.stats["not_imported_content"] += 1
             content = self._parse_not_imported_content(resource)
         return content
 
@@ -58,16 +60,24 @@ class HtmlContentProcessor(AbstractContentProcessor):
 
         if resource_file_path.suffix == HTML_FILENAME_SUFFIX:
             content = self._parse_webcontent_html_file(resource_file_path, idref)
-        elif is_web_content_from_web_resources_dir and imghdr.what(str(resource_file_path)):
+        elif is_web_content_from_web_resources_dir and self._is_image_file(web_content_file):
             content = self._parse_image_webcontent_from_web_resources_dir(web_content_file)
         elif not is_web_content_from_web_resources_dir:
             content = self._parse_webcontent_outside_web_resources_dir(web_content_file)
         else:
-            logger.info("Skipping webcontent: %s", resource_file_path)
+            self.stats["webcontent_skipped"] += 1
+            logger.debug("Skipping webcontent: %s", resource_file_path)
             content = self.FALLBACK_CONTENT
 
         return content
 
+    def _is_image_file(self, web_content_file: WebContentFile) -> bool:
+        """
+        Whether the file is an image, the file header is read from the cartridge without the extracted file.
+        """
+        file_type = self._cartridge.sniff_resource_file_type(web_content_file.resource_relative_path)
+        return file_type is not None and file_type.is_image
+
     @staticmethod
     def _parse_webcontent_html_file(resource_file_path: Path, idref: str) -> Dict[str, str]:
         """
@@ -90,15 +100,11 @@ class HtmlContentProcessor(AbstractContentProcessor):
             olx_static_path,
             web_content_file.resource_file_path,
         )
-        image_webcontent_tpl_path = settings.TEMPLATES_DIR / "image_webcontent.html"
-
-        with open(image_webcontent_tpl_path, encoding="utf-8") as image_webcontent_tpl:
-            tpl_content = image_webcontent_tpl.read()
-            html = tpl_content.format(
-                olx_static_path=olx_static_path,
-                static_file_path=web_content_file.static_file_path,
-            )
-
+        html = render_template(
+            "image_webcontent.html",
+            olx_static_path=olx_static_path,
+            static_file_path=web_content_file.static_file_path,
+        )
         return {"html": html}
 
     def _parse_webcontent_outside_web_resources_dir(self, web_content_file: WebContentFile) -> Dict[str, str]:
@@ -110,12 +116,11 @@ class HtmlContentProcessor(AbstractContentProcessor):
         # This webcontent is outside ``web_resources`` directory
         # So we need to manually copy it to OLX_STATIC_DIR
         self._cartridge.olx_to_original_static_file_paths.add_extra_path(olx_static_path, resource_relative_path)
-        external_webcontent_tpl_path = settings.TEMPLATES_DIR / "external_webcontent.html"
-
-        with open(external_webcontent_tpl_path, encoding="utf-8") as external_webcontent_tpl:
-            tpl_content = external_webcontent_tpl.read()
-            html = tpl_content.format(olx_static_path=olx_static_path, resource_relative_path=resource_relative_path)
-
+        html = render_template(
+            "external_webcontent.html",
+            olx_static_path=olx_static_path,
+            resource_relative_path=resource_relative_path,
+        )
         return {"html": html}
 
     @staticmethod
@@ -151,7 +156,7 @@ class HtmlContentProcessor(AbstractContentProcessor):
         if "href" in resource:
             text += ", href = {!r}".format(resource["href"])
 
-        logger.info("%s", text)
+        logger.debug("%s", text)
         return {"html": text}
 
     def _create_nodes(self, content: Dict[str, str]) -> List[xml.dom.minidom.Element]:
@@ -189,7 +194,13 @@ class HtmlContentProcessor(AbstractContentProcessor):
         a list of XML children, i.e video xblock.
         """
         video_olx = []
-        parsed_html = lxml.html.fromstring(html_str)
+
+        if not IFRAME_TAG_PATTERN.search(html_str):
+            self.stats["iframe_parses_skipped"] += 1
+            return html_str, video_olx
+
+        self.stats["iframe_parses"] += 1
+        parsed_html = lxml.html.fromstring(XML_DECLARATION_PATTERN.sub("", html_str, count=1))
         iframes = parsed_html.xpath("//iframe")
         if not iframes:
             return html_str, video_olx
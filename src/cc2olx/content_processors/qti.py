@@ -4,11 +4,22 @@ import re
 import urllib.parse
 import xml.dom.minidom
 from collections import OrderedDict
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass
 from enum import Enum
 from html import unescape
 from pathlib import Path
-from typing import Callable, Collection, Dict, List, Optional, OrderedDict as OrderedDictType, Tuple, Union
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    OrderedDict as OrderedDictType,
+    Tuple,
+    Union,
+)
 
 from lxml import etree, html
 
@@ -19,6 +30,7 @@ from cc2olx.utils import element_builder
 from cc2olx.xml import cc_xml
 
 QTI_RESPROCESSING_TYPES = ["general_fb", "correct_fb", "general_incorrect_fb"]
+FIB_REGEXP_ANSWERS_CACHE_SIZE = 4096
 
 logger = logging.getLogger()
 
@@ -57,24 +69,69 @@ class QtiContentProcessor(AbstractContentProcessor):
     QTI content processor.
     """
 
-    FIB_PROBLEM_TEXTLINE_SIZE_BUFFER = 10
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._prefetched_conversions: Dict[Path, Future] = {}
 
     def process(self, resource: dict, idref: str) -> Optional[List[xml.dom.minidom.Element]]:
-        if content := self._parse(resource):
-            return self._create_nodes(content)
+        if (prefetched_conversion := self._get_prefetched_conversion(resource)) is not None:
+            return self._load_serialized_nodes(prefetched_conversion.result()) or None
+        if (resource_file_path := self._get_qti_file_path(resource)) is not None:
+            return convert_qti(resource_file_path) or None
         return None
 
-    def _parse(self, resource: dict) -> Optional[List[dict]]:
+    def prefetch(self, resources: Iterable[dict], executor: Executor) -> None:
+        """
+        Schedule QTI assessments conversion in the executor.
+
+        Each assessment is converted independently, the worker gives out the
+        serialized problem nodes which are loaded back when the resource is
+        processed, so the nodes are placed at their original positions.
+        """
+        for resource in resources:
+            resource_file_path = self._get_qti_file_path(resource)
+            if resource_file_path is not None and resource_file_path not in self._prefetched_conversions:
+                self._prefetched_conversions[resource_file_path] = executor.submit(
+                    convert_qti_file,
+                    resource_file_path,
+                )
+
+    def _get_prefetched_conversion(self, resource: dict) -> Optional[Future]:
+        """
+        Provide the scheduled conversion of the resource if it exists.
+        """
+        if not self._prefetched_conversions:
+            return None
+        return self._prefetched_conversions.get(self._get_qti_file_path(resource))
+
+    @staticmethod
+    def _load_serialized_nodes(serialized_nodes: List[str]) -> List[xml.dom.minidom.Element]:
+        """
+        Load OLX nodes from their XML strings.
+        """
+        return [xml.dom.minidom.parseString(serialized_node).documentElement for serialized_node in serialized_nodes]
+
+    def _get_qti_file_path(self, resource: dict) -> Optional[Path]:
         """
-        Parse the resource content.
+        Provide QTI assessment file path if the resource is a QTI assessment.
         """
         if re.match(CommonCartridgeResourceType.QTI_ASSESSMENT, resource["type"]):
             resource_file = resource["children"][0]
-            resource_file_path = self._cartridge.build_resource_file_path(resource_file.href)
-            return self._parse_qti(resource_file_path)
+            return self._cartridge.build_resource_file_path(resource_file.href)
         return None
 
-    def _parse_qti(self, resource_file_path: Path) -> List[dict]:
+
+class QtiConverter:
+    """
+    Convert QTI assessments into OLX problem nodes.
+
+    The conversion depends on the assessment file only, so it is shared by
+    the content processor and the worker processes.
+    """
+
+    FIB_PROBLEM_TEXTLINE_SIZE_BUFFER = 10
+
+    def parse(self, resource_file_path: Path) -> List[dict]:
         """
         Parse resource of ``imsqti_xmlv1p2/imscc_xmlv1p1/assessment`` type.
         """
@@ -115,9 +172,12 @@ class QtiContentProcessor(AbstractContentProcessor):
         try:
             data.update(parse_problem(problem))
         except NotImplementedError:
-            logger.info("Problem with ID %s can't be converted.", problem.attrib.get("ident"))
-            logger.info("    Profile %s is not supported.", cc_profile)
-            logger.info("    At file %s.", resource_file_path)
+            logger.debug(
+                "Problem with ID %s can't be converted, profile %s is not supported. At file %s.",
+                problem.attrib.get("ident"),
+                cc_profile,
+                resource_file_path,
+            )
 
         return data
 
@@ -324,15 +384,15 @@ class QtiContentProcessor(AbstractContentProcessor):
     def _build_fib_problem_regexp_answers(raw_answers: FibProblemRawAnswers) -> dict:
         """
         Build the Fill-In-The-Blank problem regular expression answers data.
-        """
-        exact_answers = raw_answers.exact_answers.copy()
-        answer_patterns = raw_answers.answer_patterns.copy()
-
-        data = {"answer": answer_patterns.pop(0)}
-        exact_answers = [re.escape(answer) for answer in exact_answers]
-        data["additional_answers"] = [*answer_patterns, *exact_answers]
 
-        return data
+        Question banks often reuse the same answer sets, so the answers are
+        built by the cached function keyed by the raw answers.
+        """
+        answer, *additional_answers = build_fib_regexp_answers(
+            tuple(raw_answers.exact_answers),
+            tuple(raw_answers.answer_patterns),
+        )
+        return {"answer": answer, "additional_answers": additional_answers}
 
     @staticmethod
     def _build_fib_problem_exact_answers(raw_answers: FibProblemRawAnswers) -> dict:
@@ -396,7 +456,7 @@ class QtiContentProcessor(AbstractContentProcessor):
         """
         raise NotImplementedError
 
-    def _create_nodes(self, content: List[dict]) -> List[xml.dom.minidom.Element]:
+    def create_nodes(self, content: List[dict]) -> List[xml.dom.minidom.Element]:
         """
         Give out <problem> or <openassessment> OLX nodes.
         """
@@ -718,3 +778,40 @@ class QtiContentProcessor(AbstractContentProcessor):
         Create pattern match problem OLX.
         """
         raise NotImplementedError
+
+
+@functools.lru_cache(maxsize=FIB_REGEXP_ANSWERS_CACHE_SIZE)
+def build_fib_regexp_answers(exact_answers: Tuple[str, ...], answer_patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Build the Fill-In-The-Blank problem regular expression answers.
+
+    The first answer pattern is the primary answer, the rest of the patterns
+    and the escaped exact answers are the additional ones. The patterns are
+    validated once per answer set, so the invalid ones are reported during
+    the conversion instead of failing on the course import.
+    """
+    for answer_pattern in answer_patterns:
+        try:
+            re.compile(answer_pattern)
+        except re.error as exc:
+            logger.warning("Invalid Fill-In-The-Blank answer pattern %r: %s.", answer_pattern, exc)
+
+    return (*answer_patterns, *(re.escape(answer) for answer in exact_answers))
+
+
+def convert_qti(resource_file_path: Path) -> List[xml.dom.minidom.Element]:
+    """
+    Convert QTI assessment file into OLX problem nodes.
+    """
+    converter = QtiConverter()
+    return converter.create_nodes(converter.parse(resource_file_path))
+
+
+def convert_qti_file(resource_file_path: Path) -> List[str]:
+    """
+    Convert QTI assessment file into serialized OLX problem nodes.
+
+    It is run in a worker process, so the nodes are given out as XML strings
+    that can be sent back to the parent process.
+    """
+    return [node.toxml() for node in convert_qti(resource_file_path)]
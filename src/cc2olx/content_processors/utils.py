@@ -1,17 +1,21 @@
+import functools
+import logging
 import re
 import xml.dom.minidom
 from pathlib import Path
-from typing import Dict, List, Optional, Type
-
-from django.conf import settings
-from django.utils.module_loading import import_string
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
 
 from cc2olx import filesystem
+from cc2olx.conf import import_string, settings
 from cc2olx.constants import OLX_STATIC_PATH_TEMPLATE
 from cc2olx.content_processors import AbstractContentProcessor
 from cc2olx.enums import CommonCartridgeResourceType
 from cc2olx.models import Cartridge, ResourceFile
 
+logger = logging.getLogger()
+
+SNIPPET_TEMPLATE_SUFFIX = ".html"
+
 
 def parse_web_link_content(resource: dict, cartridge: Cartridge) -> Optional[Dict[str, str]]:
     """
@@ -30,16 +34,83 @@ def parse_web_link_content(resource: dict, cartridge: Cartridge) -> Optional[Dic
     return None
 
 
-def load_content_processor_types() -> List[Type[AbstractContentProcessor]]:
+def load_content_processor_types(
+    resource_types: Optional[Iterable[str]] = None,
+) -> List[Type[AbstractContentProcessor]]:
     """
     Load content processor types.
+
+    If the resource types are provided, only the processors able to process
+    any of them are imported.
+    """
+    processor_paths = settings.CONTENT_PROCESSORS
+
+    if resource_types is not None:
+        resource_types = set(resource_types)
+        processor_paths = [
+            processor_path
+            for processor_path in processor_paths
+            if _can_process_any_resource_type(processor_path, resource_types)
+        ]
+        logger.debug(
+            "Skipped content processors: %s", sorted(set(settings.CONTENT_PROCESSORS).difference(processor_paths))
+        )
+
+    return list(_import_processor_types(tuple(processor_paths)))
+
+
+def _can_process_any_resource_type(processor_path: str, resource_types: Set[str]) -> bool:
+    """
+    Check whether the content processor handles any of the resource types according to the settings.
+    """
+    type_patterns = getattr(settings, "CONTENT_PROCESSOR_RESOURCE_TYPES", {}).get(processor_path)
+    if type_patterns is None:
+        return True
+    return any(re.match(pattern, resource_type) for pattern in type_patterns for resource_type in resource_types)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_processor_types(processor_paths: Tuple[str, ...]) -> Tuple[Type[AbstractContentProcessor], ...]:
+    """
+    Import processor types once per process for every processor list.
     """
-    return [import_string(processor_path) for processor_path in settings.CONTENT_PROCESSORS]
+    return tuple(import_string(processor_path) for processor_path in processor_paths)
+
+
+def render_template(template_name: str, **context: str) -> str:
+    """
+    Render the snippet template from the templates directory with the context.
+    """
+    return load_templates(Path(settings.TEMPLATES_DIR))[template_name].format(**context)
+
+
+@functools.lru_cache(maxsize=None)
+def load_templates(templates_dir: Path) -> Dict[str, str]:
+    """
+    Load all the snippet templates from the directory.
+
+    The templates are read once per process, the mapping keys are the
+    template file names.
+    """
+    return {
+        template_path.name: template_path.read_text(encoding="utf-8")
+        for template_path in templates_dir.glob(f"*{SNIPPET_TEMPLATE_SUFFIX}")
+    }
 
 
 def generate_default_ora_criteria() -> List[xml.dom.minidom.Element]:
     """
     Generate default ORA criteria OLX.
+
+    The criteria are parsed once, the copies of the parsed nodes are given out.
+    """
+    return [criterion.cloneNode(deep=True) for criterion in _parse_default_ora_criteria()]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_default_ora_criteria() -> Tuple[xml.dom.minidom.Element, ...]:
+    """
+    Parse default ORA criteria OLX.
     """
     ideas_criterion = """
         <criterion feedback="optional">
@@ -111,10 +182,10 @@ def generate_default_ora_criteria() -> List[xml.dom.minidom.Element]:
     </criterion>
     """
 
-    return [
+    return (
         xml.dom.minidom.parseString(ideas_criterion).documentElement,
         xml.dom.minidom.parseString(content_criterion).documentElement,
-    ]
+    )
 
 
 class WebContentFile:
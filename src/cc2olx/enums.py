@@ -1,5 +1,5 @@
 from enum import StrEnum
-from typing import Set
+from typing import Optional, Set
 
 
 class CommonCartridgeResourceType(StrEnum):
@@ -37,3 +37,87 @@ class SupportedCustomBlockContentType(StrEnum):
             self.PDF: {".pdf"},
             SupportedCustomBlockContentType.GOOGLE_DOCUMENT: set(),
         }[self]
+
+
+class FileType(StrEnum):
+    """
+    Enumerate file types detected by the file header.
+    """
+
+    BMP = "bmp"
+    GIF = "gif"
+    JPEG = "jpeg"
+    PNG = "png"
+    TIFF = "tiff"
+    WEBP = "webp"
+    PDF = "pdf"
+    AVI = "avi"
+    MP4 = "mp4"
+    QUICKTIME = "mov"
+    WEBM = "webm"
+
+    @property
+    def is_image(self) -> bool:
+        """
+        Whether the file type is an image type.
+        """
+        return self in {self.BMP, self.GIF, self.JPEG, self.PNG, self.TIFF, self.WEBP}
+
+    @property
+    def is_compressed(self) -> bool:
+        """
+        Whether the file content is already compressed, so compressing it again is a waste of time.
+        """
+        return self in {
+            self.GIF,
+            self.JPEG,
+            self.PNG,
+            self.WEBP,
+            self.PDF,
+            self.AVI,
+            self.MP4,
+            self.QUICKTIME,
+            self.WEBM,
+        }
+
+
+class ArchiveCodec(StrEnum):
+    """
+    Enumerate compression codecs of the OLX archives.
+    """
+
+    GZIP = "gzip"
+    XZ = "xz"
+    BZ2 = "bz2"
+    STORE = "store"
+
+    @property
+    def file_extension(self) -> str:
+        """
+        Provide the archive file extension.
+        """
+        return {
+            ArchiveCodec.GZIP: ".tar.gz",
+            ArchiveCodec.XZ: ".tar.xz",
+            ArchiveCodec.BZ2: ".tar.bz2",
+            ArchiveCodec.STORE: ".tar",
+        }[self]
+
+    @property
+    def default_level(self) -> Optional[int]:
+        """
+        Provide the compression level used if it isn't specified.
+        """
+        return {
+            ArchiveCodec.GZIP: 9,
+            ArchiveCodec.XZ: 6,
+            ArchiveCodec.BZ2: 9,
+            ArchiveCodec.STORE: None,
+        }[self]
+
+    @property
+    def levels(self) -> range:
+        """
+        Provide the compression levels the codec supports, the level is ignored by the store codec.
+        """
+        return range(1, 10) if self == ArchiveCodec.BZ2 else range(0, 10)
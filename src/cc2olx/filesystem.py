@@ -1,15 +1,107 @@
+import contextlib
+import functools
+import io
 import logging
+import os
 import tarfile
+import threading
+import time
 import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
 
 from xml.etree import ElementTree
 
+from cc2olx.compression import open_tar_archive
+from cc2olx.enums import ArchiveCodec, FileType
 from cc2olx.utils import clean_file_name
 from cc2olx.xml.cc_xml import CommonCartridgeXmlParser
 
 logger = logging.getLogger()
 
 
+class CommonCartridgeXmlParserPool:
+    """
+    Per-thread pool of configured Common Cartridge XML parsers.
+
+    lxml parsers are not thread-safe, but a parser can be reused for any number
+    of consecutive parses within one thread. So every thread gets its own
+    parser instance that is created on the first use and handed out for all
+    the following ones. If the thread's parser is already in use (a nested
+    parse), a temporary parser is created instead. A parser that failed is
+    dropped, since it may keep the state of the interrupted parse.
+    """
+
+    def __init__(self, **parser_kwargs):
+        self._parser_kwargs = parser_kwargs
+        self._local = threading.local()
+        self._counters_lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+
+    @contextlib.contextmanager
+    def parser(self) -> Iterator[CommonCartridgeXmlParser]:
+        """
+        Provide a parser for exclusive use inside the context.
+        """
+        parser = getattr(self._local, "parser", None)
+
+        if parser is None or self._local.in_use:
+            parser = CommonCartridgeXmlParser(**self._parser_kwargs)
+            self._count(created=1)
+            if getattr(self._local, "parser", None) is None:
+                self._local.parser = parser
+                self._local.in_use = False
+        else:
+            self._count(reused=1)
+
+        is_pooled = parser is self._local.parser
+        if is_pooled:
+            self._local.in_use = True
+
+        try:
+            yield parser
+        except BaseException:
+            if is_pooled:
+                self._local.parser = None
+            raise
+        finally:
+            if is_pooled:
+                self._local.in_use = False
+
+    def _count(self, created: int = 0, reused: int = 0) -> None:
+        """
+        Update the pool usage counters.
+        """
+        with self._counters_lock:
+            self._created += created
+            self._reused += reused
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Provide the pool usage counters.
+        """
+        with self._counters_lock:
+            return {"created": self._created, "reused": self._reused}
+
+    def reset_stats(self) -> None:
+        """
+        Reset the pool usage counters.
+        """
+        with self._counters_lock:
+            self._created = 0
+            self._reused = 0
+
+
+# We are using this parser with recover and encoding options so that we are
+# able to parse malformed xml without much issue. The xml that we are
+# anticipating can even be having certain non-acceptable characters like &nbsp.
+xml_parser_pool = CommonCartridgeXmlParserPool(encoding="utf-8", recover=True, ns_clean=True)
+
+# The number of bytes from the file beginning enough to detect its type.
+FILE_TYPE_HEADER_SIZE = 32
+
+
 def create_directory(directory_path):
     if not directory_path.exists():
         directory_path.mkdir()
@@ -22,18 +114,15 @@ def get_xml_tree(path_src):
     return an xml tree object.
 
     Args:
-        path_src ([str]): File path that needs to be parsed.
+        path_src ([str]): File path or binary file object that needs to be parsed.
 
     Returns:
         ElementTree: This gives back an xml parse tree that can handle different operation
     """
-    logger.info("Loading file %s", path_src)
+    logger.debug("Loading file %s", path_src)
     try:
-        # We are using this parser with recover and encoding options so that we are
-        # able to parse malformed xml without much issue. The xml that we are
-        # anticipating can even be having certain non-acceptable characters like &nbsp.
-        parser = CommonCartridgeXmlParser(encoding="utf-8", recover=True, ns_clean=True)
-        tree = ElementTree.parse(str(path_src), parser=parser)
+        with xml_parser_pool.parser() as parser:
+            tree = ElementTree.parse(path_src if hasattr(path_src, "read") else str(path_src), parser=parser)
         return tree
     except ElementTree.ParseError:
         logger.error("Error while reading xml from %s.", path_src, exc_info=True)
@@ -45,34 +134,146 @@ def unzip_directory(path_src, path_dst_base=None):
 
     path_dst = path_dst_base / path_src.stem
 
-    output_file = zipfile.ZipFile(str(path_src))
-    zip_list = output_file.infolist()
+    with zipfile.ZipFile(str(path_src)) as zip_file:
+        return extract_zip(zip_file, path_dst)
 
-    for zip in zip_list:
-        zip.filename = clean_file_name(zip.filename)
-        output_file.extract(zip, path=str(path_dst))
+
+def extract_zip(zip_file: zipfile.ZipFile, path_dst: Path) -> Path:
+    """
+    Extract the opened zip archive members into the directory cleaning their names.
+    """
+    for zip_info in zip_file.infolist():
+        zip_info.filename = clean_file_name(zip_info.filename)
+        zip_file.extract(zip_info, path=str(path_dst))
 
     return path_dst
 
 
-def add_in_tar_gz(archive_name, inputs):
+def add_in_tar_gz(
+    archive_name,
+    inputs,
+    compression_codec=ArchiveCodec.GZIP,
+    compression_level=None,
+    compression_workers=None,
+):
     """
-    Creates ``.tar.gz`` archive using given list of files.
+    Creates ``.tar.gz`` archive, or the tar archive compressed by another codec, using given list of files.
 
     Args:
-        archive_name: path to resulting archive with name.
+        archive_name: path to resulting archive with name or a writable binary file object.
         inputs: list of tuples like ``('assets', 'static')``,
             where first element is any type of file, and second is
             an alternative name of file in archive.
+        compression_codec: the archive compression codec.
+        compression_level: the codec compression level from 0 to 9, the codec
+            default level is used if not provided.
+        compression_workers: number of threads compressing the gzip archive,
+            it is compressed in a single thread if not provided.
 
     Returns: path to the newly created archive.
     """
-    with tarfile.open(archive_name, "w:gz") as archive:
-        for file, alternative_name in inputs:
-            # Disregard any file that isn't found
-            try:
-                archive.add(file, alternative_name)
-            except FileNotFoundError:
-                logger.error("%s was not found. Skipping", str(file))
+    with contextlib.ExitStack() as stack:
+        if hasattr(archive_name, "write"):
+            archive_file = archive_name
+        else:
+            archive_file = stack.enter_context(open(archive_name, "wb"))
+
+        archive = stack.enter_context(
+            open_tar_archive(archive_file, compression_codec, compression_level, compression_workers)
+        )
+        add_in_tar(archive, inputs)
 
     return archive_name
+
+
+def add_in_tar(archive: tarfile.TarFile, inputs):
+    """
+    Add the list of files to the opened tar archive.
+
+    Args:
+        archive: the tar archive opened for writing.
+        inputs: list of tuples like ``('assets', 'static')``,
+            where first element is any type of file, and second is
+            an alternative name of file in archive.
+    """
+    for file, alternative_name in inputs:
+        # Disregard any file that isn't found
+        try:
+            archive.add(file, alternative_name)
+        except FileNotFoundError:
+            logger.error("%s was not found. Skipping", str(file))
+
+
+def add_data_in_tar(archive: tarfile.TarFile, data: bytes, name: str):
+    """
+    Add the in-memory file content to the opened tar archive.
+    """
+    tar_info = tarfile.TarInfo(name)
+    tar_info.size = len(data)
+    tar_info.mtime = int(time.time())
+    tar_info.mode = 0o644
+    archive.addfile(tar_info, io.BytesIO(data))
+
+
+def detect_file_type(header: bytes) -> Optional[FileType]:
+    """
+    Detect the file type by the magic bytes of its header.
+
+    Args:
+        header (bytes): at least ``FILE_TYPE_HEADER_SIZE`` first bytes of the file.
+
+    Returns:
+        Optional[FileType]: the file type or ``None`` if it isn't recognized.
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return FileType.JPEG
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return FileType.PNG
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return FileType.GIF
+    if header.startswith(b"BM"):
+        return FileType.BMP
+    if header[:4] in (b"II*\x00", b"MM\x00*"):
+        return FileType.TIFF
+    if header.startswith(b"%PDF-"):
+        return FileType.PDF
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return FileType.WEBP
+    if header.startswith(b"RIFF") and header[8:12] == b"AVI ":
+        return FileType.AVI
+    if header[4:8] == b"ftyp":
+        return FileType.QUICKTIME if header[8:12] == b"qt  " else FileType.MP4
+    if header.startswith(b"\x1a\x45\xdf\xa3"):
+        return FileType.WEBM
+    return None
+
+
+def sniff_file_type(path: Union[str, Path]) -> Optional[FileType]:
+    """
+    Detect the type of the file reading only its header.
+
+    The results are cached per path, the file modification time and size are
+    part of the cache key, so a replaced file is sniffed again.
+    """
+    stat_result = os.stat(path)
+    return _sniff_file_type(str(path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@functools.lru_cache(maxsize=65536)
+def _sniff_file_type(path: str, mtime_ns: int, size: int) -> Optional[FileType]:
+    """
+    Detect the type of the file with the provided stat data.
+    """
+    with open(path, "rb") as file:
+        return detect_file_type(file.read(FILE_TYPE_HEADER_SIZE))
+
+
+def sniff_zip_member_file_type(
+    zip_file: zipfile.ZipFile,
+    member: Union[str, zipfile.ZipInfo],
+) -> Optional[FileType]:
+    """
+    Detect the type of the zip archive member decompressing only its header.
+    """
+    with zip_file.open(member) as member_file:
+        return detect_file_type(member_file.read(FILE_TYPE_HEADER_SIZE))
@@ -0,0 +1,184 @@
+import csv
+import json
+import logging
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+from urllib.parse import urlparse
+
+import attrs
+
+from cc2olx.enums import CommonCartridgeResourceType
+from cc2olx.models import Cartridge, ResourceFile
+
+logger = logging.getLogger()
+
+INVENTORY_FORMAT_JSON = "json"
+INVENTORY_FORMAT_CSV = "csv"
+
+INVENTORY_STATUS_OK = "ok"
+INVENTORY_STATUS_ERROR = "error"
+
+WEB_RESOURCES_DIR = "web_resources/"
+EXTERNAL_TOOL_CONTENT_TYPE = "ContextExternalTool"
+
+
+@attrs.define
+class CartridgeInventory:
+    """
+    Provide the content inventory of the cartridge built from its zip directory and manifest.
+    """
+
+    name: str
+    status: str = INVENTORY_STATUS_OK
+    error: Optional[str] = None
+    is_canvas_flavor: bool = False
+    version: Optional[str] = None
+    title: Optional[str] = None
+    files: int = 0
+    compressed_bytes: int = 0
+    uncompressed_bytes: int = 0
+    static_bytes: int = 0
+    qti_bytes: int = 0
+    resources: int = 0
+    resource_types: Dict[str, int] = attrs.field(factory=dict)
+    course_resource_types: Dict[str, int] = attrs.field(factory=dict)
+    qti_assessments: int = 0
+    lti_links: int = 0
+    lti_tools: Dict[str, int] = attrs.field(factory=dict)
+    missing_resources: int = 0
+    not_imported_resources: int = 0
+
+
+def analyze_cartridge(input_file: Path) -> CartridgeInventory:
+    """
+    Build the cartridge inventory without extracting the cartridge or generating OLX.
+
+    Only the zip central directory, the manifest and the Canvas module meta
+    are read. The missing and not imported resources are the course
+    components the conversion is expected to replace with the fallback content.
+    """
+    inventory = CartridgeInventory(input_file.stem)
+
+    try:
+        cartridge = Cartridge(input_file, workspace=None)
+        with cartridge.cartridge:
+            cartridge.load_manifest()
+            cartridge.normalize()
+            _collect_inventory(inventory, cartridge)
+    except Exception as exc:
+        logger.exception("Error while analyzing %s file", input_file)
+        inventory.status = INVENTORY_STATUS_ERROR
+        inventory.error = str(exc)
+
+    return inventory
+
+
+def _collect_inventory(inventory: CartridgeInventory, cartridge: Cartridge) -> None:
+    members = {member.filename: member for member in cartridge.cartridge.infolist() if not member.is_dir()}
+
+    inventory.is_canvas_flavor = cartridge.is_canvas_flavor
+    inventory.version = cartridge.version
+    inventory.title = cartridge.get_title()
+    inventory.files = len(members)
+    inventory.compressed_bytes = sum(member.compress_size for member in members.values())
+    inventory.uncompressed_bytes = sum(member.file_size for member in members.values())
+    inventory.static_bytes = sum(
+        member.file_size for name, member in members.items() if name.startswith(WEB_RESOURCES_DIR)
+    )
+
+    inventory.resources = len(cartridge.resources)
+    inventory.resource_types = dict(cartridge.get_resource_type_histogram())
+
+    qti_resources = [
+        resource
+        for resource in cartridge.resources
+        if re.match(CommonCartridgeResourceType.QTI_ASSESSMENT, resource.get("type", ""))
+    ]
+    inventory.qti_assessments = len(qti_resources)
+    inventory.qti_bytes = sum(
+        members[child.href].file_size
+        for resource in qti_resources
+        for child in resource.get("children", [])
+        if isinstance(child, ResourceFile) and child.href in members
+    )
+    inventory.lti_links = sum(
+        bool(re.match(CommonCartridgeResourceType.LTI_LINK, resource.get("type", "")))
+        for resource in cartridge.resources
+    )
+    if cartridge.is_canvas_flavor and cartridge.module_meta:
+        inventory.lti_tools = dict(
+            Counter(
+                urlparse(item["url"]).netloc
+                for item in cartridge.module_meta.items.values()
+                if item["content_type"] == EXTERNAL_TOOL_CONTENT_TYPE and item["url"]
+            )
+        )
+
+    course_resource_types = Counter()
+    for component in _iterate_course_components(cartridge.normalized):
+        resource = cartridge.define_resource(component.get("identifierref"))
+        if resource is None:
+            inventory.missing_resources += 1
+            continue
+
+        resource_type = resource.get("type", "")
+        course_resource_types[resource_type] += 1
+        if not _is_known_resource_type(resource_type):
+            inventory.not_imported_resources += 1
+    inventory.course_resource_types = dict(course_resource_types)
+
+
+def _iterate_course_components(normalized: Optional[dict]) -> Iterator[dict]:
+    """
+    Iterate over the normalized course components the OLX nodes are created from.
+    """
+    for section in (normalized or {}).get("children", []):
+        for subsection in section.get("children", []):
+            for unit in subsection.get("children", []):
+                yield from unit.get("children", [])
+
+
+def _is_known_resource_type(resource_type: str) -> bool:
+    return any(re.match(type_pattern, resource_type) for type_pattern in CommonCartridgeResourceType)
+
+
+def analyze_cartridges(input_files: Iterable[Path], workers: Optional[int] = None) -> Iterator[CartridgeInventory]:
+    """
+    Analyze the cartridges in order, in parallel processes if the workers are requested.
+    """
+    input_files = sorted(input_files)
+
+    if not workers:
+        yield from map(analyze_cartridge, input_files)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(analyze_cartridge, input_files, chunksize=16)
+
+
+def write_inventory(
+    inventories: Iterable[CartridgeInventory],
+    stream: TextIO,
+    inventory_format: str = INVENTORY_FORMAT_JSON,
+) -> None:
+    """
+    Stream the cartridge inventories as JSON lines or CSV rows, writing every cartridge as soon as it is analyzed.
+    """
+    if inventory_format == INVENTORY_FORMAT_CSV:
+        writer = csv.DictWriter(stream, fieldnames=[field.name for field in attrs.fields(CartridgeInventory)])
+        writer.writeheader()
+        for inventory in inventories:
+            writer.writerow(
+                {
+                    name: json.dumps(value) if isinstance(value, dict) else value
+                    for name, value in attrs.asdict(inventory).items()
+                }
+            )
+            stream.flush()
+    else:
+        for inventory in inventories:
+            stream.write(json.dumps(attrs.asdict(inventory)) + "\n")
+            stream.flush()
@@ -1,4 +1,8 @@
 import csv
+import functools
+import os
+
+LINK_MAP_CACHE_SIZE = 16
 
 
 class LinkFileReader:
@@ -33,12 +37,8 @@ class LinkFileReader:
         Returns:
             [Dict[str, Dict]]: Map of link with the corresponding row
         """
-        link_map = {}
-        rows = self._read_csv_file()
-        for row in rows:
-            link = row[self.link_header]
-            link_map[link] = row
-        return link_map
+        stat_result = os.stat(self.file_path)
+        return dict(_read_link_map(str(self.file_path), self.link_header, stat_result.st_mtime_ns, stat_result.st_size))
 
     def _read_csv_file(self):
         """
@@ -47,7 +47,23 @@ class LinkFileReader:
         Returns:
             [List[Dict]]: List of dictionary with each header
         """
-        with open(self.file_path, encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = [row for row in reader]
-        return rows
+        return _read_csv_file(self.file_path)
+
+
+def _read_csv_file(file_path):
+    with open(file_path, encoding="utf-8") as csvfile:
+        reader = csv.DictReader(csvfile)
+        rows = [row for row in reader]
+    return rows
+
+
+@functools.lru_cache(maxsize=LINK_MAP_CACHE_SIZE)
+def _read_link_map(file_path, link_header, mtime_ns, size):
+    """
+    Read the link map of the file with the provided stat data.
+
+    The link map is cached, so a long-running process reads the same link
+    file once, the file modification time and size are part of the cache key
+    to read a changed file again.
+    """
+    return {row[link_header]: row for row in _read_csv_file(file_path)}
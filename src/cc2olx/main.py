@@ -1,18 +1,33 @@
+import functools
+import itertools
 import logging
 import os
 import shutil
 import sys
 import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 
-import django
-from django.conf import settings
-
 from cc2olx import filesystem, olx
-from cc2olx.cli import parse_args, RESULT_TYPE_FOLDER, RESULT_TYPE_ZIP
+from cc2olx.claims import JOB_STATUS_ERROR, JOB_STATUS_OK, ClaimLostError, JobClaims, get_default_node_id
+from cc2olx.cli import parse_args
+from cc2olx.conf import settings
 from cc2olx.constants import OLX_STATIC_DIR
+from cc2olx.enums import ArchiveCodec
+from cc2olx.inventory import analyze_cartridges, write_inventory
+from cc2olx.metrics import CONVERSION_STATUS_ERROR, BatchMetrics, ByteCountingWriter, CartridgeMetrics
 from cc2olx.models import Cartridge
+from cc2olx.output import FolderOutput, GuardedOutput, create_output
 from cc2olx.parser import parse_options
+from cc2olx.scheduler import (
+    BatchScheduler,
+    estimate_cartridge_cost,
+    get_default_disk_budget,
+    get_default_memory_budget,
+)
+
+logger = logging.getLogger()
 
 
 def convert_one_file(
@@ -22,7 +37,21 @@ def convert_one_file(
     passport_file=None,
     relative_links_source=None,
     content_types_with_custom_blocks=None,
+    qti_workers=None,
+    output=None,
+    compression_codec=ArchiveCodec.GZIP,
+    compression_level=None,
+    compression_workers=None,
+    metrics=None,
 ):
+    """
+    Convert the Common Cartridge file to the OLX tar.gz archive, or the tar archive compressed by another codec.
+
+    The archive is written into the workspace, or to the output if it is provided.
+    The archive size and the export counters are collected into the metrics if they are provided.
+    Returns the archive path in the workspace, or None if the archive is written to the output,
+    because the output may not keep it as a file, e.g. the zip output.
+    """
     content_types_with_custom_blocks = content_types_with_custom_blocks or []
 
     filesystem.create_directory(workspace)
@@ -37,6 +66,7 @@ def convert_one_file(
         passport_file,
         relative_links_source,
         content_types_with_custom_blocks,
+        qti_workers,
     )
     olx_filename = cartridge.directory.parent / (cartridge.directory.name + "-course.xml")
     policy_filename = cartridge.directory.parent / "policy.json"
@@ -47,13 +77,47 @@ def convert_one_file(
     with open(str(policy_filename), "w", encoding="utf-8") as policy:
         policy.write(olx_export.policy())
 
-    tgz_filename = (workspace / cartridge.directory.name).with_suffix(".tar.gz")
+    tgz_filename = (workspace / cartridge.directory.name).with_suffix(ArchiveCodec(compression_codec).file_extension)
 
     file_list = [
         (str(olx_filename), "course.xml"),
         (str(policy_filename), "policies/course/policy.json"),
-        (str(cartridge.directory / "web_resources"), "/{}/".format(OLX_STATIC_DIR)),
     ]
+    file_list += get_static_file_list(cartridge)
+
+    if output is None:
+        filesystem.add_in_tar_gz(
+            str(tgz_filename), file_list, compression_codec, compression_level, compression_workers
+        )
+        bytes_out = tgz_filename.stat().st_size
+    else:
+        with output.open_file(tgz_filename.name) as tgz_file:
+            counting_file = ByteCountingWriter(tgz_file)
+            filesystem.add_in_tar_gz(
+                counting_file, file_list, compression_codec, compression_level, compression_workers
+            )
+        bytes_out = counting_file.bytes_written
+        tgz_filename = None
+
+    if metrics is not None:
+        metrics.bytes_out = bytes_out
+        metrics.collect_export(olx_export)
+
+    return tgz_filename
+
+
+def get_input_root(input_files):
+    """
+    Provide the closest directory containing every input cartridge.
+    """
+    return Path(os.path.commonpath([input_file.parent for input_file in input_files])) if input_files else None
+
+
+def get_static_file_list(cartridge):
+    """
+    Provide the static files of the extracted cartridge with their paths in the OLX archive.
+    """
+    file_list = [(str(cartridge.directory / "web_resources"), "/{}/".format(OLX_STATIC_DIR))]
 
     # Add static files that are outside of web_resources directory
     file_list += [
@@ -61,12 +125,10 @@ def convert_one_file(
         for olx_static_path, original_filepath in cartridge.olx_to_original_static_file_paths.extra.items()
     ]
 
-    filesystem.add_in_tar_gz(str(tgz_filename), file_list)
+    return file_list
 
 
 def main():
-    initialize_django()
-
     args = parse_args()
     options = parse_options(args)
 
@@ -75,45 +137,238 @@ def main():
     passport_file = options["passport_file"]
     relative_links_source = options["relative_links_source"]
     content_types_with_custom_blocks = options["content_types_with_custom_blocks"]
+    qti_workers = options["qti_workers"]
 
     # setup logger
     logging.basicConfig(level=options["log_level"], format=settings.LOG_FORMAT)
-    logger = logging.getLogger()
 
-    with tempfile.TemporaryDirectory() as tmpdirname:
+    if options["analyze"]:
+        inventories = analyze_cartridges(options["input_files"], options["batch_workers"])
+        write_inventory(inventories, sys.stdout, options["analyze_format"])
+        return 0
+
+    if options["claims_directory"]:
+        # The output folder is shared by the nodes, so its content mustn't be replaced.
+        options["node_id"] = options["node_id"] or get_default_node_id()
+        output_context = FolderOutput(workspace, clean=False, partial_tag=options["node_id"])
+    else:
+        output_context = create_output(options["output_format"], workspace)
+
+    batch_metrics = BatchMetrics()
+
+    with tempfile.TemporaryDirectory() as tmpdirname, output_context as output:
         temp_workspace = Path(tmpdirname) / workspace.stem
 
-        for input_file in options["input_files"]:
+        if options["claims_directory"]:
+            convert_claimed(options, output, temp_workspace, batch_metrics)
+        elif options["batch_workers"]:
+            convert_batch(options, output, Path(tmpdirname), batch_metrics)
+        else:
+            input_root = get_input_root(options["input_files"])
+            for input_file in options["input_files"]:
+                cartridge_metrics = CartridgeMetrics.for_file(input_file, input_root)
+                batch_metrics.add(cartridge_metrics)
+                try:
+                    with cartridge_metrics.measure():
+                        convert_one_file(
+                            input_file,
+                            temp_workspace,
+                            link_file,
+                            passport_file,
+                            relative_links_source,
+                            content_types_with_custom_blocks,
+                            qti_workers,
+                            output,
+                            options["compression_codec"],
+                            options["compression_level"],
+                            options["compression_workers"],
+                            cartridge_metrics,
+                        )
+                except Exception:
+                    logger.exception("Error while converting %s file", input_file)
+                finally:
+                    release_intermediates(temp_workspace, output, options["keep_intermediates"])
+
+    batch_metrics.finish()
+    if options["metrics_file"]:
+        batch_metrics.write(options["metrics_file"], options["metrics_format"])
+
+    logger.debug("XML parser pool usage: %s", filesystem.xml_parser_pool.stats())
+    logger.info("Conversion completed")
+
+    return 0
+
+
+def convert_batch(options, output, scratch_directory, batch_metrics=None):
+    """
+    Convert the cartridges in parallel processes scheduled within the memory and the disk budgets.
+
+    Every process converts the cartridge into its own scratch workspace, the
+    archive is moved to the output and the scratch workspace is released as
+    soon as the process is done.
+    """
+    memory_budget = _megabytes_to_bytes(options["memory_budget"]) or get_default_memory_budget()
+    disk_budget = _megabytes_to_bytes(options["disk_budget"]) or get_default_disk_budget(scratch_directory)
+    scheduler = BatchScheduler(
+        [estimate_cartridge_cost(input_file) for input_file in options["input_files"]],
+        options["batch_workers"],
+        memory_budget,
+        disk_budget,
+    )
+    logger.info(
+        "Converting %d cartridges in %d processes within %s MB of memory and %s MB of scratch disk",
+        len(options["input_files"]),
+        options["batch_workers"],
+        memory_budget and memory_budget // 1024 // 1024,
+        disk_budget // 1024 // 1024,
+    )
+
+    input_root = get_input_root(options["input_files"])
+    running = {}
+    job_indexes = itertools.count()
+    initializer = functools.partial(logging.basicConfig, level=options["log_level"], format=settings.LOG_FORMAT)
+
+    with ProcessPoolExecutor(max_workers=options["batch_workers"], initializer=initializer) as executor:
+        while scheduler.has_pending or running:
+            for cost in scheduler.admit():
+                job_workspace = scratch_directory / f"job-{next(job_indexes)}" / options["workspace"].stem
+                future = executor.submit(convert_in_scratch, cost.path, job_workspace, options, input_root)
+                running[future] = (cost, job_workspace)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                cost, job_workspace = running.pop(future)
+                scheduler.release(cost)
+
+                try:
+                    tgz_filename, cartridge_metrics = future.result()
+                    output.add_file(tgz_filename, tgz_filename.name)
+                    tgz_filename.unlink(missing_ok=True)
+                except Exception:
+                    logger.exception("Error while converting %s file", cost.path)
+                    cartridge_metrics = CartridgeMetrics.for_file(cost.path, input_root)
+                    cartridge_metrics.status = CONVERSION_STATUS_ERROR
+                finally:
+                    release_intermediates(job_workspace, output, options["keep_intermediates"])
+                    shutil.rmtree(str(job_workspace.parent), ignore_errors=True)
+
+                if batch_metrics is not None:
+                    batch_metrics.add(cartridge_metrics)
+
+
+def convert_claimed(options, output, temp_workspace, batch_metrics=None):
+    """
+    Convert the cartridges claimed by this node until every cartridge of the batch is finished by any node.
+
+    The node keeps polling the claims after it runs out of the unclaimed
+    cartridges, so the cartridges abandoned by dead nodes are claimed again.
+    The archive of a cartridge whose claim is lost is discarded, it is left to
+    the node which took the claim over.
+    """
+    input_files = sorted(options["input_files"])
+    input_root = get_input_root(input_files)
+
+    with JobClaims(options["claims_directory"], options["node_id"], options["claim_timeout"], input_root) as claims:
+        logger.info("Node %s joined the batch of %d cartridges", claims.node_id, len(input_files))
+
+        pending_files = input_files
+        while True:
+            # One listing of the claims directory per poll, the finished cartridges are dropped for good.
+            claims.refresh()
+            if not (pending_files := [input_file for input_file in pending_files if not claims.is_done(input_file)]):
+                break
+
+            input_file = next((input_file for input_file in pending_files if claims.claim(input_file)), None)
+            if input_file is None:
+                # The rest of the cartridges are being converted by other nodes.
+                time.sleep(claims.poll_interval)
+                continue
+
+            status = JOB_STATUS_OK
+            cartridge_metrics = CartridgeMetrics.for_file(input_file, input_root)
+            if batch_metrics is not None:
+                batch_metrics.add(cartridge_metrics)
+            claimed_output = GuardedOutput(
+                output,
+                functools.partial(claims.check_not_lost, input_file),
+                functools.partial(claims.ensure_claimed, input_file),
+            )
             try:
-                convert_one_file(
-                    input_file,
-                    temp_workspace,
-                    link_file,
-                    passport_file,
-                    relative_links_source,
-                    content_types_with_custom_blocks,
-                )
+                with cartridge_metrics.measure():
+                    convert_one_file(
+                        input_file,
+                        temp_workspace,
+                        options["link_file"],
+                        options["passport_file"],
+                        options["relative_links_source"],
+                        options["content_types_with_custom_blocks"],
+                        options["qti_workers"],
+                        claimed_output,
+                        options["compression_codec"],
+                        options["compression_level"],
+                        options["compression_workers"],
+                        cartridge_metrics,
+                    )
+            except ClaimLostError:
+                logger.warning("The conversion of %s is aborted, its claim was taken over by another node", input_file)
+                status = None
             except Exception:
                 logger.exception("Error while converting %s file", input_file)
+                status = JOB_STATUS_ERROR
+            finally:
+                release_intermediates(temp_workspace, output, options["keep_intermediates"])
+                if status is None:
+                    claims.release(input_file)
+                else:
+                    claims.complete(input_file, status)
 
-        if options["output_format"] == RESULT_TYPE_FOLDER:
-            shutil.rmtree(str(workspace), ignore_errors=True)
-            shutil.copytree(str(temp_workspace), str(workspace))
 
-        if options["output_format"] == RESULT_TYPE_ZIP:
-            shutil.make_archive(str(workspace), "zip", str(temp_workspace))
+def convert_in_scratch(input_file, workspace, options, input_root=None):
+    """
+    Convert the Common Cartridge file into the scratch workspace in the batch conversion process.
 
-    logger.info("Conversion completed")
+    Returns the archive path with the conversion metrics.
+    """
+    workspace.parent.mkdir(parents=True, exist_ok=True)
+    cartridge_metrics = CartridgeMetrics.for_file(input_file, input_root)
 
-    return 0
+    with cartridge_metrics.measure():
+        tgz_filename = convert_one_file(
+            input_file,
+            workspace,
+            options["link_file"],
+            options["passport_file"],
+            options["relative_links_source"],
+            options["content_types_with_custom_blocks"],
+            options["qti_workers"],
+            compression_codec=options["compression_codec"],
+            compression_level=options["compression_level"],
+            compression_workers=options["compression_workers"],
+            metrics=cartridge_metrics,
+        )
+
+    return tgz_filename, cartridge_metrics
+
+
+def _megabytes_to_bytes(megabytes):
+    return megabytes * 1024 * 1024 if megabytes else None
 
 
-def initialize_django():
+def release_intermediates(temp_workspace, output, keep_intermediates=False):
     """
-    Initialize the Django package.
+    Free the scratch space taken by the cartridge conversion.
+
+    The intermediate files are moved to the output if they are kept, so the
+    scratch space never holds more than one cartridge.
     """
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cc2olx.settings")
-    django.setup()
+    if not temp_workspace.exists():
+        return
+
+    if keep_intermediates:
+        output.add_tree(temp_workspace)
+
+    shutil.rmtree(str(temp_workspace), ignore_errors=True)
 
 
 if __name__ == "__main__":
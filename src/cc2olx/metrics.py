@@ -0,0 +1,260 @@
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+import attrs
+
+try:
+    import resource
+except ImportError:  # pragma: no cover, the module is not available on Windows
+    resource = None
+
+METRICS_FORMAT_JSON = "json"
+METRICS_FORMAT_PROMETHEUS = "prometheus"
+METRICS_PREFIX = "cc2olx"
+CONVERSION_STATUS_OK = "ok"
+CONVERSION_STATUS_ERROR = "error"
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Provide the peak resident set size of the current process in bytes.
+    """
+    if resource is None:
+        return None
+    # Linux reports the peak RSS in kilobytes, macOS in bytes.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if os.uname().sysname == "Darwin" else peak_rss * 1024
+
+
+class ByteCountingWriter:
+    """
+    Count the bytes written to the binary file object.
+    """
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        self._fileobj = fileobj
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        self.bytes_written += len(data)
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+
+@attrs.define
+class CartridgeMetrics:
+    """
+    Provide the metrics of the cartridge conversion.
+
+    The `path` is the cartridge path relative to the batch input root, it
+    tells apart the cartridges with the same name in different directories.
+
+    The `process_peak_rss` is the peak RSS of the converting process when the
+    conversion is finished. It isn't the memory used by this cartridge alone:
+    the peak is kept by the OS for the whole process lifetime, so it includes
+    the cartridges converted earlier by the same process.
+    """
+
+    name: str
+    path: str = ""
+    status: str = CONVERSION_STATUS_OK
+    duration: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    resource_types: Dict[str, int] = attrs.field(factory=dict)
+    fallback_nodes: int = 0
+    skipped_processors: Dict[str, int] = attrs.field(factory=dict)
+    skipped_post_processors: Dict[str, int] = attrs.field(factory=dict)
+    process_peak_rss: Optional[int] = None
+
+    @classmethod
+    def for_file(cls, input_file: Path, input_root: Optional[Path] = None) -> "CartridgeMetrics":
+        """
+        Create the metrics of the cartridge file conversion, the path is relative to the input root if it's provided.
+        """
+        path = input_file.relative_to(input_root) if input_root else input_file
+        return cls(
+            input_file.stem,
+            path.as_posix(),
+            bytes_in=input_file.stat().st_size if input_file.exists() else 0,
+        )
+
+    @contextlib.contextmanager
+    def measure(self) -> Iterator["CartridgeMetrics"]:
+        """
+        Measure the duration and the process peak RSS of the conversion, mark the metrics failed if it raises.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield self
+        except BaseException:
+            self.status = CONVERSION_STATUS_ERROR
+            raise
+        finally:
+            self.duration = round(time.perf_counter() - started_at, 3)
+            self.process_peak_rss = get_peak_rss()
+
+    def collect_export(self, olx_export) -> None:
+        """
+        Collect the counters of the finished OLX export.
+        """
+        self.resource_types = dict(olx_export.cartridge.get_resource_type_histogram())
+        self.fallback_nodes = olx_export.stats["fallback_nodes"]
+        self.skipped_processors = dict(olx_export.skipped_processors)
+        self.skipped_post_processors = dict(olx_export.skipped_post_processors)
+
+
+@attrs.define
+class BatchMetrics:
+    """
+    Collect the metrics of the batch conversion and export them.
+    """
+
+    cartridges: List[CartridgeMetrics] = attrs.field(factory=list)
+    started_at: float = attrs.field(factory=time.time)
+    _started_counter: float = attrs.field(factory=time.perf_counter)
+    duration: float = 0.0
+
+    def add(self, cartridge_metrics: CartridgeMetrics) -> None:
+        self.cartridges.append(cartridge_metrics)
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self._started_counter
+
+    def summary(self) -> dict:
+        """
+        Provide the batch totals with the throughput.
+        """
+        bytes_in = sum(cartridge.bytes_in for cartridge in self.cartridges)
+        peak_rss_values = [
+            cartridge.process_peak_rss for cartridge in self.cartridges if cartridge.process_peak_rss is not None
+        ]
+
+        return {
+            "started_at": self.started_at,
+            "duration": round(self.duration, 3),
+            "cartridges": len(self.cartridges),
+            "failed_cartridges": sum(cartridge.status != CONVERSION_STATUS_OK for cartridge in self.cartridges),
+            "bytes_in": bytes_in,
+            "bytes_out": sum(cartridge.bytes_out for cartridge in self.cartridges),
+            "fallback_nodes": sum(cartridge.fallback_nodes for cartridge in self.cartridges),
+            "skipped_processors": sum(sum(cartridge.skipped_processors.values()) for cartridge in self.cartridges),
+            "skipped_post_processors": sum(
+                sum(cartridge.skipped_post_processors.values()) for cartridge in self.cartridges
+            ),
+            "process_peak_rss": max(peak_rss_values, default=None),
+            "cartridges_per_second": round(len(self.cartridges) / self.duration, 3) if self.duration else None,
+            "bytes_in_per_second": round(bytes_in / self.duration) if self.duration else None,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"batch": self.summary(), "cartridges": [attrs.asdict(cartridge) for cartridge in self.cartridges]},
+            indent=2,
+        )
+
+    def to_prometheus(self) -> str:
+        """
+        Provide the metrics in the Prometheus text exposition format for the node exporter textfile collector.
+
+        The cartridge series are labeled by the cartridge path, the names aren't unique within the batch.
+        """
+        metrics = _PrometheusMetrics()
+
+        for cartridge in self.cartridges:
+            labels = {"path": cartridge.path, "cartridge": cartridge.name, "status": cartridge.status}
+            metrics.add("cartridge_duration_seconds", "Cartridge conversion duration.", cartridge.duration, labels)
+            metrics.add("cartridge_bytes_in", "Cartridge file size.", cartridge.bytes_in, labels)
+            metrics.add("cartridge_bytes_out", "OLX archive size.", cartridge.bytes_out, labels)
+            metrics.add(
+                "cartridge_fallback_nodes", "OLX nodes with the missing content.", cartridge.fallback_nodes, labels
+            )
+            metrics.add(
+                "cartridge_process_peak_rss_bytes",
+                "Converting process peak RSS, including the cartridges converted earlier by the process.",
+                cartridge.process_peak_rss,
+                labels,
+            )
+            for resource_type, count in cartridge.resource_types.items():
+                metrics.add("cartridge_resources", "Cartridge resources.", count, {**labels, "type": resource_type})
+            for processor, count in cartridge.skipped_processors.items():
+                metrics.add(
+                    "cartridge_skipped_processors",
+                    "Failed content processor calls.",
+                    count,
+                    {**labels, "processor": processor},
+                )
+            for processor, count in cartridge.skipped_post_processors.items():
+                metrics.add(
+                    "cartridge_skipped_post_processors",
+                    "Failed content post processor calls.",
+                    count,
+                    {**labels, "processor": processor},
+                )
+
+        summary = self.summary()
+        metrics.add("batch_duration_seconds", "Batch conversion duration.", summary["duration"])
+        metrics.add("batch_cartridges", "Converted cartridges.", summary["cartridges"])
+        metrics.add("batch_failed_cartridges", "Cartridges failed to convert.", summary["failed_cartridges"])
+        metrics.add("batch_bytes_in", "Total size of the cartridges.", summary["bytes_in"])
+        metrics.add("batch_bytes_out", "Total size of the OLX archives.", summary["bytes_out"])
+        metrics.add("batch_fallback_nodes", "OLX nodes with the missing content.", summary["fallback_nodes"])
+        metrics.add("batch_skipped_processors", "Failed content processor calls.", summary["skipped_processors"])
+        metrics.add(
+            "batch_skipped_post_processors", "Failed content post processor calls.", summary["skipped_post_processors"]
+        )
+        metrics.add(
+            "batch_process_peak_rss_bytes", "Peak RSS of the converting processes.", summary["process_peak_rss"]
+        )
+        metrics.add("batch_cartridges_per_second", "Cartridges converted per second.", summary["cartridges_per_second"])
+        metrics.add(
+            "batch_bytes_in_per_second", "Cartridge bytes converted per second.", summary["bytes_in_per_second"]
+        )
+
+        return metrics.render()
+
+    def write(self, path: Path, metrics_format: str = METRICS_FORMAT_JSON) -> None:
+        """
+        Write the metrics file, atomically, so a collector never reads a partial file.
+        """
+        content = self.to_prometheus() if metrics_format == METRICS_FORMAT_PROMETHEUS else self.to_json()
+        partial_path = path.with_name(f"{path.name}.{os.getpid()}.partial")
+        partial_path.write_text(content, encoding="utf-8")
+        os.replace(partial_path, path)
+
+
+class _PrometheusMetrics:
+    """
+    Render the gauges grouped by the metric name.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, dict] = {}
+
+    def add(self, name: str, description: str, value, labels: Optional[Dict[str, str]] = None) -> None:
+        if value is None:
+            return
+        metric = self._metrics.setdefault(f"{METRICS_PREFIX}_{name}", {"description": description, "samples": []})
+        metric["samples"].append((labels or {}, value))
+
+    def render(self) -> str:
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric['description']}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in metric["samples"]:
+                rendered_labels = ",".join(
+                    f'{label_name}="{_escape_label_value(label_value)}"' for label_name, label_value in labels.items()
+                )
+                lines.append(f"{name}{{{rendered_labels}}} {value}" if rendered_labels else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
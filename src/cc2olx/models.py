@@ -3,19 +3,21 @@ import logging
 import os.path
 import re
 import zipfile
-from collections import ChainMap
+from collections import ChainMap, Counter
 from pathlib import Path
 from textwrap import dedent
 from types import MappingProxyType
 from typing import Dict, Optional
 
 from cc2olx import filesystem
+from cc2olx.enums import FileType
 from cc2olx.external.canvas import ModuleMeta
 from cc2olx.utils import clean_file_name
 
 logger = logging.getLogger()
 
 MANIFEST = "imsmanifest.xml"
+DEFAULT_CARTRIDGE_NAME = "course"
 
 # canvas-cc course settings
 COURSE_SETTINGS_DIR = "course_settings"
@@ -92,8 +94,17 @@ class OlxToOriginalStaticFilePaths:
 
 
 class Cartridge:
-    def __init__(self, cartridge_file, workspace):
-        self.cartridge = zipfile.ZipFile(str(cartridge_file))
+    def __init__(self, cartridge_file, workspace, name=None):
+        """
+        Args:
+            cartridge_file: the path to the cartridge or its binary file object.
+            workspace: the directory to extract the cartridge into.
+            name: the name of the extracted cartridge directory, the cartridge
+                file name without the extension is used by default.
+        """
+        is_file_object = hasattr(cartridge_file, "read")
+        self.cartridge = zipfile.ZipFile(cartridge_file if is_file_object else str(cartridge_file))
+        self.name = name or (DEFAULT_CARTRIDGE_NAME if is_file_object else Path(cartridge_file).stem)
         self.metadata = None
         self.resources = None
         self.resources_by_id = {}
@@ -110,9 +121,11 @@ class Cartridge:
         self.olx_to_original_static_file_paths = OlxToOriginalStaticFilePaths()
 
         self.workspace = workspace
+        self._zip_members = None
+        self._resource_file_types = {}
 
     def __repr__(self):
-        filename = os.path.basename(self.file_path)
+        filename = os.path.basename(self.file_path) if isinstance(self.file_path, (str, os.PathLike)) else self.name
         text = '<{_class} version="{version}" file="{filename}" />'.format(
             _class=type(self).__name__,
             version=self.version,
@@ -350,6 +363,25 @@ class Cartridge:
             self.module_meta = self._load_module_meta()
 
         tree = filesystem.get_xml_tree(manifest)
+        return self._load_manifest_tree(tree)
+
+    def load_manifest(self):
+        """
+        Load the manifest and the Canvas module meta reading them from the cartridge without extracting it.
+        """
+        member_names = set(self.cartridge.namelist())
+        module_meta_name = f"{COURSE_SETTINGS_DIR}/{MODULE_META}"
+
+        self.is_canvas_flavor = f"{COURSE_SETTINGS_DIR}/{CANVAS_REPORT}" in member_names
+        if self.is_canvas_flavor and module_meta_name in member_names:
+            with self.cartridge.open(module_meta_name) as module_meta_file:
+                self.module_meta = ModuleMeta(module_meta_file)
+
+        with self.cartridge.open(MANIFEST) as manifest_file:
+            tree = filesystem.get_xml_tree(manifest_file)
+        return self._load_manifest_tree(tree)
+
+    def _load_manifest_tree(self, tree):
         root = tree.getroot()
         self._update_namespaces(root)
         self._clean_manifest(root)
@@ -365,6 +397,12 @@ class Cartridge:
         self.version = self.metadata.get("schema", {}).get("version", self.version)
         return data
 
+    def get_resource_type_histogram(self) -> Counter:
+        """
+        Count the resources of every type in the loaded manifest.
+        """
+        return Counter(resource["type"] for resource in self.resources or [])
+
     def get_course_xml(self):
         text = '<course org="{org}" course="{number}" url_name="{run}" />'.format(
             org=self.get_course_org(),
@@ -418,8 +456,30 @@ class Cartridge:
         """
         return self.directory / file_name
 
+    def sniff_resource_file_type(self, file_name: str) -> Optional[FileType]:
+        """
+        Detect the type of the resource file reading only its header from the cartridge zip member.
+
+        The file doesn't have to be extracted, the extracted file is sniffed
+        only if the cartridge has no member with the name. The results are
+        cached per resource file name.
+        """
+        if file_name not in self._resource_file_types:
+            if self._zip_members is None:
+                # The member names are cleaned on extraction like the manifest hrefs.
+                self._zip_members = {zip_info.filename: zip_info for zip_info in self.cartridge.infolist()}
+
+            zip_info = self._zip_members.get(file_name)
+            if zip_info is not None:
+                file_type = filesystem.sniff_zip_member_file_type(self.cartridge, zip_info)
+            else:
+                file_type = filesystem.sniff_file_type(self.build_resource_file_path(file_name))
+            self._resource_file_types[file_name] = file_type
+
+        return self._resource_file_types[file_name]
+
     def _extract(self):
-        path_extracted = filesystem.unzip_directory(self.file_path, self.workspace)
+        path_extracted = filesystem.extract_zip(self.cartridge, self.workspace / self.name)
         self.directory = path_extracted
         manifest = path_extracted / MANIFEST
         return manifest
@@ -633,7 +693,7 @@ class Cartridge:
             elif tag == "metadata":
                 child_data = self._parse_resource_metadata(child)
             else:
-                logger.info("Unsupported Resource Type %s", tag)
+                logger.debug("Unsupported Resource Type %s", tag)
                 continue
             if child_data:
                 children.append(child_data)
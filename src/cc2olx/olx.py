@@ -1,8 +1,10 @@
 import json
 import logging
 import xml.dom.minidom
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import cached_property
-from typing import List, Type
+from typing import Iterator, List, Optional, Set, Type
 
 from cc2olx.constants import FALLBACK_OLX_CONTENT
 from cc2olx.content_post_processors import AbstractContentPostProcessor
@@ -12,6 +14,7 @@ from cc2olx.content_processors import AbstractContentProcessor
 from cc2olx.content_processors.dataclasses import ContentProcessorContext
 from cc2olx.content_processors.utils import load_content_processor_types
 from cc2olx.iframe_link_parser import KalturaIframeLinkParser
+from cc2olx.progress import ProgressLog
 from cc2olx.utils import passport_file_parser
 
 logger = logging.getLogger()
@@ -32,6 +35,7 @@ class OlxExport:
         passport_file=None,
         relative_links_source=None,
         content_types_with_custom_blocks=None,
+        qti_workers=None,
     ):
         self.cartridge = cartridge
         self.doc = None
@@ -42,9 +46,28 @@ class OlxExport:
         self.lti_consumer_present = False
         self.lti_consumer_ids = set()
         self._content_types_with_custom_blocks = content_types_with_custom_blocks or []
-        self._content_processors = self._create_content_processors(load_content_processor_types())
+        self._qti_workers = qti_workers
+        # The resource events are logged as samples and progress summaries, their counts go to the metrics.
+        self._progress = ProgressLog("resources")
+        self.stats = self._progress.counts
+        self.skipped_processors = Counter()
+        self.skipped_post_processors = Counter()
+        self._content_processors = self._create_content_processors(
+            load_content_processor_types(self._get_resource_types())
+        )
         self._content_post_processors = self._create_content_post_processors(load_content_post_processor_types())
 
+    def _get_resource_types(self) -> Optional[Set[str]]:
+        """
+        Provide the resource types of the course, if its manifest is loaded.
+        """
+        if self.cartridge.resources is None:
+            return None
+
+        resource_type_histogram = self.cartridge.get_resource_type_histogram()
+        logger.debug("Resource types: %s", dict(resource_type_histogram))
+        return set(resource_type_histogram)
+
     def _create_content_processors(
         self,
         content_processor_types: List[Type[AbstractContentProcessor]],
@@ -84,10 +107,58 @@ class OlxExport:
         self.doc.appendChild(xcourse)
 
         tags = "chapter sequential vertical".split()
-        self._add_olx_nodes(xcourse, self.cartridge.normalized["children"], tags)
+
+        if self._qti_workers:
+            with ProcessPoolExecutor(max_workers=self._qti_workers) as executor:
+                self._prefetch(executor, tags)
+                self._add_olx_nodes(xcourse, self.cartridge.normalized["children"], tags)
+        else:
+            self._add_olx_nodes(xcourse, self.cartridge.normalized["children"], tags)
+
+        self._progress.log_summary()
+        self._log_processors_stats()
 
         return self.doc.toprettyxml()
 
+    def _log_processors_stats(self) -> None:
+        """
+        Log the events counted by content processors and post processors.
+        """
+        for processor in (*self._content_processors, *self._content_post_processors):
+            if processor.stats:
+                logger.debug("%s stats: %s", type(processor).__name__, dict(processor.stats))
+
+    def _prefetch(self, executor: Executor, tags: List[str]) -> None:
+        """
+        Let content processors schedule the resources conversion in the executor.
+        """
+        resources = list(self._iterate_leaf_resources(self.cartridge.normalized["children"], tags))
+
+        for content_processor in self._content_processors:
+            content_processor.prefetch(resources, executor)
+
+    def _iterate_leaf_resources(self, course_data: List[dict], tags: List[str]) -> Iterator[dict]:
+        """
+        Iterate over the resources the OLX nodes are created from.
+
+        The course data is traversed in the same way as `_add_olx_nodes` does.
+        """
+        leaf = not tags
+        for element_data in course_data:
+            if leaf and (resource := self._define_leaf_resource(element_data)) is not None:
+                yield resource
+
+            if "children" in element_data:
+                yield from self._iterate_leaf_resources(element_data["children"], tags[1:])
+
+    def _define_leaf_resource(self, element_data: dict) -> Optional[dict]:
+        """
+        Define the resource a leaf element refers to.
+        """
+        if idref := element_data.get("identifierref"):
+            return self.cartridge.define_resource(idref)
+        return None
+
     def policy(self):
         """
         Returns minimal course policy file with disabled wiki tab in form of json string.
@@ -186,6 +257,7 @@ class OlxExport:
         for element_data in course_data:
             if leaf:
                 children = self._create_olx_nodes(element_data)
+                self._progress.step()
             else:
                 children = [self.doc.createElement(tags[0])]
 
@@ -218,26 +290,32 @@ class OlxExport:
         """
         idref = element_data.get("identifierref")
         if not idref:
+            self.stats["fallback_nodes"] += 1
             return self._fallback_olx_nodes
 
         resource = self.cartridge.define_resource(idref)
         if resource is None:
-            logger.warning("Missing resource: %s", idref)
+            self._progress.event("missing_resources", logging.WARNING, "Missing resource: %s", idref)
+            self.stats["fallback_nodes"] += 1
             return self._fallback_olx_nodes
 
         for content_processor in self._content_processors:
             try:
                 olx_nodes = content_processor.process(resource, idref)
             except Exception:
-                logger.exception(
-                    'An error occurred during resource "%s" processing by %s:',
+                self._progress.event(
+                    "skipped_processors",
+                    logging.ERROR,
+                    'An error occurred during resource "%s" processing by %s, the processor is skipped:',
                     idref,
                     type(content_processor).__name__,
+                    exc_info=True,
                 )
-                logger.error("The processor is skipped.")
+                self.skipped_processors[type(content_processor).__name__] += 1
             else:
                 if olx_nodes:
-                    logger.info(
+                    self.stats["processed_resources"] += 1
+                    logger.debug(
                         'The resource with "%s" identifier is successfully processed by %s.',
                         idref,
                         type(content_processor).__name__,
@@ -248,7 +326,13 @@ class OlxExport:
 
                     return olx_nodes
 
-        logger.warning('The resource with "%s" identifier value is not supported.', idref)
+        self._progress.event(
+            "unsupported_resources",
+            logging.WARNING,
+            'The resource with "%s" identifier value is not supported.',
+            idref,
+        )
+        self.stats["fallback_nodes"] += 1
         return self._fallback_olx_nodes
 
     @cached_property
@@ -270,15 +354,19 @@ class OlxExport:
             try:
                 post_processor.process(olx_node)
             except Exception:
-                logger.exception(
-                    'An error occurred during <%s> node post-processing by %s for resource "%s":',
+                self._progress.event(
+                    "skipped_post_processors",
+                    logging.ERROR,
+                    'An error occurred during <%s> node post-processing by %s for resource "%s", '
+                    "the post processor is skipped:",
                     olx_node.tagName,
                     type(post_processor).__name__,
                     idref,
+                    exc_info=True,
                 )
-                logger.error("The post processor is skipped.")
+                self.skipped_post_processors[type(post_processor).__name__] += 1
             else:
-                logger.info(
+                logger.debug(
                     'The resource with "%s" identifier is successfully post-processed by %s.',
                     idref,
                     type(post_processor).__name__,
@@ -0,0 +1,224 @@
+import contextlib
+import errno
+import os
+import shutil
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from cc2olx.cli import RESULT_TYPE_FOLDER, RESULT_TYPE_ZIP
+from cc2olx.filesystem import sniff_file_type
+
+PARTIAL_FILE_SUFFIX = ".partial"
+
+
+class AbstractOutput(ABC):
+    """
+    Abstract base class for the conversion results destination.
+
+    The OLX archives are written straight to their final location with
+    `open_file` as soon as every cartridge is converted, so the results are
+    written once. A file appears under its final name only when it is
+    complete, so a crash never leaves a truncated archive behind.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def __enter__(self) -> "AbstractOutput":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Prepare the output to receive files.
+        """
+
+    def close(self) -> None:
+        """
+        Finalize the output.
+        """
+
+    @abstractmethod
+    def open_file(self, name: str) -> contextlib.AbstractContextManager:
+        """
+        Open the file with the relative name for writing binary content.
+        """
+
+    def add_file(self, path: Path, name: str) -> None:
+        """
+        Add the complete file to the output under the relative name.
+        """
+        with open(path, "rb") as source_file, self.open_file(name) as output_file:
+            shutil.copyfileobj(source_file, output_file)
+
+    @abstractmethod
+    def add_tree(self, directory: Path) -> None:
+        """
+        Add the directory content to the output.
+        """
+
+
+class FolderOutput(AbstractOutput):
+    """
+    Write the conversion results into a folder, replacing its previous content.
+
+    The previous content is kept if the folder isn't cleaned, e.g. when the
+    folder is shared by several nodes converting the same batch. The nodes
+    sharing the folder tag their partial files, so they never write the same
+    partial file.
+    """
+
+    def __init__(self, path: Path, clean: bool = True, partial_tag: Optional[str] = None) -> None:
+        super().__init__(path)
+        self.clean = clean
+        self.partial_tag = partial_tag
+
+    def open(self) -> None:
+        if self.clean:
+            shutil.rmtree(str(self.path), ignore_errors=True)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @contextlib.contextmanager
+    def open_file(self, name: str) -> Iterator[BinaryIO]:
+        final_path = self.path / name
+        partial_name = f"{final_path.name}.{self.partial_tag}" if self.partial_tag else final_path.name
+        partial_path = final_path.with_name(partial_name + PARTIAL_FILE_SUFFIX)
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(partial_path, "wb") as output_file:
+                yield output_file
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        os.replace(partial_path, final_path)
+
+    def add_file(self, path: Path, name: str) -> None:
+        """
+        Move the complete file to the output under the relative name.
+
+        The file is renamed if it is on the same filesystem, so it isn't
+        written twice. Otherwise, it is copied to a partial file first, so a
+        crash never leaves a truncated file under the final name.
+        """
+        final_path = self.path / name
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(path, final_path)
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+            super().add_file(path, name)
+            path.unlink()
+
+    def add_tree(self, directory: Path) -> None:
+        shutil.copytree(str(directory), str(self.path), dirs_exist_ok=True)
+
+
+class GuardedOutput(AbstractOutput):
+    """
+    Write the files through another output while the check passes.
+
+    The check is called on every write and before a file is completed, the
+    exception it raises discards the file. It is used to stop writing the
+    results of a cartridge whose claim is lost.
+    """
+
+    def __init__(self, output: AbstractOutput, check: Callable[[], None], final_check: Callable[[], None]) -> None:
+        super().__init__(output.path)
+        self._output = output
+        self._check = check
+        self._final_check = final_check
+
+    @contextlib.contextmanager
+    def open_file(self, name: str) -> Iterator[BinaryIO]:
+        with self._output.open_file(name) as output_file:
+            yield _CheckedWriter(output_file, self._check)
+            self._final_check()
+
+    def add_file(self, path: Path, name: str) -> None:
+        self._final_check()
+        self._output.add_file(path, name)
+
+    def add_tree(self, directory: Path) -> None:
+        self._output.add_tree(directory)
+
+
+class _CheckedWriter:
+    """
+    Call the check before every write to the binary file object.
+    """
+
+    def __init__(self, fileobj: BinaryIO, check: Callable[[], None]) -> None:
+        self._fileobj = fileobj
+        self._check = check
+
+    def write(self, data) -> int:
+        self._check()
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+
+class ZipOutput(AbstractOutput):
+    """
+    Append the conversion results to a zip file.
+
+    The zip file is written under a temporary name and renamed when it is
+    closed. The OLX archives and the already compressed media files are stored
+    without compression, because compressing them again is a waste of time.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path.with_name(path.name + ".zip"))
+        self._partial_path = self.path.with_name(self.path.name + PARTIAL_FILE_SUFFIX)
+        self._zip_file = None
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip_file = zipfile.ZipFile(self._partial_path, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def close(self) -> None:
+        self._zip_file.close()
+        os.replace(self._partial_path, self.path)
+
+    @contextlib.contextmanager
+    def open_file(self, name: str) -> Iterator[BinaryIO]:
+        zip_info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        zip_info.compress_type = zipfile.ZIP_STORED
+        zip_info.external_attr = 0o644 << 16
+
+        with self._zip_file.open(zip_info, "w", force_zip64=True) as output_file:
+            yield output_file
+
+    def add_tree(self, directory: Path) -> None:
+        for path in sorted(directory.rglob("*")):
+            compress_type = zipfile.ZIP_STORED if _is_compressed_file(path) else zipfile.ZIP_DEFLATED
+            self._zip_file.write(path, path.relative_to(directory).as_posix(), compress_type=compress_type)
+
+
+def _is_compressed_file(path: Path) -> bool:
+    """
+    Check whether the file content is already compressed, e.g. an image or a video.
+    """
+    if not path.is_file():
+        return False
+
+    file_type = sniff_file_type(path)
+    return file_type is not None and file_type.is_compressed
+
+
+def create_output(output_format: str, path: Path) -> AbstractOutput:
+    """
+    Create the output of the format at the path.
+    """
+    output_types = {RESULT_TYPE_FOLDER: FolderOutput, RESULT_TYPE_ZIP: ZipOutput}
+    return output_types[output_format](path)
@@ -44,4 +44,19 @@ def parse_options(args):
         "passport_file": args.passport_file,
         "relative_links_source": args.relative_links_source,
         "content_types_with_custom_blocks": args.content_types_with_custom_blocks,
+        "qti_workers": args.qti_workers,
+        "batch_workers": args.batch_workers,
+        "memory_budget": args.memory_budget,
+        "disk_budget": args.disk_budget,
+        "claims_directory": args.claims_directory,
+        "node_id": args.node_id,
+        "claim_timeout": args.claim_timeout,
+        "keep_intermediates": args.keep_intermediates,
+        "compression_codec": args.compression_codec,
+        "compression_level": args.compression_level,
+        "compression_workers": args.compression_workers,
+        "metrics_file": args.metrics_file,
+        "metrics_format": args.metrics_format,
+        "analyze": args.analyze,
+        "analyze_format": args.analyze_format,
     }
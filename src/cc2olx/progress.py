@@ -0,0 +1,65 @@
+import logging
+import time
+from collections import Counter
+
+logger = logging.getLogger()
+
+# Seconds between the progress summaries.
+PROGRESS_LOG_INTERVAL = 10
+# The first occurrences of every event are logged at their level, the rest only at DEBUG level.
+EVENT_LOG_SAMPLE_SIZE = 10
+
+
+class ProgressLog:
+    """
+    Count the conversion events and log aggregated progress instead of a line per resource.
+
+    Every event is counted, only its first occurrences are logged at the
+    requested level and the rest are logged at DEBUG level, so a course with
+    thousands of broken resources doesn't flood the log. The progress summary
+    is logged at INFO level at most once per interval.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float = PROGRESS_LOG_INTERVAL,
+        sample_size: int = EVENT_LOG_SAMPLE_SIZE,
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self.sample_size = sample_size
+        self.done = 0
+        self.counts = Counter()
+        self._logged_at = time.monotonic()
+
+    def event(self, event: str, level: int, msg: str, *args, exc_info: bool = False) -> None:
+        """
+        Count the event and log its sample.
+        """
+        self.counts[event] += 1
+        count = self.counts[event]
+
+        if count <= self.sample_size:
+            logger.log(level, msg, *args, exc_info=exc_info)
+            if count == self.sample_size:
+                logger.log(level, 'Further "%s" events are only counted and logged at DEBUG level.', event)
+        else:
+            logger.debug(msg, *args, exc_info=exc_info)
+
+    def step(self) -> None:
+        """
+        Count the processed item and log the progress summary if the interval has passed.
+        """
+        self.done += 1
+
+        now = time.monotonic()
+        if now - self._logged_at >= self.interval:
+            self._logged_at = now
+            self.log_summary()
+
+    def log_summary(self) -> None:
+        """
+        Log the processed items with the event counts.
+        """
+        logger.info("Processed %d %s: %s", self.done, self.name, dict(self.counts))
@@ -0,0 +1,181 @@
+import logging
+import os
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import attrs
+
+logger = logging.getLogger()
+
+MANIFEST_FILE_NAME = "imsmanifest.xml"
+# The files the converter parses or reads into memory, the other files are only copied to the archive.
+TEXT_FILE_EXTENSIONS = {".xml", ".html", ".htm", ".qti", ".txt", ".csv", ".json"}
+
+# The memory taken by the converter before the cartridge is read.
+BASE_MEMORY = 150 * 1024 * 1024
+# The parsed XML trees and the generated OLX take several times more memory than the source text.
+TEXT_MEMORY_FACTOR = 8
+MEMORY_PER_MEMBER = 4 * 1024
+# The extracted cartridge and the archive written next to it.
+SCRATCH_DISK_FACTOR = 2
+
+DEFAULT_MEMORY_BUDGET_RATIO = 0.8
+DEFAULT_DISK_BUDGET_RATIO = 0.9
+
+
+@attrs.define(frozen=True)
+class CartridgeCost:
+    """
+    Provide the resources the cartridge conversion is expected to take.
+
+    The cost is estimated from the zip archive central directory, the
+    cartridge content is not decompressed.
+    """
+
+    path: Path
+    uncompressed_size: int = 0
+    members_count: int = 0
+    manifest_size: int = 0
+    text_size: int = 0
+
+    @property
+    def memory(self) -> int:
+        """
+        Provide the projected peak RSS of the conversion in bytes.
+        """
+        text_memory = TEXT_MEMORY_FACTOR * (self.manifest_size + self.text_size)
+        return BASE_MEMORY + text_memory + MEMORY_PER_MEMBER * self.members_count
+
+    @property
+    def scratch_disk(self) -> int:
+        """
+        Provide the projected peak scratch disk usage of the conversion in bytes.
+        """
+        return SCRATCH_DISK_FACTOR * self.uncompressed_size
+
+
+def estimate_cartridge_cost(path: Path) -> CartridgeCost:
+    """
+    Estimate the conversion cost of the cartridge reading only its zip metadata.
+    """
+    try:
+        with zipfile.ZipFile(path) as cartridge:
+            members = cartridge.infolist()
+    except (OSError, zipfile.BadZipFile):
+        logger.warning("Unable to read %s metadata, its file size is used as the conversion cost.", path)
+        return CartridgeCost(path, uncompressed_size=path.stat().st_size if path.exists() else 0)
+
+    return CartridgeCost(
+        path,
+        uncompressed_size=sum(member.file_size for member in members),
+        members_count=len(members),
+        manifest_size=sum(member.file_size for member in members if member.filename == MANIFEST_FILE_NAME),
+        text_size=sum(
+            member.file_size
+            for member in members
+            if member.filename != MANIFEST_FILE_NAME and Path(member.filename).suffix.lower() in TEXT_FILE_EXTENSIONS
+        ),
+    )
+
+
+def get_default_memory_budget() -> Optional[int]:
+    """
+    Provide the share of the physical memory the batch conversion can take.
+    """
+    try:
+        physical_memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+    return int(physical_memory * DEFAULT_MEMORY_BUDGET_RATIO)
+
+
+def get_default_disk_budget(scratch_directory: Path) -> int:
+    """
+    Provide the share of the free scratch disk space the batch conversion can take.
+    """
+    return int(shutil.disk_usage(scratch_directory).free * DEFAULT_DISK_BUDGET_RATIO)
+
+
+class BatchScheduler:
+    """
+    Schedule the cartridge conversions running in parallel within the memory and the disk budgets.
+
+    The most expensive cartridges are started first, so the batch doesn't end
+    waiting for a huge cartridge started last. A cartridge is started only
+    while the projected memory and scratch disk usage of all the running
+    conversions stay under the budgets, the cheaper cartridges fill the
+    budget left by the expensive ones. A cartridge exceeding the budgets on
+    its own is converted when nothing else is running.
+    """
+
+    def __init__(
+        self,
+        costs: Iterable[CartridgeCost],
+        max_workers: int,
+        memory_budget: Optional[int] = None,
+        disk_budget: Optional[int] = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self._queue = sorted(costs, key=lambda cost: (cost.memory, cost.scratch_disk), reverse=True)
+        self._running: Dict[Path, CartridgeCost] = {}
+
+    @property
+    def has_pending(self) -> bool:
+        """
+        Whether some cartridges aren't started yet.
+        """
+        return bool(self._queue)
+
+    def admit(self) -> List[CartridgeCost]:
+        """
+        Provide the cartridges to start now and consider them running.
+        """
+        admitted = []
+
+        while self._queue and len(self._running) < self.max_workers:
+            index = self._find_admissible_index()
+            if index is None:
+                break
+
+            cost = self._queue.pop(index)
+            self._running[cost.path] = cost
+            admitted.append(cost)
+            logger.debug(
+                "Starting %s, projected memory %d MB, scratch disk %d MB",
+                cost.path,
+                cost.memory // 1024 // 1024,
+                cost.scratch_disk // 1024 // 1024,
+            )
+
+        return admitted
+
+    def release(self, cost: CartridgeCost) -> None:
+        """
+        Consider the cartridge conversion finished.
+        """
+        self._running.pop(cost.path, None)
+
+    def _find_admissible_index(self) -> Optional[int]:
+        """
+        Provide the index of the most expensive queued cartridge fitting into the budgets.
+        """
+        if not self._running:
+            return 0
+
+        used_memory = sum(cost.memory for cost in self._running.values())
+        used_disk = sum(cost.scratch_disk for cost in self._running.values())
+
+        for index, cost in enumerate(self._queue):
+            fits_memory = _fits(used_memory + cost.memory, self.memory_budget)
+            if fits_memory and _fits(used_disk + cost.scratch_disk, self.disk_budget):
+                return index
+
+        return None
+
+
+def _fits(projected_usage: int, budget: Optional[int]) -> bool:
+    return budget is None or projected_usage <= budget
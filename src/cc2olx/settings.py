@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from cc2olx.enums import CommonCartridgeResourceType
+
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 
@@ -27,6 +29,23 @@ CONTENT_PROCESSORS = [
     "cc2olx.content_processors.HtmlContentProcessor",
 ]
 
+# It is used to skip importing and creating the content processors that can't
+# process any resource of the course. It maps a content processor to the
+# resource type patterns it handles. The processors missing here, like the
+# fallback one, are always used.
+CONTENT_PROCESSOR_RESOURCE_TYPES = {
+    "cc2olx.content_processors.PDFContentProcessor": [
+        CommonCartridgeResourceType.WEB_CONTENT,
+        CommonCartridgeResourceType.WEB_LINK,
+    ],
+    "cc2olx.content_processors.GoogleDocumentContentProcessor": [CommonCartridgeResourceType.WEB_LINK],
+    "cc2olx.content_processors.VideoContentProcessor": [CommonCartridgeResourceType.WEB_LINK],
+    "cc2olx.content_processors.LtiContentProcessor": [CommonCartridgeResourceType.LTI_LINK],
+    "cc2olx.content_processors.QtiContentProcessor": [CommonCartridgeResourceType.QTI_ASSESSMENT],
+    "cc2olx.content_processors.AssignmentContentProcessor": [CommonCartridgeResourceType.ASSIGNMENT],
+    "cc2olx.content_processors.DiscussionContentProcessor": [CommonCartridgeResourceType.DISCUSSION_TOPIC],
+}
+
 # It is used to modify the generated OLX node from a Common Cartridge resource.
 # Post processors are called sequentially, so the next post processors work
 # with nodes modified by the previous one. It means that the order is important,
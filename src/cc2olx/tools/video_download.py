@@ -1,13 +1,21 @@
 import argparse
+import io
 import json
 import csv
+import re
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import parse_qs, urlparse
 
 from lxml import html
 
 import youtube_dl
 
+DOWNLOAD_RETRY_DELAY_SECONDS = 5
+IFRAME_TAG_PATTERN = re.compile(rb"<iframe", re.I)
+
 
 def parse_args(args=None):
     """Parse command line arguments."""
@@ -19,6 +27,9 @@ def parse_args(args=None):
     parser.add_argument("--downloads", "-d", default="downloads", help="Video download directory")
     parser.add_argument("--simulate", "-s", action="store_true", help="Simulate downloads")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose ytd downloads")
+    parser.add_argument("--concurrency", "-n", type=int, default=1, help="Number of videos downloaded in parallel")
+    parser.add_argument("--retries", "-r", type=int, default=2, help="Number of download retries for every video")
+    parser.add_argument("--scan-workers", type=int, default=None, help="Number of HTML files scanned in parallel")
 
     return parser.parse_args(args)
 
@@ -38,29 +49,64 @@ def get_ydl_opts(args):
     }
 
 
-def download_videos(urls, opts):
+def download_videos(urls, opts, concurrency=1, retries=0):
     """
     Download a list of videos and optionally transcripts.
     Arguments:
         * videos: a list of URLs
         * opts: options for Youtube DL
+        * concurrency: number of videos downloaded in parallel
+        * retries: number of download retries for every video
+
+    Returns:
+        * relpaths: a list of downloaded files in the order of URLs
+    """
+    return [
+        relpath
+        for _, url_relpaths in download_videos_by_url(urls, opts, concurrency, retries)
+        for relpath in url_relpaths
+    ]
+
+
+def download_videos_by_url(urls, opts, concurrency=1, retries=0):
     """
+    Download a list of videos in a bounded worker pool.
 
-    relpaths = []
+    Every video is downloaded by its own Youtube DL instance, so the files
+    reported by the progress hooks are attributed to the URL they came from.
+
+    Returns:
+        * a list of (url, relpaths) pairs in the order of URLs, relpaths are
+          empty if the video failed to download
+    """
+    downloaded_files = threading.local()
 
     def my_hook(d):
         """Youtube DL callback"""
         if d["status"] == "finished":
             fn = d["filename"]
             if not fn.endswith("m4a"):
-                relpaths.append(fn)
+                downloaded_files.relpaths.append(fn)
 
     opts["progress_hooks"] = [my_hook]
 
-    ydl = youtube_dl.YoutubeDL(opts)
-    ydl.download(urls)
+    def download(url):
+        for attempt in range(retries + 1):
+            downloaded_files.relpaths = []
+            try:
+                youtube_dl.YoutubeDL(opts).download([url])
+            except youtube_dl.utils.DownloadError as error:
+                print(f"Attempt {attempt + 1} to download {url} failed: {error}")
+                if attempt < retries:
+                    time.sleep(DOWNLOAD_RETRY_DELAY_SECONDS * (attempt + 1))
+            else:
+                return url, downloaded_files.relpaths
 
-    return relpaths
+        print(f"Unable to download {url}.")
+        return url, []
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        return list(executor.map(download, urls))
 
 
 def make_row(relpath, url):
@@ -137,30 +183,69 @@ def reformat(url):
     return url
 
 
-def find_all_video_urls(name):
+def find_all_video_urls(name, workers=None):
     """
     Extract video urls from a CC course or HTML file
     """
-    urls = []
-    if zipfile.is_zipfile(name):
-        with zipfile.ZipFile(name) as z:
-            for filename in z.namelist():
-                if filename.endswith(".html"):
-                    with z.open(filename) as f:
-                        urls += find_video_urls(f)
-    else:
-        # If input is a single HTML for debugging
-        urls += find_video_urls(name)
+    return list(iter_video_urls(name, workers))
 
-    return urls
+
+def iter_video_urls(name, workers=None):
+    """
+    Yield unique video urls from a CC course or HTML file as they are found.
+
+    HTML files of a CC course are scanned in parallel and only the ones
+    containing an iframe are parsed, so the URLs start coming while the rest
+    of the course is being scanned.
+    """
+    if not zipfile.is_zipfile(name):
+        # If input is a single HTML for debugging
+        yield from dict.fromkeys(find_video_urls(name))
+        return
+
+    local = threading.local()
+    zip_files = []
+    seen_urls = set()
+
+    def scan(filename):
+        # Every worker reads the course through its own zip file handle
+        if not hasattr(local, "zip_file"):
+            local.zip_file = zipfile.ZipFile(name)
+            zip_files.append(local.zip_file)
+        content = local.zip_file.read(filename)
+        if not IFRAME_TAG_PATTERN.search(content):
+            return []
+        return find_video_urls(io.BytesIO(content))
+
+    with zipfile.ZipFile(name) as z:
+        filenames = [filename for filename in z.namelist() if filename.endswith(".html")]
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for urls in executor.map(scan, filenames):
+                for url in urls:
+                    if url not in seen_urls:
+                        seen_urls.add(url)
+                        yield url
+    finally:
+        for zip_file in zip_files:
+            zip_file.close()
 
 
 def main():
     args = parse_args()
     ydl_opts = get_ydl_opts(args)
 
-    urls = find_all_video_urls(args.input)
-    relpaths = download_videos(urls, ydl_opts)
+    # Downloads are submitted as the URLs are found, while the course is still being scanned
+    urls = iter_video_urls(args.input, args.scan_workers)
+    downloads = download_videos_by_url(urls, ydl_opts, args.concurrency, args.retries)
+
+    # Keep every downloaded file paired with the URL it was downloaded from
+    urls, relpaths = [], []
+    for url, url_relpaths in downloads:
+        for relpath in url_relpaths:
+            urls.append(url)
+            relpaths.append(relpath)
 
     # Remove download dir prefix from pathnames
     relpaths = [r.lstrip(f"{args.downloads}/") for r in relpaths]
@@ -1,9 +1,17 @@
 import argparse
+import base64
 import csv
+import hashlib
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from xml.etree import ElementTree
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 
 OAUTH_TOKEN_URL = "https://courses.edx.org/oauth2/access_token"
@@ -13,12 +21,106 @@ TRANSCRIPT_UPLOAD_LINK = "https://studio.edx.org/transcript_upload_api/"
 # GENERATE_UPLOAD_LINK_BASE_URL = "https://studio.stage.edx.org/generate_video_upload_link/"
 # TRANSCRIPT_UPLOAD_LINK = "https://studio.stage.edx.org/transcript_upload_api/"
 
+DEFAULT_CONNECTION_POOL_SIZE = 10
+
+BYTES_IN_MEGABYTE = 1024 * 1024
+DEFAULT_CHUNK_CONCURRENCY = 4
+DEFAULT_CHUNK_RETRIES = 3
+CHUNK_RETRY_BACKOFF_SECONDS = 1
+
 VIDEO_EXTENSION_CONTENT_TYPES = {
     ".mp4": "video/mp4",
     ".mov": "video/quicktime",
 }
 
 
+class UploadStatus:
+    """
+    Stages of a video upload recorded in the upload journal.
+    """
+
+    LINK_GENERATED = "link_generated"
+    UPLOADED = "uploaded"
+    COMPLETED = "completed"
+
+
+class UploadJournal:
+    """
+    Record the progress of every video upload in a JSON lines file.
+
+    Every update appends the full state of a video file, so the last line written
+    for a file wins when the journal is loaded. That allows a rerun of the tool to
+    skip videos and transcripts that have already been uploaded.
+
+    Every entry records the course and the size and modification time of the video
+    file, the entry is ignored if the video is uploaded to another course or the
+    file has changed since.
+    """
+
+    def __init__(self, path, course_id):
+        self.path = Path(path)
+        self.course_id = course_id
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line may be incomplete if the previous run was killed.
+                        continue
+                    self._entries[entry["relative_path"]] = entry
+
+    def get(self, relative_path, full_path):
+        """
+        Return the recorded state of the video file or an empty dictionary if it's recorded for another
+        course or the file has changed.
+        """
+        fingerprint = self._get_fingerprint(full_path)
+
+        with self._lock:
+            entry = self._entries.get(str(relative_path), {})
+            if any(entry.get(name) != value for name, value in fingerprint.items()):
+                return {}
+            return dict(entry)
+
+    def record(self, relative_path, full_path, **fields):
+        """
+        Update the state of the video file and append it to the journal.
+        """
+        relative_path = str(relative_path)
+        fingerprint = self._get_fingerprint(full_path)
+
+        with self._lock:
+            entry = self._entries.get(relative_path, {})
+            if any(entry.get(name) != value for name, value in fingerprint.items()):
+                entry = {}
+            entry = {**entry, "relative_path": relative_path, **fingerprint, **fields}
+            self._entries[relative_path] = entry
+
+            with self.path.open("a", encoding="utf-8") as journal_file:
+                journal_file.write(json.dumps(entry) + "\n")
+
+        return entry
+
+    def files_data(self):
+        """
+        Build the mapping from a file path to its upload data expected by `write_upload_results_csv`.
+        """
+        with self._lock:
+            return {
+                relative_path: {"edx_video_id": entry.get("edx_video_id"), "lang": entry.get("lang", "")}
+                for relative_path, entry in self._entries.items()
+                if entry.get("course_id") == self.course_id
+            }
+
+    def _get_fingerprint(self, full_path):
+        stat = Path(full_path).stat()
+        return {"course_id": self.course_id, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
 class SuppliedJwtAuth(AuthBase):
     """Attaches a supplied JWT to the given Request object."""
 
@@ -32,6 +134,28 @@ class SuppliedJwtAuth(AuthBase):
         return r
 
 
+def create_session(access_token=None, pool_size=DEFAULT_CONNECTION_POOL_SIZE):
+    """
+    Create a session that keeps a pool of connections to be shared by all the requests.
+
+    Arguments:
+        * access_token: access token to authenticate the session requests with, if provided
+        * pool_size: the maximum number of connections kept open per host
+
+    Returns:
+        * session: the requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if access_token:
+        session.auth = SuppliedJwtAuth(access_token)
+
+    return session
+
+
 def get_access_token():
     oauth_url = OAUTH_TOKEN_URL
     client_id = os.environ["CC2OLX_CLIENT"]
@@ -80,10 +204,53 @@ def parse_args(args=None):
         "-o",
         help="path to where the output CSV should be stored; this will overwrite existing files",
     )
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--concurrency",
+        "-n",
+        type=int,
+        default=1,
+        help="number of videos uploaded in parallel together with their transcripts",
+    )
+    parser.add_argument(
+        "--journal",
+        "-j",
+        default=None,
+        help="path to the upload journal which allows an interrupted run to be resumed",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help="upload videos larger than this size in megabytes in chunks using S3 multipart upload, "
+        "requires --presign-url; videos are uploaded with a single request by default",
+    )
+    parser.add_argument(
+        "--presign-url",
+        default=None,
+        help="URL of the service presigning every request of the S3 multipart uploads; Studio upload URLs are "
+        "presigned for a single PUT request, so they can't be used for the multipart upload requests",
+    )
+    parser.add_argument(
+        "--verify-part-etag",
+        action="store_true",
+        help="check the ETag of every uploaded chunk against its MD5 digest; the chunks are always checked by "
+        "the server with Content-MD5, and the ETag isn't the MD5 digest on buckets encrypted with SSE-KMS or SSE-C",
+    )
+    parser.add_argument(
+        "--chunk-concurrency",
+        type=int,
+        default=DEFAULT_CHUNK_CONCURRENCY,
+        help="number of chunks of a video uploaded in parallel",
+    )
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.chunk_size > 0 and not parsed_args.presign_url:
+        parser.error("--chunk-size requires --presign-url, Studio upload URLs only accept a single PUT request.")
+
+    return parsed_args
 
 
-def make_generate_upload_link_request(url, data, filename, access_token):
+def make_generate_upload_link_request(url, data, filename, access_token=None, session=None):
     """
     Make a POST request against the Studio generate upload link API and return the
     response. If errors occur during the API call, log to the console.
@@ -93,12 +260,13 @@ def make_generate_upload_link_request(url, data, filename, access_token):
         * data: a dictionary to be passed in the POST request as a json parameter
         * filename: the filename for the file we are calling the API with - used for logging
         * access_token: access token to be able to make authenticated calls to the Studio API
+        * session: an authenticated session to make the call with instead of a new one
 
     Returns:
-        * response: the response object from the POST API call
+        * response: the response object from the POST API call or None if the call failed
     """
-    s = requests.Session()
-    s.auth = SuppliedJwtAuth(access_token)
+    s = session or create_session(access_token)
+    response = None
 
     try:
         response = s.post(url, json=data)
@@ -127,7 +295,7 @@ def make_generate_upload_link_request(url, data, filename, access_token):
     return response
 
 
-def upload_transcript(filename, edx_video_id, language_code, access_token):
+def upload_transcript(filename, edx_video_id, language_code, access_token=None, session=None):
     """
     Make a POST request against the Studio upload transcript API and return the
     response. If errors occur during the API call, log to the console.
@@ -137,25 +305,32 @@ def upload_transcript(filename, edx_video_id, language_code, access_token):
         * edx_video_id: the video ID of the video this transcript is for
         * language_code: the language of the transcript
         * access_token: access token to be able to make authenticated calls to the Studio API
+        * session: an authenticated session to make the call with instead of a new one
 
     Returns:
         * response: the response object from the POST API call
     """
-    s = requests.Session()
-    s.auth = SuppliedJwtAuth(access_token)
+    s = session or create_session(access_token)
 
     data = {"edx_video_id": edx_video_id, "language_code": language_code, "new_language_code": language_code}
-    files = {"file": open(filename, "rb")}
+    response = None
 
     try:
-        response = s.post(TRANSCRIPT_UPLOAD_LINK, data=data, files=files)
+        with open(filename, "rb") as transcript_file:
+            response = s.post(TRANSCRIPT_UPLOAD_LINK, data=data, files={"file": transcript_file})
         response.raise_for_status()
     except requests.exceptions.HTTPError as error:
         print(
             "An HTTP error occurred calling the Studio transcript upload link API "
             "for transcript: {}: {}".format(filename, repr(error))
         )
-    if response.status_code == 201:
+    except requests.exceptions.RequestException as error:
+        print(
+            "An error occurred calling the Studio transcript upload link API "
+            "for transcript: {}: {}".format(filename, repr(error))
+        )
+
+    if response is not None and response.status_code == 201:
         print(f"Successfully uploaded transcript {filename}.")
     else:
         print(f"Transcript {filename} was unable to be uploaded.")
@@ -163,22 +338,26 @@ def upload_transcript(filename, edx_video_id, language_code, access_token):
     return response
 
 
-def make_upload_video_request(url, data, headers, filename):
+def make_upload_video_request(url, data, headers, filename, session=None):
     """
     Make a PUT request against the AWS upload video API.
     If errors occur during the API call, log to the console.
 
     Arguments:
         * url: the URL against which to make the PUT request
-        * data: a dictionary to be passed in the PUT request as a data parameter
+        * data: the request body, a file object is streamed without reading it into memory
         * headers: a dictionary of headers to be passed in the PUT request as a headers parameter
         * filename: the filename for the file we are calling the API with - used for logging
+        * session: a session to make the call with, the presigned URL must not get the Studio credentials
 
     Returns:
         * response: the response object from the PUT API call
     """
+    put = session.put if session is not None else requests.put
+    response = None
+
     try:
-        response = requests.put(url, data=data, headers=headers)
+        response = put(url, data=data, headers=headers)
         response.raise_for_status()
     except requests.exceptions.HTTPError as error:
         print(
@@ -201,11 +380,219 @@ def make_upload_video_request(url, data, headers, filename):
             "for video {} and the video was not uploaded: {}".format(filename, repr(error))
         )
 
-    if response.status_code == 200:
+    if response is not None and response.status_code == 200:
         print(f"Successfully uploaded video {filename}.")
     else:
         print(f"Video {filename} was unable to be uploaded.")
 
+    return response
+
+
+class SingleRequestUploader:
+    """
+    Upload a video file with a single PUT request streaming the file from the disk.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def upload(self, url, path, headers, filename):
+        """
+        Upload the file at the path to the URL.
+
+        Returns:
+            * response: the response object from the upload call or None if the call failed
+        """
+        with Path(path).open("rb") as f:
+            return make_upload_video_request(url, f, headers, filename, session=self.session)
+
+
+class MultipartPresigner:
+    """
+    Get the presigned URLs of the S3 multipart upload requests from the presign service.
+
+    The service receives the upload URL provided by Studio, the operation
+    (`initiate`, `upload_part`, `complete` or `abort`) and the upload ID and the
+    part number if the operation needs them, and responds with the presigned
+    URL of the request as `{"url": ...}`.
+    """
+
+    def __init__(self, session, url):
+        self.session = session
+        self.url = url
+
+    def presign(self, upload_url, operation, **params):
+        """
+        Provide the presigned URL of the multipart upload request.
+        """
+        response = self.session.post(self.url, json={"upload_url": upload_url, "operation": operation, **params})
+        response.raise_for_status()
+        try:
+            return response.json()["url"]
+        except (ValueError, KeyError) as error:
+            raise requests.exceptions.RequestException(f"Invalid presign response: {response.text}") from error
+
+
+def create_presigner(url, pool_size=DEFAULT_CONNECTION_POOL_SIZE):
+    """
+    Create the presigner with its own session, so the Studio access token is never sent to the presign service.
+
+    The presign service requests are authenticated with the bearer token from
+    the CC2OLX_PRESIGN_TOKEN environment variable, if it is set.
+    """
+    session = create_session(pool_size=pool_size)
+    if presign_token := os.environ.get("CC2OLX_PRESIGN_TOKEN"):
+        session.headers["Authorization"] = f"Bearer {presign_token}"
+    return MultipartPresigner(session, url)
+
+
+class MultipartUploader(SingleRequestUploader):
+    """
+    Upload large video files in chunks using the S3 multipart upload API.
+
+    Every request of the multipart upload is presigned by the presigner,
+    because the Studio upload URL is presigned for a single PUT request and
+    adding the multipart query parameters to it breaks its signature.
+
+    The chunks are uploaded in parallel, each of them is checked against its MD5
+    digest on the server side (Content-MD5), and on the client side (ETag) if
+    `verify_etag` is set, because the ETag isn't the MD5 digest of the chunk on
+    buckets encrypted with SSE-KMS or SSE-C. A failed chunk is
+    retried with an exponential backoff on failure, so a network error costs one
+    chunk instead of the whole video. Files smaller than a chunk are uploaded with
+    a single request.
+    """
+
+    def __init__(
+        self,
+        session,
+        chunk_size,
+        presigner,
+        concurrency=DEFAULT_CHUNK_CONCURRENCY,
+        retries=DEFAULT_CHUNK_RETRIES,
+        backoff=CHUNK_RETRY_BACKOFF_SECONDS,
+        verify_etag=False,
+    ):
+        super().__init__(session)
+        self.chunk_size = chunk_size
+        self.presigner = presigner
+        self.concurrency = max(concurrency, 1)
+        self.retries = retries
+        self.backoff = backoff
+        self.verify_etag = verify_etag
+
+    def upload(self, url, path, headers, filename):
+        """
+        Upload the file at the path to the URL.
+
+        Returns:
+            * response: the response object from the upload completion call or None if the upload failed
+        """
+        size = Path(path).stat().st_size
+        if size <= self.chunk_size:
+            return super().upload(url, path, headers, filename)
+
+        try:
+            upload_id = self._initiate(url, headers)
+        except (requests.exceptions.RequestException, ValueError) as error:
+            print(f"Unable to start a multipart upload of video {filename}: {error!r}")
+            return None
+
+        part_numbers = range(1, (size + self.chunk_size - 1) // self.chunk_size + 1)
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                etags = list(
+                    executor.map(lambda part_number: self._upload_part(url, upload_id, path, part_number), part_numbers)
+                )
+            response = self._complete(url, upload_id, etags)
+        except requests.exceptions.RequestException as error:
+            print(f"Video {filename} was unable to be uploaded: {error!r}")
+            self._abort(url, upload_id)
+            return None
+
+        print(f"Successfully uploaded video {filename} in {len(etags)} chunks.")
+        return response
+
+    def _initiate(self, url, headers):
+        response = self.session.post(self.presigner.presign(url, "initiate"), headers=headers)
+        response.raise_for_status()
+        return self._find_xml_text(response.content, "UploadId")
+
+    def _upload_part(self, url, upload_id, path, part_number):
+        with Path(path).open("rb") as f:
+            f.seek((part_number - 1) * self.chunk_size)
+            chunk = f.read(self.chunk_size)
+
+        digest = hashlib.md5(chunk)
+        headers = {"Content-MD5": base64.b64encode(digest.digest()).decode()}
+        part_url = self.presigner.presign(url, "upload_part", upload_id=upload_id, part_number=part_number)
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.put(part_url, data=chunk, headers=headers)
+                response.raise_for_status()
+                etag = response.headers.get("ETag", "")
+                if self.verify_etag and etag.strip('"') != digest.hexdigest():
+                    raise requests.exceptions.RequestException(f"Chunk {part_number} checksum mismatch: {etag}")
+                return etag
+            except requests.exceptions.RequestException:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2**attempt)
+
+    def _complete(self, url, upload_id, etags):
+        root = ElementTree.Element("CompleteMultipartUpload")
+        for part_number, etag in enumerate(etags, start=1):
+            part = ElementTree.SubElement(root, "Part")
+            ElementTree.SubElement(part, "PartNumber").text = str(part_number)
+            ElementTree.SubElement(part, "ETag").text = etag
+
+        complete_url = self.presigner.presign(url, "complete", upload_id=upload_id)
+        response = self.session.post(complete_url, data=ElementTree.tostring(root))
+        response.raise_for_status()
+        # S3 may report a failed completion in the body of a successful response.
+        if b"<Error>" in response.content:
+            raise requests.exceptions.RequestException(f"Multipart upload completion failed: {response.text}")
+        return response
+
+    def _abort(self, url, upload_id):
+        try:
+            self.session.delete(self.presigner.presign(url, "abort", upload_id=upload_id))
+        except requests.exceptions.RequestException:
+            pass
+
+    @staticmethod
+    def _find_xml_text(content, tag):
+        for element in ElementTree.fromstring(content).iter():
+            if element.tag.rsplit("}", 1)[-1] == tag:
+                return element.text
+        raise ValueError(f"{tag} is missing in the response.")
+
+
+def create_uploader(
+    session,
+    chunk_size=0,
+    chunk_concurrency=DEFAULT_CHUNK_CONCURRENCY,
+    presigner=None,
+    verify_etag=False,
+):
+    """
+    Create the video uploader for the chunk size given in megabytes, 0 disables chunked uploads.
+
+    The chunked uploads require the presigner of the multipart upload requests.
+    """
+    if chunk_size > 0:
+        if presigner is None:
+            raise ValueError("The chunked uploads require the presigner of the multipart upload requests.")
+        return MultipartUploader(
+            session,
+            chunk_size * BYTES_IN_MEGABYTE,
+            presigner,
+            concurrency=chunk_concurrency,
+            verify_etag=verify_etag,
+        )
+    return SingleRequestUploader(session)
+
 
 def write_upload_results_csv(input_csv_path, output_csv_path, file_data):
     """
@@ -245,82 +632,185 @@ def write_upload_results_csv(input_csv_path, output_csv_path, file_data):
             writer.writerow(new_row)
 
 
-def main():
-    args = parse_args()
-    access_token = get_access_token()
+def iterate_video_files(directory):
+    """
+    Iterate over the video files found in the directory at any depth.
 
-    root = Path(args.directory)
-    get_upload_link_url = GENERATE_UPLOAD_LINK_BASE_URL + args.course_id
-    files_data = {}
+    Arguments:
+        * directory: directory containing videos to upload
+
+    Yields:
+        * (full_path, relative_path) pairs of every video file
+    """
+    root = Path(directory)
 
-    for dirpath, _, filenames in os.walk(args.directory):
+    for dirpath, _, filenames in os.walk(directory):
         for filename in filenames:
             # construct filename this way to uniquely identify
             # the file within the root directory
             full_path = Path(dirpath, filename)
             relative_path = full_path.relative_to(root)
-            extension = relative_path.suffix
 
-            if extension in VIDEO_EXTENSION_CONTENT_TYPES:
-                content_type = VIDEO_EXTENSION_CONTENT_TYPES.get(extension)
+            if relative_path.suffix in VIDEO_EXTENSION_CONTENT_TYPES:
+                yield full_path, relative_path
+
 
-                request_data = {"files": [{"file_name": filename, "content_type": content_type}]}
+def upload_video_file(full_path, relative_path, get_upload_link_url, studio_session, uploader, journal):
+    """
+    Upload a video file and its transcripts to Studio, skipping the work the journal
+    reports as already done.
+
+    Arguments:
+        * full_path: path to the video file
+        * relative_path: path to the video file relative to the uploaded directory
+        * get_upload_link_url: Studio generate upload link API URL for the course
+        * studio_session: an authenticated session for the Studio API calls
+        * uploader: the uploader sending the video to the presigned upload URL
+        * journal: the upload journal to record the progress in
 
-                response = make_generate_upload_link_request(get_upload_link_url, request_data, filename, access_token)
+    Returns:
+        * entry: the journal entry of the video file
+    """
+    filename = full_path.name
+    entry = journal.get(relative_path, full_path)
 
-                try:
-                    data = response.json()
-                except ValueError:
-                    print(
-                        "Unable to parse JSON for call to the Studio generate upload link API "
-                        "for video {}.".format(filename)
-                    )
+    if entry.get("status") == UploadStatus.COMPLETED:
+        print(f"Skipping video {filename} uploaded by a previous run.")
+        return entry
 
-                edx_video_id = None
-                upload_url = None
+    if entry.get("status") != UploadStatus.UPLOADED:
+        entry = upload_video(full_path, relative_path, get_upload_link_url, studio_session, uploader, journal)
 
-                if "files" in data and data["files"]:
-                    file_data = data["files"][0]
+    edx_video_id = entry.get("edx_video_id")
+    langs = []
+    uploaded_langs = set(entry.get("transcripts", []))
 
-                    if "edx_video_id" in file_data:
-                        edx_video_id = file_data["edx_video_id"]
+    # Look for files with the same name as our video but with a ${LANG}.srt suffix
+    for srt_path in sorted(full_path.parent.glob(full_path.stem + "*.srt")):
+        lang = srt_path.suffixes[0][1:]
+        langs.append(lang)
 
-                    if "upload_url" in file_data:
-                        upload_url = file_data["upload_url"]
+        if lang in uploaded_langs:
+            continue
 
-                if not upload_url or not edx_video_id:
-                    print(
-                        "Unable to upload video {}; either upload_url or edx_video_id "
-                        "is missing in response from Studio generate upload link API."
-                    )
+        response = upload_transcript(srt_path, edx_video_id, lang, session=studio_session)
+        if response is not None and response.status_code == 201:
+            uploaded_langs.add(lang)
 
-                # upload video to presigned url if we have one
-                if upload_url:
-                    with full_path.open("rb") as f:
-                        data = f.read()
-                        headers = {"Content-Type": content_type}
-                        make_upload_video_request(upload_url, data, headers, filename)
+    status = entry.get("status")
+    if status == UploadStatus.UPLOADED and uploaded_langs.issuperset(langs):
+        status = UploadStatus.COMPLETED
 
-                files_data[str(relative_path)] = {"edx_video_id": edx_video_id}
-                langs = []
+    return journal.record(
+        relative_path, full_path, status=status, transcripts=sorted(uploaded_langs), lang="-".join(langs)
+    )
 
-                # Look for files with the same name as our video but with a ${LANG}.srt suffix
-                for srt_path in sorted(full_path.parent.glob(full_path.stem + "*.srt")):
-                    lang = srt_path.suffixes[0][1:]
-                    langs.append(lang)
-                    upload_transcript(srt_path, edx_video_id, lang, access_token)
 
-                files_data[str(relative_path)]["lang"] = "-".join(langs)
+def upload_video(full_path, relative_path, get_upload_link_url, studio_session, uploader, journal):
+    """
+    Generate an upload link for the video file and upload the video to it.
 
+    Arguments:
+        * full_path: path to the video file
+        * relative_path: path to the video file relative to the uploaded directory
+        * get_upload_link_url: Studio generate upload link API URL for the course
+        * studio_session: an authenticated session for the Studio API calls
+        * uploader: the uploader sending the video to the presigned upload URL
+        * journal: the upload journal to record the progress in
+
+    Returns:
+        * entry: the journal entry of the video file
+    """
+    filename = full_path.name
+    content_type = VIDEO_EXTENSION_CONTENT_TYPES.get(full_path.suffix)
+
+    request_data = {"files": [{"file_name": filename, "content_type": content_type}]}
+
+    response = make_generate_upload_link_request(get_upload_link_url, request_data, filename, session=studio_session)
+
+    data = {}
+    try:
+        data = response.json()
+    except (AttributeError, ValueError):
+        print("Unable to parse JSON for call to the Studio generate upload link API for video {}.".format(filename))
+
+    edx_video_id = None
+    upload_url = None
+
+    if "files" in data and data["files"]:
+        file_data = data["files"][0]
+
+        if "edx_video_id" in file_data:
+            edx_video_id = file_data["edx_video_id"]
+
+        if "upload_url" in file_data:
+            upload_url = file_data["upload_url"]
+
+    if not upload_url or not edx_video_id:
+        print(
+            "Unable to upload video {}; either upload_url or edx_video_id "
+            "is missing in response from Studio generate upload link API.".format(filename)
+        )
+
+    entry = journal.record(relative_path, full_path, edx_video_id=edx_video_id, status=None, transcripts=[])
+
+    # upload video to presigned url if we have one, the file is streamed from the disk
+    if upload_url:
+        entry = journal.record(relative_path, full_path, status=UploadStatus.LINK_GENERATED)
+
+        headers = {"Content-Type": content_type}
+        response = uploader.upload(upload_url, full_path, headers, filename)
+
+        if response is not None and response.status_code == 200:
+            entry = journal.record(relative_path, full_path, status=UploadStatus.UPLOADED)
+
+    return entry
+
+
+def get_default_path(input_csv_path, suffix):
+    """
+    Build a path next to the input CSV with the suffix appended to its name.
+    """
+    return input_csv_path.parent.joinpath(input_csv_path.stem + suffix)
+
+
+def main():
+    args = parse_args()
     input_csv_path = Path(args.input_csv)
+    journal = UploadJournal(args.journal or get_default_path(input_csv_path, "-upload-journal.jsonl"), args.course_id)
+    access_token = get_access_token()
+
+    get_upload_link_url = GENERATE_UPLOAD_LINK_BASE_URL + args.course_id
+    concurrency = max(args.concurrency, 1)
+    studio_session = create_session(access_token, pool_size=concurrency)
+    chunk_concurrency = max(args.chunk_concurrency, 1) if args.chunk_size > 0 else 1
+    upload_session = create_session(pool_size=concurrency * chunk_concurrency)
+    presigner = (
+        create_presigner(args.presign_url, pool_size=concurrency * chunk_concurrency) if args.presign_url else None
+    )
+    uploader = create_uploader(upload_session, args.chunk_size, chunk_concurrency, presigner, args.verify_part_etag)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        uploads = [
+            executor.submit(
+                upload_video_file,
+                full_path,
+                relative_path,
+                get_upload_link_url,
+                studio_session,
+                uploader,
+                journal,
+            )
+            for full_path, relative_path in iterate_video_files(args.directory)
+        ]
+        for upload in uploads:
+            upload.result()
 
     output_csv_path = args.output_csv
     if not output_csv_path:
-        output_csv_path = str(
-            input_csv_path.parent.joinpath(input_csv_path.stem + "-upload-results" + input_csv_path.suffix)
-        )
+        output_csv_path = str(get_default_path(input_csv_path, "-upload-results" + input_csv_path.suffix))
 
-    write_upload_results_csv(str(input_csv_path), output_csv_path, files_data)
+    write_upload_results_csv(str(input_csv_path), output_csv_path, journal.files_data())
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ import xml.dom.minidom
 from typing import Generator
 
 CDATA_PATTERN = r"<!\[CDATA\[(?P<content>.*?)\]\]>"
+CDATA_REGEX = re.compile(CDATA_PATTERN, flags=re.DOTALL)
 
 logger = logging.getLogger()
 
@@ -126,7 +127,9 @@ def clean_from_cdata(xml_string: str) -> str:
     Returns:
         str: cleaned XML string.
     """
-    return re.sub(CDATA_PATTERN, r"\g<content>", xml_string, flags=re.DOTALL)
+    if "<![CDATA[" not in xml_string:
+        return xml_string
+    return CDATA_REGEX.sub(r"\g<content>", xml_string)
 
 
 def get_xml_minidom_element_iterator(
@@ -0,0 +1,8 @@
+class ValidationError(ValueError):
+    """
+    Exception type for invalid values.
+    """
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
@@ -1,22 +1,46 @@
 import argparse
+import functools
+import ipaddress
 import re
 from typing import Callable
 
-from django.core.exceptions import ValidationError
-from django.core.validators import URLValidator
+from cc2olx.validators import ValidationError
 
+UNICODE_LETTERS = "\u00a1-\uffff"
+IPV4_PATTERN = (
+    r"(?:0|25[0-5]|2[0-4][0-9]|1[0-9]?[0-9]?|[1-9][0-9]?)"
+    r"(?:\.(?:0|25[0-5]|2[0-4][0-9]|1[0-9]?[0-9]?|[1-9][0-9]?)){3}"
+)
+IPV6_PATTERN = r"\[(?P<ipv6>[0-9a-f:.]+)\]"
+HOSTNAME_PATTERN = (
+    r"[a-z" + UNICODE_LETTERS + r"0-9](?:[a-z" + UNICODE_LETTERS + r"0-9-]{0,61}[a-z" + UNICODE_LETTERS + r"0-9])?"
+)
+DOMAIN_PATTERN = r"(?:\.(?!-)[a-z" + UNICODE_LETTERS + r"0-9-]{1,63}(?<!-))*"
+TLD_PATTERN = r"\.(?!-)(?:[a-z" + UNICODE_LETTERS + r"-]{2,63}|xn--[a-z0-9]{1,59})(?<!-)\.?"
+HOST_PATTERN = "(?:" + HOSTNAME_PATTERN + DOMAIN_PATTERN + TLD_PATTERN + "|localhost)"
+
+LINK_SOURCE_PATTERN = (
+    r"^(?:https?)://"
+    r"(?:[^\s:@/]+(?::[^\s:@/]*)?@)?"  # user:pass authentication
+    r"(?:" + IPV4_PATTERN + "|" + IPV6_PATTERN + "|" + HOST_PATTERN + ")"
+    r"(?::[0-9]{1,5})?"  # port
+    r"/?"  # trailing slash
+    r"\Z"
+)
+INVALID_URL_MESSAGE = "Enter a valid URL."
 
-def convert_to_argparse_validator(django_validator: Callable) -> Callable:
+
+def convert_to_argparse_validator(validator: Callable) -> Callable:
     """
-    Convert a Django validator to an argparse validator.
+    Convert a validator to an argparse validator.
 
-    If a Django ValidationError is raised during the validator call, it is
+    If a ValidationError is raised during the validator call, it is
     intercepted and an ArgumentTypeError is raised with the same message.
     """
 
     def argparse_validator(value):
         try:
-            django_validator(value)
+            validator(value)
         except ValidationError as exc:
             raise argparse.ArgumentTypeError(exc.message) from exc
         return value
@@ -24,17 +48,27 @@ def convert_to_argparse_validator(django_validator: Callable) -> Callable:
     return argparse_validator
 
 
-link_source_validator = convert_to_argparse_validator(
-    URLValidator(
-        schemes=["http", "https"],
-        regex=(
-            r"^(?:[a-z0-9.+-]*)://"  # scheme is validated separately
-            r"(?:[^\s:@/]+(?::[^\s:@/]*)?@)?"  # user:pass authentication
-            r"(?:" + URLValidator.ipv4_re + "|" + URLValidator.ipv6_re + "|" + URLValidator.host_re + ")"
-            r"(?::[0-9]{1,5})?"  # port
-            r"/?"  # trailing slash
-            r"\Z"
-        ),
-        flags=re.IGNORECASE,
-    )
-)
+def validate_link_source(value: str) -> None:
+    """
+    Validate the links source is an HTTP(S) URL without a path, e.g. 'https://example.com'.
+    """
+    match = _get_link_source_regex().match(value)
+    if not match:
+        raise ValidationError(INVALID_URL_MESSAGE)
+
+    if match.group("ipv6"):
+        try:
+            ipaddress.IPv6Address(match.group("ipv6"))
+        except ValueError as exc:
+            raise ValidationError(INVALID_URL_MESSAGE) from exc
+
+
+@functools.lru_cache(maxsize=None)
+def _get_link_source_regex() -> re.Pattern:
+    """
+    Compile the links source regex on the first use, it is slow because of the Unicode ranges.
+    """
+    return re.compile(LINK_SOURCE_PATTERN, flags=re.IGNORECASE)
+
+
+link_source_validator = convert_to_argparse_validator(validate_link_source)
@@ -0,0 +1,181 @@
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import attrs
+
+from cc2olx.cli import RESULT_TYPE_FOLDER, RESULT_TYPE_ZIP
+from cc2olx.conf import settings
+from cc2olx.content_post_processors.utils import load_content_post_processor_types
+from cc2olx.content_processors.utils import load_content_processor_types, load_templates
+from cc2olx.enums import ArchiveCodec, SupportedCustomBlockContentType
+from cc2olx.main import convert_one_file, release_intermediates
+from cc2olx.metrics import CartridgeMetrics
+from cc2olx.output import create_output
+from cc2olx.validators.cli import link_source_validator
+
+logger = logging.getLogger()
+
+
+class JobError(Exception):
+    """
+    Exception type for invalid worker jobs.
+    """
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        description=(
+            "This script runs a long-living converter which reads conversion jobs as JSON lines "
+            "and writes a JSON line with the result of every job."
+        )
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=argparse.FileType("r", encoding="utf-8"),
+        default=sys.stdin,
+        help="Optionally provide the path to the file to read the jobs from. The jobs are read from stdin by default.",
+    )
+    parser.add_argument(
+        "-l",
+        "--loglevel",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        help="Please provide the appropriate level to change the detail of logs.",
+    )
+    return parser.parse_args(args)
+
+
+def parse_job(job_line):
+    """
+    Parse the job line into `convert_one_file` arguments and the output options.
+
+    A job is a JSON object with the required `input` key and the optional keys
+    mirroring the cc2olx command line arguments: `output`, `result`,
+    `link_file`, `passport_file`, `relative_links_source`,
+    `content_types_with_custom_blocks`, `qti_workers`, `keep_intermediates`,
+    `compression_codec`, `compression_level` and `compression_workers`.
+    """
+    try:
+        job = json.loads(job_line)
+    except ValueError as exc:
+        raise JobError(f"The job is not a valid JSON: {exc}") from exc
+
+    if not isinstance(job, dict) or "input" not in job:
+        raise JobError("The job must be a JSON object with the input key.")
+
+    output_format = job.get("result", RESULT_TYPE_FOLDER)
+    if output_format not in (RESULT_TYPE_FOLDER, RESULT_TYPE_ZIP):
+        raise JobError(f"The result {output_format!r} is not supported.")
+
+    compression_codec = job.get("compression_codec", ArchiveCodec.GZIP)
+    if compression_codec not in list(ArchiveCodec):
+        raise JobError(f"The compression codec {compression_codec!r} is not supported.")
+
+    compression_level = job.get("compression_level")
+    if compression_level is not None and compression_level not in ArchiveCodec(compression_codec).levels:
+        raise JobError(f"The compression level {compression_level!r} is not supported by {compression_codec}.")
+
+    relative_links_source = job.get("relative_links_source")
+    if relative_links_source:
+        try:
+            link_source_validator(relative_links_source)
+        except argparse.ArgumentTypeError as exc:
+            raise JobError(str(exc)) from exc
+
+    return {
+        "input_file": Path(job["input"]).absolute(),
+        "workspace": Path.cwd() / job.get("output", "output"),
+        "output_format": output_format,
+        "link_file": job.get("link_file"),
+        "passport_file": job.get("passport_file"),
+        "relative_links_source": relative_links_source,
+        "content_types_with_custom_blocks": [
+            content_type
+            for content_type in job.get("content_types_with_custom_blocks", [])
+            if content_type in list(SupportedCustomBlockContentType)
+        ],
+        "qti_workers": job.get("qti_workers"),
+        "keep_intermediates": bool(job.get("keep_intermediates", False)),
+        "compression_codec": compression_codec,
+        "compression_level": compression_level,
+        "compression_workers": job.get("compression_workers"),
+    }
+
+
+def run_job(job_line):
+    """
+    Run the conversion job and provide its result.
+    """
+    started_at = time.perf_counter()
+    result = {"status": "ok"}
+
+    try:
+        options = parse_job(job_line)
+        result.update(input=str(options["input_file"]), output=str(options["workspace"]))
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdirname,
+            create_output(options["output_format"], options["workspace"]) as output,
+        ):
+            temp_workspace = Path(tmpdirname) / options["workspace"].stem
+            cartridge_metrics = CartridgeMetrics.for_file(options["input_file"])
+            try:
+                with cartridge_metrics.measure():
+                    convert_one_file(
+                        options["input_file"],
+                        temp_workspace,
+                        options["link_file"],
+                        options["passport_file"],
+                        options["relative_links_source"],
+                        options["content_types_with_custom_blocks"],
+                        options["qti_workers"],
+                        output,
+                        options["compression_codec"],
+                        options["compression_level"],
+                        options["compression_workers"],
+                        cartridge_metrics,
+                    )
+            finally:
+                release_intermediates(temp_workspace, output, options["keep_intermediates"])
+        result["metrics"] = attrs.asdict(cartridge_metrics)
+    except Exception as exc:
+        logger.exception("Error while running the job %s", job_line)
+        result.update(status="error", error=str(exc))
+
+    result["duration"] = round(time.perf_counter() - started_at, 3)
+    return result
+
+
+def warm_up():
+    """
+    Load the state shared by all the conversions once, before the first job comes.
+    """
+    load_content_processor_types()
+    load_content_post_processor_types()
+    load_templates(Path(settings.TEMPLATES_DIR))
+
+
+def main():
+    args = parse_args()
+
+    logging.basicConfig(level=args.loglevel, format=settings.LOG_FORMAT, stream=sys.stderr)
+    warm_up()
+    logger.info("Worker is ready")
+
+    for job_line in args.jobs:
+        if job_line.strip():
+            print(json.dumps(run_job(job_line)), flush=True)
+
+    logger.info("Worker stopped")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
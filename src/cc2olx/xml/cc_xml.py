@@ -497,10 +497,14 @@ class CommonCartridgeXmlParser(etree.XMLParser):
     An XML parser configured to return Common Cartridge element objects.
     """
 
+    # The lookup is stateless (element classes are registered on the class
+    # level), so a single instance is shared by all the parsers.
+    _element_class_lookup = CommonCartridgeElementClassLookup()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.set_element_class_lookup(CommonCartridgeElementClassLookup())
+        self.set_element_class_lookup(self._element_class_lookup)
 
 
 @common_cartridge_element
@@ -14,6 +14,7 @@ from cc2olx.content_processors.dataclasses import ContentProcessorContext
 from cc2olx.content_processors.utils import WebContentFile
 from cc2olx.models import Cartridge
 from cc2olx.parser import parse_options
+from .stub_server import StudioStubServer
 from .utils import build_multi_value_args, zip_imscc_dir
 
 
@@ -148,16 +149,37 @@ def cartridge(imscc_file, options):
     shutil.rmtree(str(options["workspace"] / imscc_file.stem))
 
 
-@pytest.fixture(scope="session")
-def video_upload_args(fixtures_data_dir):
+@pytest.fixture
+def video_upload_args(fixtures_data_dir, tmp_path):
     return {
         "course_id": "course-v1:edX+111222+111222",
         "directory": str(fixtures_data_dir.joinpath("video_files")),
         "input_csv": str(fixtures_data_dir.joinpath("video-data.csv")),
         "output_csv": NamedTemporaryFile().name,
+        "concurrency": 1,
+        "journal": str(tmp_path / "upload-journal.jsonl"),
+        "chunk_size": 0,
+        "chunk_concurrency": 4,
+        "presign_url": None,
+        "verify_part_etag": False,
     }
 
 
+@pytest.fixture
+def studio_stub_server(monkeypatch):
+    """
+    Run a local stub of the Studio video APIs and point the video upload tool to it.
+    """
+    server = StudioStubServer().start()
+    monkeypatch.setattr("cc2olx.tools.video_upload.OAUTH_TOKEN_URL", server.url + "/oauth2/access_token")
+    monkeypatch.setattr(
+        "cc2olx.tools.video_upload.GENERATE_UPLOAD_LINK_BASE_URL", server.url + "/generate_video_upload_link/"
+    )
+    monkeypatch.setattr("cc2olx.tools.video_upload.TRANSCRIPT_UPLOAD_LINK", server.url + "/transcript_upload_api/")
+    yield server
+    server.stop()
+
+
 @pytest.fixture(scope="session")
 def link_map_csv(fixtures_data_dir):
     """
@@ -0,0 +1,194 @@
+import base64
+import hashlib
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+from xml.etree import ElementTree
+
+
+class StudioStubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve the OAuth, Studio and presigned upload URL endpoints used by the video upload tool.
+
+    The upload URLs also accept the S3 multipart upload API calls, which are
+    rejected unless they are presigned by the presign endpoint.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self._read_body()
+        self.server.record(self.command, self.path, self.headers, body)
+
+        path, query = self._split_path()
+
+        if path.startswith("/upload/") and self._is_multipart_call(query) and not self._is_presigned(query):
+            self._send(403)
+        elif path.startswith("/upload/") and "uploads" in query:
+            upload_id = self.server.initiate_multipart_upload(path.rsplit("/", 1)[-1])
+            body = f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+            self._send(200, body.encode())
+        elif path.startswith("/upload/") and "uploadId" in query:
+            part_etags = [part.findtext("ETag") for part in ElementTree.fromstring(body).iter("Part")]
+            self.server.complete_multipart_upload(query["uploadId"][0], part_etags)
+            self._send(200, b"<CompleteMultipartUploadResult></CompleteMultipartUploadResult>")
+        elif self.path == "/presign/":
+            self._send_json(200, {"url": self.server.presign(**json.loads(body))})
+        elif self.path == "/oauth2/access_token":
+            self._send_json(200, {"access_token": "stub-token"})
+        elif self.path.startswith("/generate_video_upload_link/"):
+            filename = json.loads(body)["files"][0]["file_name"]
+            edx_video_id = self.server.next_video_id(filename)
+            upload_url = f"{self.server.url}/upload/{edx_video_id}"
+            self._send_json(200, {"files": [{"edx_video_id": edx_video_id, "upload_url": upload_url}]})
+        elif self.path == "/transcript_upload_api/":
+            self._send_json(201, {})
+        else:
+            self._send_json(404, {})
+
+    def do_DELETE(self):
+        self.server.record(self.command, self.path, self.headers, b"")
+        _, query = self._split_path()
+        if not self._is_presigned(query):
+            self._send(403)
+            return
+        self.server.multipart_uploads.pop(query.get("uploadId", [""])[0], None)
+        self._send(204)
+
+    def _split_path(self):
+        url = urlsplit(self.path)
+        return url.path, parse_qs(url.query, keep_blank_values=True)
+
+    @staticmethod
+    def _is_multipart_call(query):
+        return any(param in query for param in ("uploads", "uploadId", "partNumber"))
+
+    @staticmethod
+    def _is_presigned(query):
+        return query.get("X-Amz-Signature") == [StudioStubServer.PRESIGNED_SIGNATURE]
+
+    def do_PUT(self):
+        body = self._read_body()
+        self.server.record(self.command, self.path, self.headers, body)
+
+        path, query = self._split_path()
+
+        if path.startswith("/upload/") and self._is_multipart_call(query) and not self._is_presigned(query):
+            self._send(403)
+        elif path.startswith("/upload/") and "partNumber" in query:
+            part_number = int(query["partNumber"][0])
+            digest = hashlib.md5(body)
+            if self.server.should_fail_part(part_number):
+                self._send(500)
+            elif self.headers.get("Content-MD5") != base64.b64encode(digest.digest()).decode():
+                self._send(400)
+            else:
+                self.server.multipart_uploads[query["uploadId"][0]]["parts"][part_number] = body
+                # The ETag isn't the MD5 digest of the part on the buckets encrypted with SSE-KMS or SSE-C.
+                etag = uuid.uuid4().hex if self.server.encrypted_etags else digest.hexdigest()
+                self._send(200, headers={"ETag": f'"{etag}"'})
+        elif path.startswith("/upload/"):
+            self.server.uploads[path.rsplit("/", 1)[-1]] = body
+            self._send_json(200, {})
+        else:
+            self._send_json(404, {})
+
+
+class StudioStubServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the Studio video APIs which records the requests it receives.
+    """
+
+    daemon_threads = True
+
+    PRESIGNED_SIGNATURE = "stub-signature"
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StudioStubRequestHandler)
+        self.requests = []
+        self.uploads = {}
+        self.multipart_uploads = {}
+        self.part_failures = {}
+        self.encrypted_etags = False
+        self._video_ids = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def record(self, method, path, headers, body):
+        with self._lock:
+            self.requests.append({"method": method, "path": path, "headers": dict(headers), "body": body})
+
+    def next_video_id(self, filename):
+        with self._lock:
+            return self._video_ids.setdefault(filename, f"video-{len(self._video_ids)}")
+
+    def presign(self, upload_url, operation, upload_id=None, part_number=None):
+        """
+        Provide the upload URL with the multipart operation parameters and the presigned signature.
+        """
+        params = {
+            "initiate": {"uploads": ""},
+            "upload_part": {"partNumber": part_number, "uploadId": upload_id},
+            "complete": {"uploadId": upload_id},
+            "abort": {"uploadId": upload_id},
+        }[operation]
+        params["X-Amz-Signature"] = self.PRESIGNED_SIGNATURE
+        return f"{urlsplit(upload_url)._replace(query='').geturl()}?{urlencode(params)}"
+
+    def initiate_multipart_upload(self, video_id):
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self.multipart_uploads[upload_id] = {"video_id": video_id, "parts": {}}
+        return upload_id
+
+    def complete_multipart_upload(self, upload_id, part_etags):
+        with self._lock:
+            multipart_upload = self.multipart_uploads.pop(upload_id)
+            parts = [multipart_upload["parts"][part_number] for part_number in range(1, len(part_etags) + 1)]
+            self.uploads[multipart_upload["video_id"]] = b"".join(parts)
+
+    def should_fail_part(self, part_number):
+        """
+        Fail the part upload as many times as `part_failures` requires for the part number.
+        """
+        with self._lock:
+            if self.part_failures.get(part_number, 0) > 0:
+                self.part_failures[part_number] -= 1
+                return True
+            return False
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
@@ -0,0 +1,61 @@
+import io
+import tarfile
+
+from cc2olx.api import convert
+from .utils import format_xml
+
+
+class NonSeekableStream(io.RawIOBase):
+    """
+    Binary stream supporting sequential reads or writes only, like a socket.
+    """
+
+    def __init__(self, data=b""):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._buffer.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def write(self, data):
+        return self._buffer.write(data)
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+
+def test_convert_bytes(imscc_file, options, studio_course_xml):
+    destination = io.BytesIO()
+
+    convert(
+        imscc_file.read_bytes(),
+        destination,
+        link_file=options["link_file"],
+        relative_links_source=options["relative_links_source"],
+        content_types_with_custom_blocks=options["content_types_with_custom_blocks"],
+    )
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r:gz") as tgz:
+        assert len(tgz.getmembers()) == 8
+        course_xml = tgz.extractfile("course.xml").read().decode("utf-8")
+        assert tgz.extractfile("policies/course/policy.json").read()
+
+    assert format_xml(course_xml) == format_xml(studio_course_xml)
+
+
+def test_convert_non_seekable_streams(imscc_file):
+    source = NonSeekableStream(imscc_file.read_bytes())
+    destination = NonSeekableStream()
+
+    convert(source, destination, name=imscc_file.stem)
+
+    with tarfile.open(fileobj=io.BytesIO(destination.getvalue()), mode="r:gz") as tgz:
+        assert "course.xml" in tgz.getnames()
@@ -0,0 +1,214 @@
+import functools
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cc2olx.claims import JOB_STATUS_ERROR, ClaimLostError, JobClaims
+from cc2olx.output import FolderOutput, GuardedOutput
+
+
+def test_cartridge_is_claimed_once(tmp_path):
+    input_file = Path("course.imscc")
+
+    with JobClaims(tmp_path, "first") as first_claims, JobClaims(tmp_path, "second") as second_claims:
+        assert first_claims.claim(input_file)
+        assert not second_claims.claim(input_file)
+
+        first_claims.complete(input_file)
+        assert not second_claims.is_done(input_file)
+        second_claims.refresh()
+
+        assert second_claims.is_done(input_file)
+        assert not second_claims.claim(input_file)
+        done_name = first_claims.get_job_key(input_file) + ".done"
+
+    assert json.loads((tmp_path / done_name).read_text())["node"] == "first"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [done_name]
+
+
+def test_failed_cartridge_is_not_claimed_again(tmp_path):
+    input_file = Path("course.imscc")
+
+    with JobClaims(tmp_path, "first") as claims:
+        claims.claim(input_file)
+        claims.complete(input_file, JOB_STATUS_ERROR)
+
+        assert not claims.claim(input_file)
+
+    assert json.loads((tmp_path / f"{claims.get_job_key(input_file)}.done").read_text())["status"] == JOB_STATUS_ERROR
+
+
+def test_abandoned_cartridge_is_reclaimed(tmp_path):
+    input_file = Path("course.imscc")
+    dead_claims = JobClaims(tmp_path, "dead", timeout=60)
+    dead_claims.claim(input_file)
+    abandoned_at = dead_claims.get_shared_time() - 61
+    claim_path = tmp_path / f"{dead_claims.get_job_key(input_file)}.claim.0"
+    os.utime(claim_path, (abandoned_at, abandoned_at))
+
+    with JobClaims(tmp_path, "alive", timeout=60) as claims:
+        assert claims.claim(input_file)
+
+    assert not claim_path.exists()
+
+
+def test_heartbeat_keeps_claim_alive(tmp_path):
+    input_file = Path("course.imscc")
+
+    with JobClaims(tmp_path, "first", timeout=60) as first_claims, JobClaims(tmp_path, "second", timeout=60) as claims:
+        first_claims.claim(input_file)
+        abandoned_at = claims.get_shared_time() - 61
+        os.utime(tmp_path / f"{claims.get_job_key(input_file)}.claim.0", (abandoned_at, abandoned_at))
+
+        first_claims.heartbeat()
+
+        assert not claims.claim(input_file)
+
+
+def _claim_all(claims_directory, node_id, input_files, results_queue):
+    with JobClaims(claims_directory, node_id) as claims:
+        for input_file in input_files:
+            if claims.claim(input_file):
+                claims.complete(input_file)
+                results_queue.put(input_file.name)
+
+
+def test_nodes_claim_every_cartridge_once(tmp_path):
+    input_files = [Path(f"course_{index}.imscc") for index in range(30)]
+    results_queue = multiprocessing.Queue()
+    nodes = [
+        multiprocessing.Process(target=_claim_all, args=(tmp_path, f"node-{index}", input_files, results_queue))
+        for index in range(4)
+    ]
+
+    for node in nodes:
+        node.start()
+    for node in nodes:
+        node.join()
+
+    claimed_names = [results_queue.get(timeout=5) for _ in input_files]
+    assert sorted(claimed_names) == sorted(input_file.name for input_file in input_files)
+    assert results_queue.empty()
+
+
+def test_nodes_convert_shared_batch(tmp_path, imscc_file):
+    input_directory = tmp_path / "input"
+    input_directory.mkdir()
+    for index in range(3):
+        (input_directory / f"course_{index}.imscc").write_bytes(imscc_file.read_bytes())
+    command = [
+        sys.executable,
+        "-m",
+        "cc2olx.main",
+        "-i",
+        str(input_directory),
+        "-o",
+        str(tmp_path / "output"),
+        "--claims-directory",
+        str(tmp_path / "claims"),
+        "--claim-timeout",
+        "3",
+    ]
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    nodes = [subprocess.Popen(command + ["--node-id", f"node-{index}"], env=environment) for index in range(2)]
+    for node in nodes:
+        assert node.wait(timeout=60) == 0
+
+    assert sorted(path.name for path in (tmp_path / "output").iterdir()) == [
+        "course_0.tar.gz",
+        "course_1.tar.gz",
+        "course_2.tar.gz",
+    ]
+    claims = JobClaims(tmp_path / "claims", input_root=input_directory)
+    assert sorted(path.name for path in (tmp_path / "claims").iterdir()) == sorted(
+        f"{claims.get_job_key(input_directory / f'course_{index}.imscc')}.done" for index in range(3)
+    )
+
+
+def test_same_named_cartridges_are_claimed_separately(tmp_path):
+    first_file, second_file = tmp_path / "first" / "course.imscc", tmp_path / "second" / "course.imscc"
+
+    with JobClaims(tmp_path / "claims", "node", input_root=tmp_path) as claims:
+        assert claims.claim(first_file)
+        assert claims.claim(second_file)
+        claims.complete(first_file)
+
+        assert not claims.is_done(second_file)
+
+
+def test_lost_claim_discards_output(tmp_path):
+    input_file = Path("course.imscc")
+    output_directory = tmp_path / "output"
+
+    with JobClaims(tmp_path / "claims", "first", timeout=60) as first_claims:
+        first_claims.claim(input_file)
+        claimed_output = GuardedOutput(
+            FolderOutput(output_directory, partial_tag="first"),
+            functools.partial(first_claims.check_not_lost, input_file),
+            functools.partial(first_claims.ensure_claimed, input_file),
+        )
+        claimed_output.open()
+
+        with pytest.raises(ClaimLostError), claimed_output.open_file("course.tar.gz") as output_file:
+            output_file.write(b"archive")
+            assert (output_directory / "course.tar.gz.first.partial").exists()
+            # Another node takes the claim over, the heartbeat notices it.
+            (tmp_path / "claims" / f"{first_claims.get_job_key(input_file)}.claim.0").unlink()
+            first_claims.heartbeat()
+            output_file.write(b"more")
+
+        first_claims.release(input_file)
+
+    assert list(output_directory.iterdir()) == []
+
+
+def test_taken_over_claim_is_not_completed(tmp_path):
+    input_file = Path("course.imscc")
+    claims_directory = tmp_path / "claims"
+
+    with JobClaims(claims_directory, "first", timeout=60) as first_claims:
+        first_claims.claim(input_file)
+        claim_path = claims_directory / f"{first_claims.get_job_key(input_file)}.claim.0"
+        claim_path.rename(claim_path.with_suffix(".1"))
+
+        with pytest.raises(ClaimLostError):
+            first_claims.ensure_claimed(input_file)
+
+
+def test_poll_lists_claims_directory_once(tmp_path, mocker):
+    input_files = [Path(f"course_{index}.imscc") for index in range(20)]
+
+    with JobClaims(tmp_path, "first") as first_claims, JobClaims(tmp_path, "second") as claims:
+        for input_file in input_files[:10]:
+            first_claims.claim(input_file)
+            first_claims.complete(input_file)
+        first_claims.claim(input_files[10])
+        scandir_spy = mocker.spy(os, "scandir")
+        glob_spy = mocker.spy(Path, "glob")
+
+        claims.refresh()
+        pending_files = [input_file for input_file in input_files if not claims.is_done(input_file)]
+        claimed_file = next(input_file for input_file in pending_files if claims.claim(input_file))
+
+        assert pending_files == input_files[10:]
+        assert claimed_file == input_files[11]
+        assert scandir_spy.call_count == 1
+        glob_spy.assert_not_called()
+
+
+def test_finished_cartridge_is_remembered(tmp_path):
+    input_file = Path("course.imscc")
+
+    with JobClaims(tmp_path, "first") as claims:
+        claims.claim(input_file)
+        claims.complete(input_file)
+        (tmp_path / f"{claims.get_job_key(input_file)}.done").unlink()
+        claims.refresh()
+
+        assert claims.is_done(input_file)
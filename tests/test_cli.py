@@ -30,6 +30,21 @@ def test_parse_args(imscc_file):
         output="output",
         relative_links_source=None,
         content_types_with_custom_blocks=[],
+        qti_workers=None,
+        batch_workers=None,
+        memory_budget=None,
+        disk_budget=None,
+        claims_directory=None,
+        node_id=None,
+        claim_timeout=300,
+        keep_intermediates=False,
+        compression_codec="gzip",
+        compression_level=None,
+        compression_workers=None,
+        metrics_file=None,
+        metrics_format="json",
+        analyze=False,
+        analyze_format="json",
     )
 
 
@@ -49,6 +64,21 @@ def test_parse_args_csv_file(imscc_file, link_map_csv):
         output="output",
         relative_links_source=None,
         content_types_with_custom_blocks=[],
+        qti_workers=None,
+        batch_workers=None,
+        memory_budget=None,
+        disk_budget=None,
+        claims_directory=None,
+        node_id=None,
+        claim_timeout=300,
+        keep_intermediates=False,
+        compression_codec="gzip",
+        compression_level=None,
+        compression_workers=None,
+        metrics_file=None,
+        metrics_format="json",
+        analyze=False,
+        analyze_format="json",
     )
 
 
@@ -66,6 +96,21 @@ def test_parse_args_passport_file(imscc_file, passports_csv):
         output="output",
         relative_links_source=None,
         content_types_with_custom_blocks=[],
+        qti_workers=None,
+        batch_workers=None,
+        memory_budget=None,
+        disk_budget=None,
+        claims_directory=None,
+        node_id=None,
+        claim_timeout=300,
+        keep_intermediates=False,
+        compression_codec="gzip",
+        compression_level=None,
+        compression_workers=None,
+        metrics_file=None,
+        metrics_format="json",
+        analyze=False,
+        analyze_format="json",
     )
 
 
@@ -86,6 +131,21 @@ def test_parse_args_with_correct_relative_links_source(imscc_file: Path) -> None
         output="output",
         relative_links_source=relative_links_source,
         content_types_with_custom_blocks=[],
+        qti_workers=None,
+        batch_workers=None,
+        memory_budget=None,
+        disk_budget=None,
+        claims_directory=None,
+        node_id=None,
+        claim_timeout=300,
+        keep_intermediates=False,
+        compression_codec="gzip",
+        compression_level=None,
+        compression_workers=None,
+        metrics_file=None,
+        metrics_format="json",
+        analyze=False,
+        analyze_format="json",
     )
 
 
@@ -119,6 +179,21 @@ def test_parse_args_with_correct_content_types_with_custom_blocks(
         output="output",
         relative_links_source=None,
         content_types_with_custom_blocks=content_types_with_custom_blocks,
+        qti_workers=None,
+        batch_workers=None,
+        memory_budget=None,
+        disk_budget=None,
+        claims_directory=None,
+        node_id=None,
+        claim_timeout=300,
+        keep_intermediates=False,
+        compression_codec="gzip",
+        compression_level=None,
+        compression_workers=None,
+        metrics_file=None,
+        metrics_format="json",
+        analyze=False,
+        analyze_format="json",
     )
 
 
@@ -143,3 +218,30 @@ def test_parse_args_with_incorrect_content_types_with_custom_blocks(
     parse_args(["-i", str(imscc_file), "-c", content_type_with_custom_block])
 
     logger_mock.warning.assert_called_once_with(expected_log_message)
+
+
+@pytest.mark.parametrize("extra_args", [["-r", "zip"], ["--batch-workers", "2"], ["--analyze"]])
+def test_parse_args_with_claims_directory_conflicts(imscc_file: Path, extra_args: List[str]) -> None:
+    """
+    Test arguments parser rejects the claims directory with the options nodes can't share.
+    """
+    with pytest.raises(SystemExit):
+        parse_args(["-i", str(imscc_file), "--claims-directory", "claims", *extra_args])
+
+
+@pytest.mark.parametrize(
+    "extra_args",
+    [["--compression-codec", "bz2", "--compression-level", "0"], ["--compression-level", "10"]],
+)
+def test_parse_args_rejects_unsupported_compression_level(imscc_file: Path, extra_args: List[str]) -> None:
+    """
+    Test arguments parser rejects the compression levels the codec doesn't support.
+    """
+    with pytest.raises(SystemExit):
+        parse_args(["-i", str(imscc_file), *extra_args])
+
+
+def test_parse_args_accepts_bz2_compression_level(imscc_file: Path) -> None:
+    parsed_args = parse_args(["-i", str(imscc_file), "--compression-codec", "bz2", "--compression-level", "1"])
+
+    assert parsed_args.compression_level == 1
@@ -0,0 +1,108 @@
+import gzip
+import io
+import os
+import tarfile
+import zlib
+
+import pytest
+
+from cc2olx import compression
+from cc2olx.compression import (
+    SEGMENT_SIZE,
+    ParallelGzipWriter,
+    compress_deflate_block,
+    is_incompressible,
+    open_tar_archive,
+)
+from cc2olx.enums import ArchiveCodec
+
+
+def test_compress_deflate_block_with_dictionary():
+    dictionary = b"cc2olx " * 100
+    data = b"cc2olx " * 100
+
+    compressed = compress_deflate_block(data, 6, dictionary)
+
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=dictionary)
+    assert decompressor.decompress(compressed) == data
+    assert len(compressed) < len(compress_deflate_block(data, 6))
+
+
+def test_is_incompressible():
+    assert is_incompressible(os.urandom(64 * 1024))
+    assert not is_incompressible(b"<p>text</p>" * 10000)
+    assert not is_incompressible(os.urandom(1024))
+
+
+@pytest.mark.parametrize("data_size", [0, 1, 4096, 4096 * 3 + 17, 100_000])
+def test_parallel_gzip_writer_writes_single_member(data_size):
+    data = os.urandom(data_size // 2) + b"x" * (data_size - data_size // 2)
+    destination = io.BytesIO()
+
+    with ParallelGzipWriter(destination, level=6, workers=2, block_size=4096) as gzip_file:
+        for chunk in (data[start:][:1000] for start in range(0, len(data), 1000)):
+            gzip_file.write(chunk)
+
+    assert gzip.decompress(destination.getvalue()) == data
+    assert zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(destination.getvalue()) == data
+    assert not destination.closed
+
+
+def test_compress_deflate_block_stores_incompressible_segments(mocker):
+    media = os.urandom(SEGMENT_SIZE * 2)
+    text = b"<p>text</p>" * SEGMENT_SIZE
+    create_compressor_mock = mocker.spy(compression, "create_deflate_compressor")
+
+    compressed = compress_deflate_block(text[:SEGMENT_SIZE] + media + text, 6)
+
+    assert [call.args[0] for call in create_compressor_mock.call_args_list] == [6, 0, 6]
+    assert zlib.decompressobj(-zlib.MAX_WBITS).decompress(compressed) == text[:SEGMENT_SIZE] + media + text
+
+
+def test_parallel_gzip_writer_limits_pending_blocks(mocker):
+    destination = io.BytesIO()
+    writer = ParallelGzipWriter(destination, workers=1, block_size=10)
+    write_block_mock = mocker.spy(writer, "_write_block")
+
+    writer.write(b"x" * 100)
+
+    assert write_block_mock.call_count == 8
+    assert len(writer._pending) == 2
+
+    writer.close()
+
+    assert gzip.decompress(destination.getvalue()) == b"x" * 100
+
+
+@pytest.mark.parametrize(
+    "codec,level,workers,read_mode",
+    [
+        (ArchiveCodec.GZIP, None, None, "r|gz"),
+        (ArchiveCodec.GZIP, 1, 3, "r|gz"),
+        (ArchiveCodec.XZ, 0, None, "r|xz"),
+        (ArchiveCodec.BZ2, 1, None, "r|bz2"),
+        (ArchiveCodec.STORE, None, None, "r|"),
+        ("store", None, None, "r|"),
+    ],
+)
+def test_open_tar_archive(codec, level, workers, read_mode):
+    destination = io.BytesIO()
+
+    with open_tar_archive(destination, codec, level, workers) as archive:
+        for index in range(3):
+            data = bytes([index]) * 100_000
+            tar_info = tarfile.TarInfo(f"file_{index}")
+            tar_info.size = len(data)
+            archive.addfile(tar_info, io.BytesIO(data))
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode=read_mode) as archive:
+        members = {member.name: archive.extractfile(member).read() for member in archive}
+
+    assert list(members) == ["file_0", "file_1", "file_2"]
+    assert members["file_2"] == b"\x02" * 100_000
+
+
+def test_open_tar_archive_rejects_unsupported_level():
+    with pytest.raises(ValueError), open_tar_archive(io.BytesIO(), ArchiveCodec.BZ2, 0):
+        pass
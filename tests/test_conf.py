@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from cc2olx import settings as default_settings
+from cc2olx.conf import LazySettings, import_string
+
+
+def test_django_settings_are_honored_when_configured(settings):
+    settings.CONTENT_POST_PROCESSORS = []
+
+    assert LazySettings().CONTENT_POST_PROCESSORS == []
+
+
+def test_settings_module_is_used_without_django(monkeypatch):
+    monkeypatch.delitem(sys.modules, "django.conf")
+    monkeypatch.delenv("DJANGO_SETTINGS_MODULE", raising=False)
+
+    assert LazySettings().CONTENT_PROCESSORS == default_settings.CONTENT_PROCESSORS
+
+
+def test_custom_settings_module_is_used_without_django(monkeypatch):
+    custom_settings = types.ModuleType("custom_settings")
+    custom_settings.CONTENT_PROCESSORS = ["custom.Processor"]
+    monkeypatch.setitem(sys.modules, "custom_settings", custom_settings)
+    monkeypatch.delitem(sys.modules, "django.conf")
+    monkeypatch.setenv("DJANGO_SETTINGS_MODULE", "custom_settings")
+
+    assert LazySettings().CONTENT_PROCESSORS == ["custom.Processor"]
+
+
+def test_import_string():
+    assert import_string("cc2olx.conf.LazySettings") is LazySettings
+
+
+@pytest.mark.parametrize("dotted_path", ["cc2olx", "cc2olx.conf.MissingAttribute"])
+def test_import_string_raises_import_error(dotted_path):
+    with pytest.raises(ImportError):
+        import_string(dotted_path)
+
+
+def test_cli_does_not_import_django():
+    code = "import sys, cc2olx.main, cc2olx.worker, cc2olx.api; print('django' in sys.modules)"
+
+    completed_process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={"PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+    assert completed_process.stdout.strip() == "False"
@@ -0,0 +1,61 @@
+import xml.dom.minidom
+
+from cc2olx.content_post_processors import StaticLinkPostProcessor
+from cc2olx.content_post_processors.dataclasses import ContentPostProcessorContext
+
+
+class TestStaticLinkPostProcessor:
+    def test_repeated_relative_link_is_processed_once(self, cartridge, relative_links_source):
+        context = ContentPostProcessorContext(relative_links_source=relative_links_source)
+        post_processor = StaticLinkPostProcessor(cartridge, context)
+        doc = xml.dom.minidom.Document()
+        html_node = doc.createElement("html")
+        html_node.appendChild(doc.createCDATASection('<img src="img.png"><a href="img.png">Image</a>'))
+
+        post_processor.process(html_node)
+
+        assert html_node.firstChild.nodeValue == (
+            f'<img src="{relative_links_source}/img.png"><a href="{relative_links_source}/img.png">Image</a>'
+        )
+
+    def test_element_link_attribute_is_processed(self, cartridge):
+        context = ContentPostProcessorContext(relative_links_source=None)
+        post_processor = StaticLinkPostProcessor(cartridge, context)
+        doc = xml.dom.minidom.Document()
+        img_node = doc.createElement("img")
+        img_node.setAttribute("src", "$IMS-CC-FILEBASE$/images/img%20name.png?canvas_download=1")
+
+        post_processor.process(img_node)
+
+        assert img_node.getAttribute("src") == "/static/images/img name.png"
+
+    def test_text_without_links_is_not_scanned(self, cartridge, mocker):
+        context = ContentPostProcessorContext(relative_links_source=None)
+        post_processor = StaticLinkPostProcessor(cartridge, context)
+        findall_mock = mocker.patch("cc2olx.content_post_processors.static_links.re.findall")
+        doc = xml.dom.minidom.Document()
+        html_node = doc.createElement("html")
+        html_node.appendChild(doc.createCDATASection("<p>Plain text</p>"))
+
+        post_processor.process(html_node)
+
+        findall_mock.assert_not_called()
+        assert post_processor.stats == {"link_scans_skipped": 1}
+
+    def test_links_in_html_with_xml_declaration_are_processed(self, cartridge):
+        context = ContentPostProcessorContext(relative_links_source=None)
+        post_processor = StaticLinkPostProcessor(cartridge, context)
+        doc = xml.dom.minidom.Document()
+        html_node = doc.createElement("html")
+        html_node.appendChild(
+            doc.createCDATASection(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<html><body><img src="$IMS-CC-FILEBASE$/img.png"></body></html>'
+            )
+        )
+
+        post_processor.process(html_node)
+
+        assert html_node.firstChild.nodeValue == (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<html><body><img src="/static/img.png"></body></html>'
+        )
@@ -1,6 +1,8 @@
 import pytest
 
 from cc2olx.content_processors import HtmlContentProcessor
+from cc2olx.content_processors.dataclasses import ContentProcessorContext
+from cc2olx.iframe_link_parser import KalturaIframeLinkParser
 from cc2olx.models import Cartridge
 
 
@@ -174,3 +176,43 @@ class TestHtmlContentProcessor:
         processor = HtmlContentProcessor(cartridge, empty_content_processor_context)
 
         assert processor.is_known_unprocessed_resource_type(resource_type) is False
+
+    def test_html_without_iframe_is_not_parsed(self, cartridge, link_map_csv, mocker):
+        context = ContentProcessorContext(
+            iframe_link_parser=KalturaIframeLinkParser(link_map_csv),
+            lti_consumer_ids=set(),
+            content_types_with_custom_blocks=[],
+        )
+        processor = HtmlContentProcessor(cartridge, context)
+        fromstring_mock = mocker.patch("cc2olx.content_processors.html.lxml.html.fromstring")
+
+        olx_nodes = processor._create_nodes({"html": "<p>No embedded content</p>"})
+
+        fromstring_mock.assert_not_called()
+        assert olx_nodes[0].toxml() == "<html><![CDATA[<p>No embedded content</p>]]></html>"
+        assert processor.stats == {"iframe_parses_skipped": 1}
+
+    def test_html_with_iframe_is_parsed(self, cartridge, link_map_csv, iframe_content):
+        context = ContentProcessorContext(
+            iframe_link_parser=KalturaIframeLinkParser(link_map_csv),
+            lti_consumer_ids=set(),
+            content_types_with_custom_blocks=[],
+        )
+        processor = HtmlContentProcessor(cartridge, context)
+
+        olx_nodes = processor._create_nodes({"html": iframe_content.replace("<iframe", "<IFRAME")})
+
+        assert [node.tagName for node in olx_nodes] == ["html", "video"]
+        assert processor.stats == {"iframe_parses": 1}
+
+    def test_html_with_xml_declaration_is_parsed(self, cartridge, link_map_csv, iframe_content):
+        context = ContentProcessorContext(
+            iframe_link_parser=KalturaIframeLinkParser(link_map_csv),
+            lti_consumer_ids=set(),
+            content_types_with_custom_blocks=[],
+        )
+        processor = HtmlContentProcessor(cartridge, context)
+
+        olx_nodes = processor._create_nodes({"html": '<?xml version="1.0" encoding="UTF-8"?>\n' + iframe_content})
+
+        assert [node.tagName for node in olx_nodes] == ["html", "video"]
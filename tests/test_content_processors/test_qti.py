@@ -1,7 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from cc2olx.content_processors import QtiContentProcessor
-from cc2olx.content_processors.qti import QtiError
+from cc2olx.content_processors.qti import (
+    FibProblemRawAnswers,
+    QtiConverter,
+    QtiError,
+    build_fib_regexp_answers,
+    convert_qti,
+    convert_qti_file,
+)
 from cc2olx.models import Cartridge
 
 
@@ -23,3 +32,84 @@ class TestQtiContentProcessor:
             processor.process(resource, idref)
 
         assert str(exc_info.value) == 'Unknown cc_profile: "cc.strange.v0p1"'
+
+    def test_prefetched_conversion_is_used_during_processing(self, cartridge, empty_content_processor_context):
+        processor = QtiContentProcessor(cartridge, empty_content_processor_context)
+        idref = "resource_4_qti"
+        resource = cartridge.define_resource(idref)
+        expected_nodes = [node.toxml() for node in processor.process(resource, idref)]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            processor.prefetch([resource], executor)
+        olx_nodes = processor.process(resource, idref)
+
+        assert [node.toxml() for node in olx_nodes] == expected_nodes
+
+    def test_prefetched_conversion_error_is_raised_during_processing(
+        self,
+        corner_cases_imscc,
+        temp_workspace_path,
+        empty_content_processor_context,
+    ):
+        cartridge = Cartridge(corner_cases_imscc, temp_workspace_path)
+        cartridge.load_manifest_extracted()
+        cartridge.normalize()
+        processor = QtiContentProcessor(cartridge, empty_content_processor_context)
+        idref = "unknown_qti_assessment_content"
+        resource = cartridge.define_resource(idref)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            processor.prefetch([resource], executor)
+
+        with pytest.raises(QtiError):
+            processor.process(resource, idref)
+
+
+def test_convert_qti_file_gives_out_serialized_problems(cartridge):
+    resource = cartridge.define_resource("resource_4_qti")
+    resource_file_path = cartridge.build_resource_file_path(resource["children"][0].href)
+
+    serialized_problems = convert_qti_file(resource_file_path)
+
+    assert serialized_problems
+    assert all(isinstance(serialized_problem, str) for serialized_problem in serialized_problems)
+
+
+def test_convert_qti_matches_processor_output(cartridge, empty_content_processor_context):
+    processor = QtiContentProcessor(cartridge, empty_content_processor_context)
+    idref = "resource_4_qti"
+    resource = cartridge.define_resource(idref)
+    resource_file_path = cartridge.build_resource_file_path(resource["children"][0].href)
+
+    olx_nodes = convert_qti(resource_file_path)
+
+    assert [node.toxml() for node in olx_nodes] == [node.toxml() for node in processor.process(resource, idref)]
+
+
+class TestFibRegexpAnswersBuilding:
+    def test_answers_are_built(self):
+        raw_answers = FibProblemRawAnswers(exact_answers=["a.b"], answer_patterns=["^ab+$", "c*"])
+
+        data = QtiConverter._build_fib_problem_regexp_answers(raw_answers)
+
+        assert data == {"answer": "^ab+$", "additional_answers": ["c*", r"a\.b"]}
+        assert raw_answers == FibProblemRawAnswers(exact_answers=["a.b"], answer_patterns=["^ab+$", "c*"])
+
+    def test_answers_are_cached(self):
+        build_fib_regexp_answers.cache_clear()
+        raw_answers = FibProblemRawAnswers(exact_answers=["x"], answer_patterns=["y+"])
+
+        first_data = QtiConverter._build_fib_problem_regexp_answers(raw_answers)
+        first_data["additional_answers"].append("mutated")
+        second_data = QtiConverter._build_fib_problem_regexp_answers(raw_answers)
+
+        assert second_data == {"answer": "y+", "additional_answers": ["x"]}
+        assert build_fib_regexp_answers.cache_info().hits == 1
+
+    def test_invalid_pattern_is_reported(self, caplog):
+        build_fib_regexp_answers.cache_clear()
+
+        answers = build_fib_regexp_answers((), ("(unclosed",))
+
+        assert answers == ("(unclosed",)
+        assert "Invalid Fill-In-The-Blank answer pattern '(unclosed'" in caplog.text
@@ -1,4 +1,10 @@
-from cc2olx.content_processors.utils import WebContentFile
+from cc2olx.content_processors import HtmlContentProcessor, PDFContentProcessor, QtiContentProcessor
+from cc2olx.content_processors.utils import (
+    WebContentFile,
+    generate_default_ora_criteria,
+    load_content_processor_types,
+    render_template,
+)
 
 
 class TestWebContentFile:
@@ -30,3 +36,37 @@ class TestWebContentFile:
         web_content_file = WebContentFile(cartridge, resource["children"][0])
 
         assert web_content_file.is_from_web_resources_dir() is False
+
+
+def test_render_template():
+    html = render_template("image_webcontent.html", olx_static_path="/static/img.png", static_file_path="img.png")
+
+    assert '<img src="/static/img.png" alt="img.png">' in html
+
+
+def test_default_ora_criteria_are_independent_copies():
+    first_criteria = generate_default_ora_criteria()
+    first_criteria[0].setAttribute("feedback", "required")
+
+    second_criteria = generate_default_ora_criteria()
+
+    assert [criterion.getAttribute("feedback") for criterion in second_criteria] == ["optional", "optional"]
+    assert first_criteria[1] is not second_criteria[1]
+
+
+class TestContentProcessorTypesLoading:
+    def test_all_processors_are_loaded_without_resource_types(self, settings):
+        assert len(load_content_processor_types()) == len(settings.CONTENT_PROCESSORS)
+
+    def test_only_processors_handling_resource_types_are_loaded(self):
+        assert load_content_processor_types({"webcontent"}) == [PDFContentProcessor, HtmlContentProcessor]
+
+    def test_resource_type_patterns_are_matched(self):
+        processor_types = load_content_processor_types({"imsqti_xmlv1p2/imscc_xmlv1p1/assessment"})
+
+        assert processor_types == [QtiContentProcessor, HtmlContentProcessor]
+
+    def test_processors_without_resource_types_setting_are_always_loaded(self, settings):
+        settings.CONTENT_PROCESSOR_RESOURCE_TYPES = {}
+
+        assert len(load_content_processor_types(set())) == len(settings.CONTENT_PROCESSORS)
@@ -0,0 +1,110 @@
+import threading
+import zipfile
+
+import pytest
+
+from cc2olx import filesystem
+from cc2olx.enums import FileType
+
+
+class TestCommonCartridgeXmlParserPool:
+    def test_parser_is_reused_within_thread(self):
+        pool = filesystem.CommonCartridgeXmlParserPool(recover=True)
+
+        with pool.parser() as first_parser:
+            pass
+        with pool.parser() as second_parser:
+            pass
+
+        assert first_parser is second_parser
+        assert pool.stats() == {"created": 1, "reused": 1}
+
+    def test_nested_usage_gets_temporary_parser(self):
+        pool = filesystem.CommonCartridgeXmlParserPool(recover=True)
+
+        with pool.parser() as outer_parser:
+            with pool.parser() as inner_parser:
+                assert inner_parser is not outer_parser
+
+        with pool.parser() as parser:
+            assert parser is outer_parser
+
+    def test_threads_get_separate_parsers(self):
+        pool = filesystem.CommonCartridgeXmlParserPool(recover=True)
+        parsers = []
+
+        def use_parser():
+            with pool.parser() as parser:
+                parsers.append(parser)
+
+        threads = [threading.Thread(target=use_parser) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert parsers[0] is not parsers[1]
+        assert pool.stats() == {"created": 2, "reused": 0}
+
+    def test_failed_parser_is_dropped(self):
+        pool = filesystem.CommonCartridgeXmlParserPool(recover=True)
+
+        with pytest.raises(ValueError):
+            with pool.parser() as failed_parser:
+                raise ValueError
+
+        with pool.parser() as parser:
+            assert parser is not failed_parser
+
+
+def test_get_xml_tree_reuses_pooled_parser(fixtures_data_dir):
+    manifest_path = fixtures_data_dir / "imscc_files" / "main" / "imsmanifest.xml"
+    filesystem.xml_parser_pool.reset_stats()
+
+    first_tree = filesystem.get_xml_tree(manifest_path)
+    second_tree = filesystem.get_xml_tree(manifest_path)
+
+    assert first_tree.getroot().tag == second_tree.getroot().tag
+    assert filesystem.xml_parser_pool.stats()["reused"] >= 1
+
+
+@pytest.mark.parametrize(
+    "header,expected_file_type",
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", FileType.JPEG),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", FileType.PNG),
+        (b"GIF89a\x01\x00\x01\x00", FileType.GIF),
+        (b"BM6\x00\x00\x00\x00\x00", FileType.BMP),
+        (b"II*\x00\x08\x00\x00\x00", FileType.TIFF),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", FileType.WEBP),
+        (b"%PDF-1.7\n", FileType.PDF),
+        (b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00", FileType.MP4),
+        (b"\x00\x00\x00\x14ftypqt  \x00\x00\x02\x00", FileType.QUICKTIME),
+        (b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81", FileType.WEBM),
+        # imghdr never detected ICO files, so the web content icons aren't treated as images.
+        (b"\x00\x00\x01\x00\x01\x00\x10\x10", None),
+        (b"<html><body></body></html>", None),
+        (b"", None),
+    ],
+)
+def test_detect_file_type(header, expected_file_type):
+    assert filesystem.detect_file_type(header) == expected_file_type
+
+
+def test_sniff_file_type_detects_replaced_file(tmp_path):
+    file_path = tmp_path / "file.bin"
+    file_path.write_bytes(b"GIF89a\x01\x00\x01\x00")
+    assert filesystem.sniff_file_type(file_path) == FileType.GIF
+
+    file_path.write_bytes(b"%PDF-1.7\n plus some more bytes")
+
+    assert filesystem.sniff_file_type(file_path) == FileType.PDF
+
+
+def test_sniff_zip_member_file_type(tmp_path):
+    zip_path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("web_resources/image.png", b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024)
+
+    with zipfile.ZipFile(zip_path) as zip_file:
+        assert filesystem.sniff_zip_member_file_type(zip_file, "web_resources/image.png") == FileType.PNG
@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+import attrs
+
+from cc2olx.inventory import (
+    INVENTORY_FORMAT_CSV,
+    INVENTORY_STATUS_ERROR,
+    CartridgeInventory,
+    analyze_cartridge,
+    analyze_cartridges,
+    write_inventory,
+)
+
+
+def test_analyze_cartridge(imscc_file):
+    inventory = analyze_cartridge(imscc_file)
+
+    assert inventory.status == "ok"
+    assert inventory.is_canvas_flavor
+    assert inventory.resources == 28
+    assert inventory.resource_types["webcontent"] == 10
+    assert inventory.course_resource_types["imsbasiclti_xmlv1p0"] == 3
+    assert inventory.qti_assessments == 2
+    assert inventory.qti_bytes > 0
+    assert inventory.lti_links == 3
+    assert inventory.lti_tools == {"example.com": 1}
+    assert 0 < inventory.static_bytes < inventory.uncompressed_bytes
+    assert inventory.missing_resources == 0
+    assert inventory.not_imported_resources == 0
+
+
+def test_analyze_cartridge_does_not_extract(imscc_file, mocker):
+    extract_mock = mocker.patch("cc2olx.filesystem.extract_zip")
+
+    analyze_cartridge(imscc_file)
+
+    extract_mock.assert_not_called()
+
+
+def test_analyze_invalid_cartridge(tmp_path):
+    cartridge_path = tmp_path / "broken.imscc"
+    cartridge_path.write_bytes(b"not a zip")
+
+    inventory = analyze_cartridge(cartridge_path)
+
+    assert inventory.name == "broken"
+    assert inventory.status == INVENTORY_STATUS_ERROR
+    assert inventory.error
+
+
+def test_analyze_cartridges_in_parallel(imscc_file):
+    second_imscc_file = imscc_file.with_name("second.imscc")
+    second_imscc_file.write_bytes(imscc_file.read_bytes())
+
+    inventories = list(analyze_cartridges([second_imscc_file, imscc_file], workers=2))
+
+    assert [inventory.name for inventory in inventories] == ["course", "second"]
+    assert inventories[0] == attrs.evolve(inventories[1], name="course")
+
+
+def test_write_inventory_json_lines():
+    stream = io.StringIO()
+
+    write_inventory(
+        [CartridgeInventory("first"), CartridgeInventory("second", resource_types={"webcontent": 1})], stream
+    )
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["name"] for line in lines] == ["first", "second"]
+    assert lines[1]["resource_types"] == {"webcontent": 1}
+
+
+def test_write_inventory_csv():
+    stream = io.StringIO()
+
+    write_inventory([CartridgeInventory("first", lti_tools={"example.com": 2})], stream, INVENTORY_FORMAT_CSV)
+
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert rows[0]["name"] == "first"
+    assert json.loads(rows[0]["lti_tools"]) == {"example.com": 2}
@@ -1,7 +1,11 @@
+import json
 import tarfile
+import zipfile
 
 from cc2olx.cli import RESULT_TYPE_ZIP
+from cc2olx.enums import ArchiveCodec
 from cc2olx.main import convert_one_file, main
+from cc2olx.output import ZipOutput
 from .utils import format_xml
 
 
@@ -12,7 +16,7 @@ def test_convert_one_file(options, imscc_file, studio_course_xml):
     """
     expected_tgz_members_num = 8
 
-    convert_one_file(
+    tgz_path = convert_one_file(
         imscc_file,
         options["workspace"],
         options["link_file"],
@@ -20,7 +24,7 @@ def test_convert_one_file(options, imscc_file, studio_course_xml):
         content_types_with_custom_blocks=options["content_types_with_custom_blocks"],
     )
 
-    tgz_path = str((imscc_file.parent / "output" / imscc_file.stem).with_suffix(".tar.gz"))
+    assert tgz_path == (imscc_file.parent / "output" / imscc_file.stem).with_suffix(".tar.gz")
 
     with tarfile.open(tgz_path, "r:gz") as tgz:
         tgz_members = tgz.getmembers()
@@ -34,6 +38,19 @@ def test_convert_one_file(options, imscc_file, studio_course_xml):
                 break
 
 
+def test_convert_one_file_to_output(options, imscc_file, tmp_path):
+    """
+    Tests, that ``convert_one_file`` writes the archive to the output and doesn't return the workspace path.
+    """
+    with ZipOutput(tmp_path / "result") as output:
+        tgz_path = convert_one_file(imscc_file, tmp_path / "workspace", output=output)
+
+    assert tgz_path is None
+    assert not (tmp_path / "workspace" / imscc_file.stem).with_suffix(".tar.gz").exists()
+    with zipfile.ZipFile(tmp_path / "result.zip") as zip_file:
+        assert zip_file.namelist() == [f"{imscc_file.stem}.tar.gz"]
+
+
 def test_main(mocker, imscc_file, options):
     """
     Tests, that invocation of main function results in converted ``.imscc`` file.
@@ -47,13 +64,80 @@ def test_main(mocker, imscc_file, options):
     # workspace has been created
     assert options["workspace"].exists()
 
-    # content of imscc has been extracted
-    assert (options["workspace"] / imscc_file.stem).exists()
+    # extracted content of imscc has been released after packing
+    assert not (options["workspace"] / imscc_file.stem).exists()
 
     # archived olx course has been generated
     assert (options["workspace"] / imscc_file.stem).with_suffix(".tar.gz").exists()
 
 
+def test_main_keep_intermediates(mocker, imscc_file, options):
+    """
+    Tests, that ``--keep-intermediates`` cli option keeps the extracted content in the output.
+    """
+
+    options["keep_intermediates"] = True
+
+    mocker.patch("cc2olx.main.parse_args")
+    mocker.patch("cc2olx.main.parse_options", return_value=options)
+
+    main()
+
+    assert (options["workspace"] / imscc_file.stem / "imsmanifest.xml").exists()
+    assert (options["workspace"] / imscc_file.stem).with_suffix(".tar.gz").exists()
+
+
+def test_main_parallel_compression(mocker, imscc_file, options):
+    """
+    Tests, that the archive compressed in parallel threads is a valid tar.gz archive.
+    """
+
+    options["compression_level"] = 1
+    options["compression_workers"] = 2
+
+    mocker.patch("cc2olx.main.parse_args")
+    mocker.patch("cc2olx.main.parse_options", return_value=options)
+
+    main()
+
+    with tarfile.open((options["workspace"] / imscc_file.stem).with_suffix(".tar.gz"), "r:gz") as tgz:
+        assert "course.xml" in tgz.getnames()
+
+
+def test_main_store_codec(mocker, imscc_file, options):
+    """
+    Tests, that ``--compression-codec store`` cli option results in uncompressed tar archive.
+    """
+
+    options["compression_codec"] = ArchiveCodec.STORE
+
+    mocker.patch("cc2olx.main.parse_args")
+    mocker.patch("cc2olx.main.parse_options", return_value=options)
+
+    main()
+
+    with tarfile.open((options["workspace"] / imscc_file.stem).with_suffix(".tar"), "r:") as tar:
+        assert "course.xml" in tar.getnames()
+
+
+def test_main_batch_workers(mocker, imscc_file, options):
+    """
+    Tests, that ``--batch-workers`` cli option converts the cartridges in parallel processes.
+    """
+
+    second_imscc_file = imscc_file.with_name("second.imscc")
+    second_imscc_file.write_bytes(imscc_file.read_bytes())
+    options["input_files"] = {imscc_file, second_imscc_file}
+    options["batch_workers"] = 2
+
+    mocker.patch("cc2olx.main.parse_args")
+    mocker.patch("cc2olx.main.parse_options", return_value=options)
+
+    main()
+
+    assert sorted(path.name for path in options["workspace"].iterdir()) == ["course.tar.gz", "second.tar.gz"]
+
+
 def test_main_zip_output(mocker, options):
     """
     Tests, that ``--result zip`` cli option works fine.
@@ -67,3 +151,44 @@ def test_main_zip_output(mocker, options):
     main()
 
     assert options["workspace"].with_suffix(".zip").exists()
+
+
+def test_main_metrics_file(mocker, imscc_file, options, tmp_path):
+    """
+    Tests, that ``--metrics-file`` cli option writes the batch metrics.
+    """
+
+    options["metrics_file"] = tmp_path / "metrics.json"
+
+    mocker.patch("cc2olx.main.parse_args")
+    mocker.patch("cc2olx.main.parse_options", return_value=options)
+
+    main()
+
+    metrics = json.loads(options["metrics_file"].read_text())
+    tgz_path = (options["workspace"] / imscc_file.stem).with_suffix(".tar.gz")
+    assert metrics["batch"]["cartridges"] == 1
+    assert metrics["batch"]["failed_cartridges"] == 0
+    assert metrics["cartridges"][0]["name"] == imscc_file.stem
+    assert metrics["cartridges"][0]["path"] == imscc_file.name
+    assert metrics["cartridges"][0]["bytes_in"] == imscc_file.stat().st_size
+    assert metrics["cartridges"][0]["bytes_out"] == tgz_path.stat().st_size
+    assert metrics["cartridges"][0]["resource_types"]
+
+
+def test_main_analyze(mocker, capsys, imscc_file, options):
+    """
+    Tests, that ``--analyze`` cli option writes the inventory without converting the cartridge.
+    """
+
+    options["analyze"] = True
+
+    mocker.patch("cc2olx.main.parse_args")
+    mocker.patch("cc2olx.main.parse_options", return_value=options)
+
+    main()
+
+    inventory = json.loads(capsys.readouterr().out)
+    assert inventory["name"] == imscc_file.stem
+    assert inventory["status"] == "ok"
+    assert not options["workspace"].exists()
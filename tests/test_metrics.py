@@ -0,0 +1,113 @@
+import io
+import json
+
+import pytest
+
+from cc2olx.metrics import (
+    CONVERSION_STATUS_ERROR,
+    METRICS_FORMAT_PROMETHEUS,
+    BatchMetrics,
+    ByteCountingWriter,
+    CartridgeMetrics,
+)
+
+
+def test_byte_counting_writer():
+    destination = io.BytesIO()
+    writer = ByteCountingWriter(destination)
+
+    writer.write(b"abc")
+    writer.write(b"de")
+
+    assert writer.bytes_written == 5
+    assert destination.getvalue() == b"abcde"
+
+
+def test_cartridge_metrics_measure_failure(tmp_path):
+    input_file = tmp_path / "courses" / "course.imscc"
+    input_file.parent.mkdir()
+    input_file.write_bytes(b"x" * 10)
+    metrics = CartridgeMetrics.for_file(input_file, tmp_path)
+
+    with pytest.raises(ValueError), metrics.measure():
+        raise ValueError
+
+    assert metrics.name == "course"
+    assert metrics.path == "courses/course.imscc"
+    assert metrics.bytes_in == 10
+    assert metrics.status == CONVERSION_STATUS_ERROR
+    assert metrics.duration >= 0
+
+
+def _batch_metrics():
+    batch_metrics = BatchMetrics()
+    batch_metrics.add(
+        CartridgeMetrics(
+            'course "1"',
+            'a/course "1".imscc',
+            duration=2.0,
+            bytes_in=100,
+            bytes_out=40,
+            resource_types={"webcontent": 3},
+            fallback_nodes=1,
+            skipped_processors={"VideoContentProcessor": 2},
+            process_peak_rss=2048,
+        )
+    )
+    batch_metrics.add(
+        CartridgeMetrics(
+            "course_2", "b/course_2.imscc", status=CONVERSION_STATUS_ERROR, bytes_in=50, process_peak_rss=4096
+        )
+    )
+    batch_metrics.add(CartridgeMetrics("course_2", "c/course_2.imscc", bytes_in=60))
+    batch_metrics.duration = 5.0
+    return batch_metrics
+
+
+def test_batch_metrics_summary():
+    summary = _batch_metrics().summary()
+
+    assert summary["cartridges"] == 3
+    assert summary["failed_cartridges"] == 1
+    assert summary["bytes_in"] == 210
+    assert summary["bytes_out"] == 40
+    assert summary["fallback_nodes"] == 1
+    assert summary["skipped_processors"] == 2
+    assert summary["process_peak_rss"] == 4096
+    assert summary["cartridges_per_second"] == 0.6
+    assert summary["bytes_in_per_second"] == 42
+
+
+def test_batch_metrics_to_prometheus():
+    lines = _batch_metrics().to_prometheus().splitlines()
+
+    assert "# TYPE cc2olx_cartridge_duration_seconds gauge" in lines
+    assert (
+        'cc2olx_cartridge_duration_seconds{path="a/course \\"1\\".imscc",cartridge="course \\"1\\"",status="ok"} 2.0'
+        in lines
+    )
+    assert (
+        'cc2olx_cartridge_resources{path="a/course \\"1\\".imscc",cartridge="course \\"1\\"",status="ok",'
+        'type="webcontent"} 3' in lines
+    )
+    assert (
+        'cc2olx_cartridge_process_peak_rss_bytes{path="b/course_2.imscc",cartridge="course_2",status="error"} 4096'
+        in lines
+    )
+    bytes_in_series = [line.rsplit(" ", 1)[0] for line in lines if line.startswith("cc2olx_cartridge_bytes_in{")]
+    assert len(bytes_in_series) == len(set(bytes_in_series)) == 3
+    assert "cc2olx_batch_failed_cartridges 1" in lines
+    assert lines.count("# HELP cc2olx_cartridge_bytes_in Cartridge file size.") == 1
+
+
+def test_batch_metrics_write(tmp_path):
+    batch_metrics = _batch_metrics()
+
+    batch_metrics.write(tmp_path / "metrics.json")
+    batch_metrics.write(tmp_path / "metrics.prom", METRICS_FORMAT_PROMETHEUS)
+
+    metrics = json.loads((tmp_path / "metrics.json").read_text())
+    assert metrics["batch"]["cartridges"] == 3
+    assert metrics["cartridges"][0]["skipped_processors"] == {"VideoContentProcessor": 2}
+    assert "cc2olx_batch_bytes_in 210" in (tmp_path / "metrics.prom").read_text()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["metrics.json", "metrics.prom"]
@@ -1,5 +1,7 @@
 import zipfile
 
+from cc2olx import filesystem
+from cc2olx.enums import FileType
 from cc2olx.models import Cartridge, ResourceFile
 
 
@@ -417,3 +419,21 @@ def test_cartridge_normalize(imscc_file, options):
         "identifier": "org_1",
         "structure": "rooted-hierarchy",
     }
+
+
+def test_resource_file_type_is_sniffed_without_extraction(tmp_path, mocker):
+    """
+    Tests, that the resource file type is detected from the cartridge zip member header.
+    """
+    cartridge_path = tmp_path / "course.imscc"
+    with zipfile.ZipFile(cartridge_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("web_resources/image.png", b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024)
+        zip_file.writestr("web_resources/notes.txt", b"Lecture notes")
+    sniff_file_spy = mocker.spy(filesystem, "sniff_file_type")
+
+    cartridge = Cartridge(cartridge_path, tmp_path / "workspace")
+
+    assert cartridge.sniff_resource_file_type("web_resources/image.png") == FileType.PNG
+    assert cartridge.sniff_resource_file_type("web_resources/notes.txt") is None
+    sniff_file_spy.assert_not_called()
+    assert not (tmp_path / "workspace").exists()
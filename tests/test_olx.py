@@ -1,4 +1,5 @@
 import json
+from collections import Counter
 import xml.dom.minidom
 from unittest.mock import Mock
 
@@ -23,6 +24,38 @@ def test_olx_export_xml(
     assert format_xml(xml) == format_xml(studio_course_xml)
 
 
+def test_olx_export_xml_with_qti_workers(
+    cartridge,
+    link_map_csv,
+    studio_course_xml,
+    relative_links_source,
+    content_types_with_custom_blocks,
+):
+    xml = olx.OlxExport(
+        cartridge,
+        link_map_csv,
+        relative_links_source=relative_links_source,
+        content_types_with_custom_blocks=content_types_with_custom_blocks,
+        qti_workers=2,
+    ).xml()
+
+    assert format_xml(xml) == format_xml(studio_course_xml)
+
+
+def test_olx_export_creates_processors_for_course_resource_types(cartridge, mocker):
+    mocker.patch.object(
+        cartridge, "get_resource_type_histogram", return_value=Counter({"imsdt_xmlv1p1": 1, "webcontent": 2})
+    )
+
+    olx_export = olx.OlxExport(cartridge)
+
+    assert [type(processor).__name__ for processor in olx_export._content_processors] == [
+        "PDFContentProcessor",
+        "DiscussionContentProcessor",
+        "HtmlContentProcessor",
+    ]
+
+
 def test_olx_export_wiki_page_disabled(cartridge, link_map_csv, studio_course_xml):
     policy_json = olx.OlxExport(cartridge, link_map_csv).policy()
     policy = json.loads(policy_json)
@@ -18,4 +18,19 @@ def test_parse_options(imscc_file):
         "log_level": parsed_args.loglevel,
         "relative_links_source": None,
         "content_types_with_custom_blocks": [],
+        "qti_workers": None,
+        "batch_workers": None,
+        "memory_budget": None,
+        "disk_budget": None,
+        "claims_directory": None,
+        "node_id": None,
+        "claim_timeout": 300,
+        "keep_intermediates": False,
+        "compression_codec": "gzip",
+        "compression_level": None,
+        "compression_workers": None,
+        "metrics_file": None,
+        "metrics_format": "json",
+        "analyze": False,
+        "analyze_format": "json",
     }
@@ -0,0 +1,118 @@
+import errno
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from cc2olx.cli import RESULT_TYPE_FOLDER, RESULT_TYPE_ZIP
+from cc2olx.output import FolderOutput, ZipOutput, create_output
+
+
+class TestFolderOutput:
+    def test_previous_content_is_replaced(self, tmp_path):
+        output_path = tmp_path / "output"
+        output_path.mkdir()
+        (output_path / "stale.tar.gz").write_bytes(b"stale")
+
+        with FolderOutput(output_path) as output:
+            with output.open_file("course.tar.gz") as output_file:
+                output_file.write(b"archive")
+
+        assert [path.name for path in output_path.iterdir()] == ["course.tar.gz"]
+        assert (output_path / "course.tar.gz").read_bytes() == b"archive"
+
+    def test_file_appears_only_when_complete(self, tmp_path):
+        output_path = tmp_path / "output"
+
+        with FolderOutput(output_path) as output:
+            with pytest.raises(ValueError):
+                with output.open_file("course.tar.gz") as output_file:
+                    output_file.write(b"truncated")
+                    assert not (output_path / "course.tar.gz").exists()
+                    raise ValueError
+
+        assert list(output_path.iterdir()) == []
+
+    def test_file_is_moved(self, tmp_path):
+        source_path = tmp_path / "course.tar.gz"
+        source_path.write_bytes(b"archive")
+
+        with FolderOutput(tmp_path / "output") as output:
+            output.add_file(source_path, "course.tar.gz")
+
+        assert (tmp_path / "output" / "course.tar.gz").read_bytes() == b"archive"
+        assert not source_path.exists()
+
+    def test_file_from_another_filesystem_is_copied_through_partial_file(self, tmp_path, mocker):
+        source_path = tmp_path / "course.tar.gz"
+        source_path.write_bytes(b"archive")
+        output_path = tmp_path / "output"
+        replace = os.replace
+        replaced_paths = []
+
+        def replace_across_devices(src, dst):
+            if Path(src) == source_path:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            replaced_paths.append(Path(src).name)
+            replace(src, dst)
+
+        mocker.patch("cc2olx.output.os.replace", side_effect=replace_across_devices)
+
+        with FolderOutput(output_path) as output:
+            output.add_file(source_path, "course.tar.gz")
+
+        assert replaced_paths == ["course.tar.gz.partial"]
+        assert (output_path / "course.tar.gz").read_bytes() == b"archive"
+        assert not source_path.exists()
+
+    def test_tree_is_added(self, tmp_path):
+        source_path = tmp_path / "source"
+        (source_path / "course").mkdir(parents=True)
+        (source_path / "course" / "imsmanifest.xml").write_text("<manifest/>")
+
+        with FolderOutput(tmp_path / "output") as output:
+            output.add_tree(source_path)
+
+        assert (tmp_path / "output" / "course" / "imsmanifest.xml").read_text() == "<manifest/>"
+
+
+class TestZipOutput:
+    def test_files_are_appended_to_zip(self, tmp_path):
+        source_path = tmp_path / "source"
+        source_path.mkdir()
+        (source_path / "policy.json").write_text("{}")
+
+        with ZipOutput(tmp_path / "output") as output:
+            with output.open_file("course.tar.gz") as output_file:
+                output_file.write(b"archive")
+            output.add_tree(source_path)
+            output.add_file(source_path / "policy.json", "policies/course/policy.json")
+            assert not (tmp_path / "output.zip").exists()
+
+        with zipfile.ZipFile(tmp_path / "output.zip") as zip_file:
+            assert zip_file.read("course.tar.gz") == b"archive"
+            assert zip_file.getinfo("course.tar.gz").compress_type == zipfile.ZIP_STORED
+            assert zip_file.read("policy.json") == b"{}"
+            assert zip_file.read("policies/course/policy.json") == b"{}"
+        assert not (tmp_path / "output.zip.partial").exists()
+
+    def test_compressed_media_is_stored(self, tmp_path):
+        source_path = tmp_path / "source"
+        source_path.mkdir()
+        (source_path / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        (source_path / "page.html").write_text("<p>text</p>" * 100)
+
+        with ZipOutput(tmp_path / "output") as output:
+            output.add_tree(source_path)
+
+        with zipfile.ZipFile(tmp_path / "output.zip") as zip_file:
+            assert zip_file.getinfo("image.png").compress_type == zipfile.ZIP_STORED
+            assert zip_file.getinfo("page.html").compress_type == zipfile.ZIP_DEFLATED
+
+
+@pytest.mark.parametrize(
+    "output_format,output_type", [(RESULT_TYPE_FOLDER, FolderOutput), (RESULT_TYPE_ZIP, ZipOutput)]
+)
+def test_create_output(tmp_path, output_format, output_type):
+    assert isinstance(create_output(output_format, tmp_path / "output"), output_type)
@@ -0,0 +1,48 @@
+import logging
+
+from cc2olx.progress import ProgressLog
+
+
+def test_progress_log_event_samples(caplog):
+    progress = ProgressLog("resources", sample_size=2)
+
+    with caplog.at_level(logging.INFO):
+        for index in range(4):
+            progress.event("missing_resources", logging.WARNING, "Missing resource: %s", index)
+
+    assert progress.counts == {"missing_resources": 4}
+    assert [record.message for record in caplog.records] == [
+        "Missing resource: 0",
+        "Missing resource: 1",
+        'Further "missing_resources" events are only counted and logged at DEBUG level.',
+    ]
+
+
+def test_progress_log_event_details_at_debug_level(caplog):
+    progress = ProgressLog("resources", sample_size=1)
+
+    with caplog.at_level(logging.DEBUG):
+        for index in range(3):
+            progress.event("missing_resources", logging.WARNING, "Missing resource: %s", index)
+
+    assert [(record.levelname, record.message) for record in caplog.records if "Missing" in record.message] == [
+        ("WARNING", "Missing resource: 0"),
+        ("DEBUG", "Missing resource: 1"),
+        ("DEBUG", "Missing resource: 2"),
+    ]
+
+
+def test_progress_log_step_logs_summary_once_per_interval(mocker, caplog):
+    monotonic_mock = mocker.patch("cc2olx.progress.time.monotonic", return_value=0)
+    progress = ProgressLog("resources", interval=10)
+    progress.counts["fallback_nodes"] = 1
+
+    with caplog.at_level(logging.INFO):
+        for now in (1, 5, 11, 12, 22):
+            monotonic_mock.return_value = now
+            progress.step()
+
+    assert [record.message for record in caplog.records] == [
+        "Processed 3 resources: {'fallback_nodes': 1}",
+        "Processed 5 resources: {'fallback_nodes': 1}",
+    ]
@@ -0,0 +1,65 @@
+import zipfile
+from pathlib import Path
+
+from cc2olx.scheduler import BASE_MEMORY, BatchScheduler, CartridgeCost, estimate_cartridge_cost
+
+
+def test_estimate_cartridge_cost(tmp_path):
+    cartridge_path = tmp_path / "course.imscc"
+    with zipfile.ZipFile(cartridge_path, "w", compression=zipfile.ZIP_DEFLATED) as cartridge:
+        cartridge.writestr("imsmanifest.xml", "<manifest/>" * 10)
+        cartridge.writestr("web_resources/page.html", "<p>text</p>" * 10)
+        cartridge.writestr("web_resources/video.mp4", b"\x00" * 1000)
+
+    cost = estimate_cartridge_cost(cartridge_path)
+
+    assert cost == CartridgeCost(
+        cartridge_path, uncompressed_size=1220, members_count=3, manifest_size=110, text_size=110
+    )
+    assert cost.memory > BASE_MEMORY
+    assert cost.scratch_disk == 2440
+
+
+def test_estimate_invalid_cartridge_cost(tmp_path):
+    cartridge_path = tmp_path / "course.imscc"
+    cartridge_path.write_bytes(b"not a zip")
+
+    assert estimate_cartridge_cost(cartridge_path) == CartridgeCost(cartridge_path, uncompressed_size=9)
+
+
+def _cost(name, size):
+    return CartridgeCost(Path(name), uncompressed_size=size, text_size=size)
+
+
+class TestBatchScheduler:
+    def test_biggest_cartridges_are_started_first(self):
+        scheduler = BatchScheduler([_cost("small", 1), _cost("big", 100), _cost("medium", 10)], max_workers=2)
+
+        assert [cost.path.name for cost in scheduler.admit()] == ["big", "medium"]
+        assert scheduler.admit() == []
+        assert scheduler.has_pending
+
+    def test_cartridges_are_admitted_within_budgets(self):
+        big, medium, small = _cost("big", 100), _cost("medium", 60), _cost("small", 30)
+        scheduler = BatchScheduler([small, medium, big], max_workers=3, disk_budget=2 * 140)
+
+        assert scheduler.admit() == [big, small]
+
+        scheduler.release(small)
+
+        assert scheduler.admit() == []
+
+        scheduler.release(big)
+
+        assert scheduler.admit() == [medium]
+        assert not scheduler.has_pending
+
+    def test_cartridge_over_budget_is_converted_alone(self):
+        huge, small = _cost("huge", 1000), _cost("small", 1)
+        scheduler = BatchScheduler([huge, small], max_workers=2, memory_budget=BASE_MEMORY)
+
+        assert scheduler.admit() == [huge]
+
+        scheduler.release(huge)
+
+        assert scheduler.admit() == [small]
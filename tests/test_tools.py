@@ -1,6 +1,10 @@
 from argparse import Namespace
-from unittest.mock import Mock, call
+from pathlib import Path
+from unittest.mock import ANY, Mock, call
 
+import pytest
+
+from cc2olx.tools import video_upload
 from cc2olx.tools.video_upload import (
     main,
     parse_args,
@@ -74,7 +78,7 @@ class TestVideoUpload:
         # patch API calls
         mocker.patch("cc2olx.tools.video_upload.requests.post", side_effect=post_side_effect)
         mocker.patch("cc2olx.tools.video_upload.requests.Session.post", side_effect=post_side_effect)
-        upload_video_mock = mocker.patch("cc2olx.tools.video_upload.requests.put", side_effect=put_side_effect)
+        upload_video_mock = mocker.patch("cc2olx.tools.video_upload.requests.Session.put", side_effect=put_side_effect)
 
         # patch writerow method of csv.DictWriter class so that we can assert against
         # data written to the output csv
@@ -83,10 +87,10 @@ class TestVideoUpload:
         main()
 
         expected_upload_video_call_args = [
-            call("example.com/upload/ghi", data=b"", headers={"Content-Type": "video/quicktime"}),
-            call("example.com/upload/abc", data=b"", headers={"Content-Type": "video/mp4"}),
-            call("example.com/upload/def", data=b"", headers={"Content-Type": "video/mp4"}),
-            call("example.com/upload/jkl", data=b"", headers={"Content-Type": "video/quicktime"}),
+            call("example.com/upload/ghi", data=ANY, headers={"Content-Type": "video/quicktime"}),
+            call("example.com/upload/abc", data=ANY, headers={"Content-Type": "video/mp4"}),
+            call("example.com/upload/def", data=ANY, headers={"Content-Type": "video/mp4"}),
+            call("example.com/upload/jkl", data=ANY, headers={"Content-Type": "video/quicktime"}),
         ]
         upload_video_mock.assert_has_calls(expected_upload_video_call_args, any_order=True)
 
@@ -148,6 +152,89 @@ class TestVideoUpload:
         ]
         csv_writerow_mock.assert_has_calls(expected_csv_writerow_call_args, any_order=True)
 
+    def test_video_upload_streams_files_to_stub_server(
+        self, mocker, monkeypatch, video_upload_args, studio_stub_server
+    ):
+        args_mock = Mock()
+        args_mock.configure_mock(**{**video_upload_args, "concurrency": 4})
+        mocker.patch("cc2olx.tools.video_upload.parse_args", return_value=args_mock)
+        monkeypatch.setenv("CC2OLX_CLIENT", "client")
+        monkeypatch.setenv("CC2OLX_SECRET", "secret")
+        create_session_spy = mocker.spy(video_upload, "create_session")
+
+        main()
+
+        # One authenticated session for Studio and one for the presigned URLs.
+        assert create_session_spy.call_count == 2
+        assert len(studio_stub_server.uploads) == 4
+        put_requests = [request for request in studio_stub_server.requests if request["method"] == "PUT"]
+        assert all("Authorization" not in request["headers"] for request in put_requests)
+        transcript_requests = [
+            request for request in studio_stub_server.requests if request["path"] == "/transcript_upload_api/"
+        ]
+        assert len(transcript_requests) == 4
+        assert all(request["headers"]["Authorization"] == "JWT stub-token" for request in transcript_requests)
+
+    def test_video_upload_resumes_from_journal(self, mocker, monkeypatch, video_upload_args, studio_stub_server):
+        args_mock = Mock()
+        args_mock.configure_mock(**video_upload_args)
+        mocker.patch("cc2olx.tools.video_upload.parse_args", return_value=args_mock)
+        monkeypatch.setenv("CC2OLX_CLIENT", "client")
+        monkeypatch.setenv("CC2OLX_SECRET", "secret")
+        journal = video_upload.UploadJournal(video_upload_args["journal"], video_upload_args["course_id"])
+        directory = Path(video_upload_args["directory"])
+        intro_path = "01___Intro_to_Knowledge_Based_AI/0 - Introductions.mp4"
+        preview_path = "01___Intro_to_Knowledge_Based_AI/1 - Preview.mp4"
+        journal.record(
+            intro_path, directory / intro_path, edx_video_id="abc", status="completed", transcripts=["en"], lang="en"
+        )
+        journal.record(
+            preview_path, directory / preview_path, edx_video_id="def", status="uploaded", transcripts=["en"], lang=""
+        )
+        csv_writerow_mock = mocker.patch("csv.DictWriter.writerow")
+
+        main()
+
+        upload_link_requests = [
+            request for request in studio_stub_server.requests if "generate_video_upload_link" in request["path"]
+        ]
+        transcript_requests = [
+            request for request in studio_stub_server.requests if request["path"] == "/transcript_upload_api/"
+        ]
+        # Only the two videos missing from the journal are uploaded, plus the missing transcript.
+        assert len(upload_link_requests) == 2
+        assert len(studio_stub_server.uploads) == 2
+        assert len(transcript_requests) == 2
+        written_rows = {
+            call_args.args[0]["Relative File Path"]: call_args.args[0] for call_args in csv_writerow_mock.call_args_list
+        }
+        assert written_rows[intro_path]["Edx Id"] == "abc"
+        assert written_rows[preview_path]["Edx Id"] == "def"
+        assert written_rows[preview_path]["Languages"] == "en-fr"
+        reloaded_journal = video_upload.UploadJournal(video_upload_args["journal"], video_upload_args["course_id"])
+        assert reloaded_journal.get(preview_path, directory / preview_path)["status"] == "completed"
+
+    def test_video_upload_journal_ignores_other_course_and_changed_files(self, video_upload_args, tmp_path):
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+        journal = video_upload.UploadJournal(video_upload_args["journal"], "course-v1:edX+A+A")
+        journal.record("video.mp4", video_path, edx_video_id="abc", status="completed")
+
+        other_course_journal = video_upload.UploadJournal(video_upload_args["journal"], "course-v1:edX+B+B")
+        assert other_course_journal.get("video.mp4", video_path) == {}
+        assert other_course_journal.files_data() == {}
+
+        assert journal.get("video.mp4", video_path)["edx_video_id"] == "abc"
+        video_path.write_bytes(b"replaced video")
+        assert journal.get("video.mp4", video_path) == {}
+        assert journal.record("video.mp4", video_path, status="uploaded") == {
+            "relative_path": "video.mp4",
+            "course_id": "course-v1:edX+A+A",
+            "size": 14,
+            "mtime": video_path.stat().st_mtime_ns,
+            "status": "uploaded",
+        }
+
 
 def test_parse_args():
     """
@@ -157,8 +244,31 @@ def test_parse_args():
     parsed_args = parse_args(["courseid", "dirname", "input.csv", "--output-csv", "output.csv"])
 
     assert parsed_args == Namespace(
-        course_id="courseid", directory="dirname", input_csv="input.csv", output_csv="output.csv"
+        course_id="courseid",
+        directory="dirname",
+        input_csv="input.csv",
+        output_csv="output.csv",
+        concurrency=1,
+        journal=None,
+        chunk_size=0,
+        chunk_concurrency=4,
+        presign_url=None,
+        verify_part_etag=False,
+    )
+
+
+def test_parse_args_requires_presign_url_for_chunk_size(capsys):
+    with pytest.raises(SystemExit):
+        parse_args(["courseid", "dirname", "input.csv", "--output-csv", "output.csv", "--chunk-size", "100"])
+
+    assert "--chunk-size requires --presign-url" in capsys.readouterr().err
+
+    parsed_args = parse_args(
+        ["courseid", "dirname", "input.csv", "--output-csv", "output.csv", "--chunk-size", "100"]
+        + ["--presign-url", "https://presign.example.com/"]
     )
+    assert parsed_args.chunk_size == 100
+    assert parsed_args.presign_url == "https://presign.example.com/"
 
 
 def upload_transcript_side_effect(*args, **kwargs):
@@ -185,3 +295,115 @@ def test_transcript_upload(mocker, transcript_file):
 
     response = upload_transcript(transcript_file, None, "en", "test_access_token")
     assert response.status_code == 400
+
+
+def test_upload_video_request_streams_file(tmp_path, studio_stub_server):
+    video_path = tmp_path / "video.mp4"
+    video_path.write_bytes(b"\x00\x01" * 100000)
+    session = video_upload.create_session()
+
+    with video_path.open("rb") as f:
+        response = video_upload.make_upload_video_request(
+            studio_stub_server.url + "/upload/streamed", f, {"Content-Type": "video/mp4"}, "video.mp4", session=session
+        )
+
+    assert response.status_code == 200
+    assert studio_stub_server.uploads["streamed"] == video_path.read_bytes()
+
+
+class TestMultipartUploader:
+    def _create_presigner(self, studio_stub_server):
+        return video_upload.MultipartPresigner(video_upload.create_session(), studio_stub_server.url + "/presign/")
+
+    def _upload(self, tmp_path, studio_stub_server, **uploader_kwargs):
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(bytes(range(256)) * 1000)
+        uploader = video_upload.MultipartUploader(
+            video_upload.create_session(),
+            chunk_size=64 * 1024,
+            presigner=self._create_presigner(studio_stub_server),
+            backoff=0,
+            **uploader_kwargs,
+        )
+        response = uploader.upload(
+            studio_stub_server.url + "/upload/large?signature=single-put",
+            video_path,
+            {"Content-Type": "video/mp4"},
+            "video.mp4",
+        )
+        return video_path, response
+
+    def test_upload_in_chunks(self, tmp_path, studio_stub_server):
+        video_path, response = self._upload(tmp_path, studio_stub_server)
+
+        assert response.status_code == 200
+        assert studio_stub_server.uploads["large"] == video_path.read_bytes()
+        part_requests = [request for request in studio_stub_server.requests if "partNumber" in request["path"]]
+        assert len(part_requests) == 4
+        assert all("X-Amz-Signature=stub-signature" in request["path"] for request in part_requests)
+        assert not any("signature=single-put" in request["path"] for request in part_requests)
+
+    def test_encrypted_bucket_etag_is_accepted(self, tmp_path, studio_stub_server):
+        studio_stub_server.encrypted_etags = True
+
+        video_path, response = self._upload(tmp_path, studio_stub_server)
+
+        assert response.status_code == 200
+        assert studio_stub_server.uploads["large"] == video_path.read_bytes()
+
+    def test_etag_mismatch_is_rejected_when_verified(self, tmp_path, studio_stub_server):
+        studio_stub_server.encrypted_etags = True
+
+        _, response = self._upload(tmp_path, studio_stub_server, retries=0, verify_etag=True)
+
+        assert response is None
+        assert "large" not in studio_stub_server.uploads
+
+    def test_presigner_does_not_send_studio_token(self, monkeypatch, studio_stub_server):
+        monkeypatch.setenv("CC2OLX_PRESIGN_TOKEN", "presign-token")
+        presigner = video_upload.create_presigner(studio_stub_server.url + "/presign/")
+
+        presigner.presign(studio_stub_server.url + "/upload/large", "initiate")
+
+        (presign_request,) = studio_stub_server.requests
+        assert presign_request["headers"]["Authorization"] == "Bearer presign-token"
+
+    def test_failed_chunk_is_retried(self, tmp_path, studio_stub_server):
+        studio_stub_server.part_failures = {2: 2}
+
+        video_path, response = self._upload(tmp_path, studio_stub_server, retries=2)
+
+        assert response.status_code == 200
+        assert studio_stub_server.uploads["large"] == video_path.read_bytes()
+
+    def test_upload_is_aborted_when_retries_are_exhausted(self, tmp_path, studio_stub_server):
+        studio_stub_server.part_failures = {3: 2}
+
+        _, response = self._upload(tmp_path, studio_stub_server, retries=1)
+
+        assert response is None
+        assert "large" not in studio_stub_server.uploads
+        assert studio_stub_server.multipart_uploads == {}
+
+    def test_small_file_is_uploaded_with_single_request(self, tmp_path, studio_stub_server):
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"small video")
+        uploader = video_upload.create_uploader(
+            video_upload.create_session(), chunk_size=1, presigner=self._create_presigner(studio_stub_server)
+        )
+
+        response = uploader.upload(
+            studio_stub_server.url + "/upload/small", video_path, {"Content-Type": "video/mp4"}, "video.mp4"
+        )
+
+        assert response.status_code == 200
+        assert studio_stub_server.uploads["small"] == b"small video"
+
+    def test_chunked_uploads_require_presigner(self):
+        with pytest.raises(ValueError, match="presigner"):
+            video_upload.create_uploader(video_upload.create_session(), chunk_size=1)
+
+    def test_not_presigned_multipart_call_is_rejected(self, studio_stub_server):
+        response = video_upload.create_session().post(studio_stub_server.url + "/upload/large?uploads")
+
+        assert response.status_code == 403
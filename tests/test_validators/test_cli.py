@@ -2,23 +2,23 @@ import argparse
 from unittest.mock import Mock
 
 import pytest
-from django.core.exceptions import ValidationError
+from cc2olx.validators import ValidationError
 
 from cc2olx.validators.cli import convert_to_argparse_validator, link_source_validator
 
 
 class TestConvertToArgparseValidator:
     def test_original_value_is_return_after_successful_call(self):
-        django_validator = Mock()
-        argparse_validator = convert_to_argparse_validator(django_validator)
+        validator = Mock()
+        argparse_validator = convert_to_argparse_validator(validator)
         value_mock = Mock()
 
         assert argparse_validator(value_mock) == value_mock
 
-    def test_argument_type_error_is_raised_instead_of_intercepted_django_validation_error(self):
+    def test_argument_type_error_is_raised_instead_of_intercepted_validation_error(self):
         error_message_mock = Mock()
-        django_validator = Mock(side_effect=ValidationError(error_message_mock))
-        argparse_validator = convert_to_argparse_validator(django_validator)
+        validator = Mock(side_effect=ValidationError(error_message_mock))
+        argparse_validator = convert_to_argparse_validator(validator)
 
         with pytest.raises(argparse.ArgumentTypeError) as exc_info:
             argparse_validator(Mock())
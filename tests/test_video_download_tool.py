@@ -1,14 +1,20 @@
+import zipfile
 from argparse import Namespace
 from unittest.mock import call, Mock
 
+import youtube_dl
+
+from cc2olx.tools import video_download
 from cc2olx.tools.video_download import (
     parse_args,
     find_all_video_urls,
+    iter_video_urls,
     reformat,
     get_ydl_opts,
     write_csv,
     main,
     download_videos,
+    download_videos_by_url,
 )
 
 
@@ -33,13 +39,34 @@ def test_find_all_video_urls_in_cc(imscc_file):
 
     urls = find_all_video_urls(imscc_file)
     urls = [reformat(u) for u in urls]
+    # The same video embedded into two pages is found once
     expected = [
         "https://cdnapisec.kaltura.com/p/2019031/sp/201903100/playManifest/entryId/1_zeqnrfgw/format/url/protocol/https",  # noqa: E501
-        "https://cdnapisec.kaltura.com/p/2019031/sp/201903100/playManifest/entryId/1_zeqnrfgw/format/url/protocol/https",  # noqa: E501
     ]
     assert urls == expected
 
 
+def test_iter_video_urls_skips_pages_without_iframes(tmp_path, mocker):
+    course_path = tmp_path / "course.imscc"
+    with zipfile.ZipFile(course_path, "w") as course:
+        course.writestr(
+            "page1.html", '<html><body><IFRAME src="https://www.youtube.com/embed/abc"></IFRAME></body></html>'
+        )
+        course.writestr("page2.html", "<html><body><p>No videos here</p></body></html>")
+        course.writestr(
+            "page3.html", '<html><body><iframe src="https://www.youtube.com/embed/def"></iframe></body></html>'
+        )
+        course.writestr(
+            "page4.html", '<html><body><iframe src="https://www.youtube.com/embed/abc"></iframe></body></html>'
+        )
+    find_video_urls_spy = mocker.spy(video_download, "find_video_urls")
+
+    urls = list(iter_video_urls(str(course_path), workers=2))
+
+    assert urls == ["https://www.youtube.com/watch?v=abc", "https://www.youtube.com/watch?v=def"]
+    assert find_video_urls_spy.call_count == 3
+
+
 def test_parse_args(imscc_file):
     """
     Basic cli test.
@@ -48,7 +75,15 @@ def test_parse_args(imscc_file):
     parsed_args = parse_args(["-i", str(imscc_file), "-o", "outfile.csv", "-d", "download_dir", "-v"])
 
     assert parsed_args == Namespace(
-        input=str(imscc_file), config=None, output="outfile.csv", downloads="download_dir", simulate=False, verbose=True
+        input=str(imscc_file),
+        config=None,
+        output="outfile.csv",
+        downloads="download_dir",
+        simulate=False,
+        verbose=True,
+        concurrency=1,
+        retries=2,
+        scan_workers=None,
     )
 
 
@@ -119,7 +154,9 @@ class FakeYDL:
 
 def test_main(mocker, imscc_file):
     args_mock = Mock()
-    args_mock.configure_mock(config=None, input=imscc_file, output="outfileXXX", simulate=True)
+    args_mock.configure_mock(
+        config=None, input=imscc_file, output="outfileXXX", simulate=True, concurrency=2, retries=0, scan_workers=2
+    )
     mocker.patch("cc2olx.tools.video_download.parse_args", return_value=args_mock)
     mocker.patch("cc2olx.tools.video_download.youtube_dl.YoutubeDL", new=FakeYDL)
 
@@ -142,16 +179,10 @@ def test_main(mocker, imscc_file):
                 "Youtube Id": "",
             }
         ),
-        call(
-            {
-                "Relative File Path": "filename.mp4",
-                "External Video Link": "https://cdnapisec.kaltura.com/p/2019031/sp/201903100/playManifest/entryId/1_zeqnrfgw/format/url/protocol/https",  # noqa: E501
-                "Youtube Id": "",
-            }
-        ),
     ]
 
     csv_writerow_mock.assert_has_calls(expected_csv_writerow_call_args, any_order=True)
+    assert csv_writerow_mock.call_count == 2
 
 
 def test_download_videos(mocker):
@@ -160,3 +191,31 @@ def test_download_videos(mocker):
     mocker.patch("cc2olx.tools.video_download.youtube_dl.YoutubeDL", return_value=FakeYDL(opts))
     ret = download_videos(["url1", "url2", "url3"], opts)
     assert ret == ["filename.mp4", "filename.mp4", "filename.mp4"]
+
+
+class FailingYDL(FakeYDL):
+    failed_urls = set()
+
+    def download(self, urls):
+        for url in urls:
+            if url == "broken" or (url == "flaky" and url not in self.failed_urls):
+                self.failed_urls.add(url)
+                raise youtube_dl.utils.DownloadError(f"Can't download {url}")
+            for hook in self.opts["progress_hooks"]:
+                hook({"status": "finished", "filename": f"{url}.mp4"})
+
+
+def test_download_videos_by_url_keeps_url_pairing(mocker):
+    parsed_args = parse_args(["-i", "file.html", "-d", "download_dir", "-s"])
+    opts = get_ydl_opts(parsed_args)
+    mocker.patch("cc2olx.tools.video_download.youtube_dl.YoutubeDL", new=FailingYDL)
+    mocker.patch("cc2olx.tools.video_download.time.sleep")
+
+    downloads = download_videos_by_url(["url1", "broken", "flaky", "url2"], opts, concurrency=3, retries=1)
+
+    assert downloads == [
+        ("url1", ["url1.mp4"]),
+        ("broken", []),
+        ("flaky", ["flaky.mp4"]),
+        ("url2", ["url2.mp4"]),
+    ]
@@ -0,0 +1,82 @@
+import io
+import json
+import tarfile
+
+import pytest
+
+from cc2olx.cli import RESULT_TYPE_ZIP
+from cc2olx.worker import JobError, main, parse_job, run_job
+
+
+def test_parse_job(imscc_file, link_map_csv, tmp_path):
+    job = {
+        "input": str(imscc_file),
+        "output": str(tmp_path / "output"),
+        "result": RESULT_TYPE_ZIP,
+        "link_file": str(link_map_csv),
+        "relative_links_source": "https://example.com",
+        "content_types_with_custom_blocks": ["pdf", "unknown"],
+    }
+
+    options = parse_job(json.dumps(job))
+
+    assert options["input_file"] == imscc_file
+    assert options["workspace"] == tmp_path / "output"
+    assert options["output_format"] == RESULT_TYPE_ZIP
+    assert options["content_types_with_custom_blocks"] == ["pdf"]
+    assert options["passport_file"] is None
+
+
+@pytest.mark.parametrize(
+    "job_line",
+    [
+        "not a json",
+        '["input"]',
+        '{"output": "output"}',
+        '{"input": "course.imscc", "result": "tar"}',
+        '{"input": "course.imscc", "relative_links_source": "example.com"}',
+        '{"input": "course.imscc", "compression_codec": "bz2", "compression_level": 0}',
+    ],
+)
+def test_parse_job_rejects_invalid_jobs(job_line):
+    with pytest.raises(JobError):
+        parse_job(job_line)
+
+
+def test_run_job(imscc_file, link_map_csv, tmp_path):
+    workspace = tmp_path / "output"
+    job_line = json.dumps({"input": str(imscc_file), "output": str(workspace), "link_file": str(link_map_csv)})
+
+    result = run_job(job_line)
+
+    assert result["status"] == "ok"
+    assert result["output"] == str(workspace)
+    assert result["metrics"]["bytes_out"] == (workspace / imscc_file.stem).with_suffix(".tar.gz").stat().st_size
+    with tarfile.open((workspace / imscc_file.stem).with_suffix(".tar.gz"), "r:gz") as tgz:
+        assert "course.xml" in tgz.getnames()
+
+
+def test_run_job_reports_error(tmp_path):
+    result = run_job(json.dumps({"input": str(tmp_path / "missing.imscc"), "output": str(tmp_path / "output")}))
+
+    assert result["status"] == "error"
+    assert result["error"]
+
+
+def test_main_runs_jobs_back_to_back(mocker, capsys, imscc_file, tmp_path):
+    jobs = "\n".join(
+        [
+            json.dumps({"input": str(imscc_file), "output": str(tmp_path / "first")}),
+            "",
+            json.dumps({"input": str(imscc_file), "output": str(tmp_path / "second"), "result": RESULT_TYPE_ZIP}),
+        ]
+    )
+    mocker.patch("cc2olx.worker.sys.stdin", io.StringIO(jobs))
+    mocker.patch("sys.argv", ["cc2olx-worker"])
+
+    assert main() == 0
+
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [result["status"] for result in results] == ["ok", "ok"]
+    assert (tmp_path / "first" / imscc_file.stem).with_suffix(".tar.gz").exists()
+    assert (tmp_path / "second").with_suffix(".zip").exists()